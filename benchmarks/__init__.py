@@ -0,0 +1 @@
+"""Offline benchmarks for the fritzboxvpn library (run against FakeFritzBox)."""
@@ -0,0 +1,266 @@
+"""Listing parser micro-benchmarks over synthetic data.lua and REST payloads.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_parsing --output parsing.json
+
+Each payload is parsed by the reference pipeline (extract, then
+normalize_box_connections) and by the single-pass parsers. Every call gets a
+freshly decoded payload, because parse_data_lua_listing normalizes entries in
+place.
+
+Raw data.lua pages (boxConnections after unrelated page sections) are then
+parsed from bytes, decoding included: whole-body decode versus the chunked
+BoxConnectionsScanner the session uses, with the peak traced memory of each.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from fritzboxvpn.const import API_PAGE_SHAREWIREGUARD, LISTING_READ_CHUNK_SIZE
+from fritzboxvpn.parsing import (
+    decode_json_body,
+    extract_box_connections_from_data,
+    extract_wireguard_connections_from_rest,
+    normalize_box_connections,
+    parse_box_connections,
+    parse_data_lua_listing,
+    parse_rest_listing,
+)
+from fritzboxvpn.streaming import BoxConnectionsScanner
+
+from .report import summary, write_report
+
+DEFAULT_CONNECTIONS = (1, 50, 500, 5000)
+DEFAULT_ROUNDS = 5
+# Parser calls per round; each needs its own decoded payload.
+DEFAULT_NUMBER = 20
+# Unrelated sections in front of boxConnections on a raw data.lua page.
+DEFAULT_PAGE_PADDING = 500
+
+
+def data_lua_payload(count: int) -> dict[str, Any]:
+    """shareWireguard data.lua JSON with ``count`` connections."""
+    box = {
+        f"conn-{index}": {
+            "uid": f"conn-{index}",
+            "name": f"VPN {index}",
+            "active": index % 2,
+            "connected": int(index % 4 == 0),
+            "publicKey": "k" * 44,
+        }
+        for index in range(count)
+    }
+    return {"pid": API_PAGE_SHAREWIREGUARD, "data": {"init": {"boxConnections": box}}}
+
+
+def data_lua_page(count: int, padding: int) -> bytes:
+    """Raw data.lua body: ``padding`` page sections, then ``count`` connections."""
+    payload = data_lua_payload(count)
+    sections = {
+        f"section{index}": {"value": "x" * 64, "items": list(range(8))}
+        for index in range(padding)
+    }
+    payload["data"] = {**sections, **payload["data"]}
+    return json.dumps(payload).encode()
+
+
+def rest_payload(count: int) -> dict[str, Any]:
+    """GET /api/v0/generic/vpn JSON with ``count`` WireGuard connections."""
+    return {
+        "connection": [
+            {
+                "UID": f"conn-{index}",
+                "name": f"VPN {index}",
+                "activated": str(index % 2),
+                "access_type": "4",
+                "state": "ready" if index % 4 == 0 else "notActive",
+                "connected_since": "1710000000" if index % 4 == 0 else "0",
+            }
+            for index in range(count)
+        ]
+    }
+
+
+def _reference_data_lua(data: dict[str, Any]) -> Any:
+    box = extract_box_connections_from_data(data, API_PAGE_SHAREWIREGUARD)
+    return normalize_box_connections(box)
+
+
+def _fast_data_lua(data: dict[str, Any]) -> Any:
+    return parse_data_lua_listing(data, API_PAGE_SHAREWIREGUARD)
+
+
+def _reference_rest(data: dict[str, Any]) -> Any:
+    return normalize_box_connections(extract_wireguard_connections_from_rest(data))
+
+
+# name -> (payload factory, parser)
+PARSERS: dict[
+    str,
+    tuple[Callable[[int], dict[str, Any]], Callable[[dict[str, Any]], Any]],
+] = {
+    "data_lua_reference": (data_lua_payload, _reference_data_lua),
+    "data_lua_single_pass": (data_lua_payload, _fast_data_lua),
+    "rest_reference": (rest_payload, _reference_rest),
+    "rest_single_pass": (rest_payload, parse_rest_listing),
+}
+
+
+def body_chunks(body: bytes) -> list[bytes]:
+    """The body as it arrives: LISTING_READ_CHUNK_SIZE pieces."""
+    return [
+        body[start : start + LISTING_READ_CHUNK_SIZE]
+        for start in range(0, len(body), LISTING_READ_CHUNK_SIZE)
+    ]
+
+
+def _decode_data_lua(chunks: list[bytes]) -> Any:
+    data = decode_json_body(b"".join(chunks))
+    return parse_data_lua_listing(data, API_PAGE_SHAREWIREGUARD)
+
+
+def _stream_data_lua(chunks: list[bytes]) -> Any:
+    scanner = BoxConnectionsScanner(API_PAGE_SHAREWIREGUARD)
+    for chunk in chunks:
+        scanner.feed(chunk)
+    box = scanner.finish()
+    return None if box is None else parse_box_connections(box)
+
+
+# name -> parser of a raw data.lua body received in chunks
+BODY_PARSERS: dict[str, Callable[[list[bytes]], Any]] = {
+    "data_lua_decode_whole": _decode_data_lua,
+    "data_lua_streaming": _stream_data_lua,
+}
+
+
+def time_parser(
+    parser: Callable[[dict[str, Any]], Any], body: str, rounds: int, number: int
+) -> list[float]:
+    """Seconds per call for each round; decoding is done before timing."""
+    per_call = []
+    for _ in range(rounds):
+        payloads = [json.loads(body) for _ in range(number)]
+        started = time.perf_counter()
+        for payload in payloads:
+            parser(payload)
+        per_call.append((time.perf_counter() - started) / number)
+    return per_call
+
+
+def time_body_parser(
+    parser: Callable[[list[bytes]], Any], body: bytes, rounds: int, number: int
+) -> list[float]:
+    """Seconds per call for each round, decoding included."""
+    chunks = body_chunks(body)
+    per_call = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(number):
+            parser(chunks)
+        per_call.append((time.perf_counter() - started) / number)
+    return per_call
+
+
+def peak_memory(parser: Callable[[list[bytes]], Any], body: bytes) -> int:
+    """Peak bytes traced by tracemalloc during one call.
+
+    The received chunks are not counted; a joined copy of the body is.
+    """
+    chunks = body_chunks(body)
+    tracemalloc.start()
+    try:
+        parser(chunks)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmarks(
+    connection_counts: list[int],
+    rounds: int,
+    number: int,
+    page_padding: int = DEFAULT_PAGE_PADDING,
+) -> list[dict[str, Any]]:
+    """Time every parser at every connection count."""
+    results = []
+    for count in connection_counts:
+        for name, (factory, parser) in PARSERS.items():
+            body = json.dumps(factory(count))
+            timings = time_parser(parser, body, rounds, number)
+            result = {
+                "name": name,
+                "connections": count,
+                "payload_bytes": len(body),
+                "seconds_per_call": summary(timings),
+            }
+            results.append(result)
+            print(
+                f"{name:22} n={count:<5}"
+                f" {result['seconds_per_call']['min'] * 1e6:10.1f} us/call",
+                file=sys.stderr,
+            )
+        body = data_lua_page(count, page_padding)
+        for name, parser in BODY_PARSERS.items():
+            timings = time_body_parser(parser, body, rounds, number)
+            result = {
+                "name": name,
+                "connections": count,
+                "payload_bytes": len(body),
+                "page_padding": page_padding,
+                "seconds_per_call": summary(timings),
+                "peak_bytes": peak_memory(parser, body),
+            }
+            results.append(result)
+            print(
+                f"{name:22} n={count:<5}"
+                f" {result['seconds_per_call']['min'] * 1e6:10.1f} us/call"
+                f" peak={result['peak_bytes'] / 1024:9.1f} KiB",
+                file=sys.stderr,
+            )
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--connections",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_CONNECTIONS),
+        help="synthetic WireGuard connection counts",
+    )
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    parser.add_argument("--number", type=int, default=DEFAULT_NUMBER)
+    parser.add_argument(
+        "--page-padding",
+        type=int,
+        default=DEFAULT_PAGE_PADDING,
+        help="unrelated sections in front of boxConnections on raw data.lua pages",
+    )
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        args.connections, args.rounds, args.number, args.page_padding
+    )
+    write_report(
+        results,
+        args.output,
+        rounds=args.rounds,
+        number=args.number,
+        page_padding=args.page_padding,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
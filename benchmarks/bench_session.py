@@ -0,0 +1,236 @@
+"""Login, listing and toggle round-trips of FritzBoxVPNSession against FakeFritzBox.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_session --output bench.json
+    python -m benchmarks.bench_session --baseline bench.json
+
+Wall time is measured with perf_counter, CPU time with process_time. The
+emulator runs in the same process, so CPU time includes its side of each
+exchange; that share is constant, so regressions still show.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import Any
+
+from fritzboxvpn import FritzBoxVPNSession
+from fritzboxvpn.testing import LOGIN_MD5, LOGIN_PBKDF2, FakeFritzBox
+
+from .report import load_results, summary, write_report
+
+DEFAULT_CONNECTIONS = (1, 50, 500)
+DEFAULT_ITERATIONS = 5
+# A baseline median slower by more than this fraction counts as a regression.
+DEFAULT_TOLERANCE = 0.5
+# Medians below this many seconds are too noisy to compare.
+COMPARE_MIN_WALL = 0.002
+
+# (wall seconds, CPU seconds, HTTP requests served)
+Sample = tuple[float, float, int]
+Scenario = Callable[[FakeFritzBox, int], Awaitable[list[Sample]]]
+
+
+def _session(box: FakeFritzBox) -> FritzBoxVPNSession:
+    """Fresh session with its own HTTP client (plain HTTP, no protocol race)."""
+    return FritzBoxVPNSession.create(
+        box.host, box.username, box.password, protocol="http"
+    )
+
+
+async def _sample(box: FakeFritzBox, operation: Callable[[], Awaitable[Any]]) -> Sample:
+    box.reset_requests()
+    cpu = time.process_time()
+    wall = time.perf_counter()
+    await operation()
+    return time.perf_counter() - wall, time.process_time() - cpu, box.total_requests
+
+
+async def bench_login(box: FakeFritzBox, iterations: int) -> list[Sample]:
+    """Full login with a new session (no cached PBKDF2 stage, new TCP connection)."""
+    samples = []
+    for _ in range(iterations):
+        fb = _session(box)
+        samples.append(await _sample(box, fb.async_get_session))
+        await fb.async_close()
+    return samples
+
+
+async def bench_relogin(box: FakeFritzBox, iterations: int) -> list[Sample]:
+    """Login after invalidate_session() on a session that logged in before."""
+    fb = _session(box)
+    await fb.async_get_session()
+    samples = []
+    for _ in range(iterations):
+        fb.invalidate_session()
+        samples.append(await _sample(box, fb.async_get_session))
+    await fb.async_close()
+    return samples
+
+
+async def bench_listing_cold(box: FakeFritzBox, iterations: int) -> list[Sample]:
+    """First async_get_vpn_connections of a new session (login and probe included)."""
+    samples = []
+    for _ in range(iterations):
+        fb = _session(box)
+        samples.append(await _sample(box, fb.async_get_vpn_connections))
+        await fb.async_close()
+    return samples
+
+
+async def bench_listing_warm(box: FakeFritzBox, iterations: int) -> list[Sample]:
+    """Regular poll: SID and listing mode already known."""
+    fb = _session(box)
+    await fb.async_get_vpn_connections()
+    samples = [
+        await _sample(box, fb.async_get_vpn_connections) for _ in range(iterations)
+    ]
+    await fb.async_close()
+    return samples
+
+
+async def bench_toggle(box: FakeFritzBox, iterations: int) -> list[Sample]:
+    """async_toggle_vpn end to end, including its verification polls."""
+    fb = _session(box)
+    connections = await fb.async_get_vpn_connections()
+    uid = next(iter(connections))
+    enable = not connections[uid]["active"]
+
+    async def _toggle(target: bool) -> None:
+        if not await fb.async_toggle_vpn(uid, target):
+            raise RuntimeError(f"Toggle of {uid} failed")
+
+    samples = []
+    for _ in range(iterations):
+        samples.append(await _sample(box, partial(_toggle, enable)))
+        enable = not enable
+    await fb.async_close()
+    return samples
+
+
+# name -> (FakeFritzBox options, scenario)
+SCENARIOS: dict[str, tuple[dict[str, Any], Scenario]] = {
+    "login_md5": ({"login": LOGIN_MD5}, bench_login),
+    "login_pbkdf2": ({"login": LOGIN_PBKDF2}, bench_login),
+    "relogin_pbkdf2": ({"login": LOGIN_PBKDF2}, bench_relogin),
+    "listing_cold_data_lua": ({"rest": False}, bench_listing_cold),
+    "listing_warm_data_lua": ({"rest": False}, bench_listing_warm),
+    "listing_cold_rest": ({"data_lua": False}, bench_listing_cold),
+    "listing_warm_rest": ({"data_lua": False}, bench_listing_warm),
+    "toggle": ({}, bench_toggle),
+}
+
+
+async def run_benchmarks(
+    connection_counts: list[int],
+    iterations: int,
+    latency: float,
+    names: list[str],
+) -> list[dict[str, Any]]:
+    """Run every selected scenario at every connection count."""
+    results = []
+    for count in connection_counts:
+        for name in names:
+            options, scenario = SCENARIOS[name]
+            async with FakeFritzBox(count, latency=latency, **options) as box:
+                samples = await scenario(box, iterations)
+            walls, cpus, requests = zip(*samples, strict=True)
+            result = {
+                "name": name,
+                "connections": count,
+                "iterations": iterations,
+                "wall_s": summary(list(walls)),
+                "cpu_s": summary(list(cpus)),
+                "requests": statistics.median(requests),
+            }
+            results.append(result)
+            print(
+                f"{name:24} n={count:<4}"
+                f" wall={result['wall_s']['median'] * 1000:8.2f} ms"
+                f" cpu={result['cpu_s']['median'] * 1000:8.2f} ms"
+                f" requests={result['requests']:g}",
+                file=sys.stderr,
+            )
+    return results
+
+
+def compare(
+    baseline: list[dict[str, Any]],
+    results: list[dict[str, Any]],
+    tolerance: float,
+) -> list[str]:
+    """Regressions versus a baseline: more requests or a slower median wall time."""
+    previous = {(r["name"], r["connections"]): r for r in baseline}
+    regressions = []
+    for result in results:
+        base = previous.get((result["name"], result["connections"]))
+        if base is None:
+            continue
+        label = f"{result['name']} n={result['connections']}"
+        if result["requests"] > base["requests"]:
+            regressions.append(
+                f"{label}: {result['requests']:g} requests (was {base['requests']:g})"
+            )
+        wall, base_wall = result["wall_s"]["median"], base["wall_s"]["median"]
+        if base_wall >= COMPARE_MIN_WALL and wall > base_wall * (1 + tolerance):
+            regressions.append(
+                f"{label}: {wall * 1000:.2f} ms (was {base_wall * 1000:.2f} ms)"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--connections",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_CONNECTIONS),
+        help="simulated WireGuard connection counts",
+    )
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="emulated seconds per request"
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="run only these scenarios (repeatable)",
+    )
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="fail on regressions versus this JSON file")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.ERROR)
+    results = asyncio.run(
+        run_benchmarks(
+            args.connections,
+            args.iterations,
+            args.latency,
+            args.scenario or list(SCENARIOS),
+        )
+    )
+    write_report(results, args.output, latency_s=args.latency)
+
+    if args.baseline:
+        baseline = load_results(args.baseline)
+        regressions = compare(baseline, results, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
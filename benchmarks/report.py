@@ -0,0 +1,54 @@
+"""JSON reports shared by the benchmark scripts."""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import sys
+from datetime import UTC, datetime
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any
+
+
+def summary(values: list[float]) -> dict[str, float]:
+    """Median, min and max of repeated measurements."""
+    return {
+        "median": statistics.median(values),
+        "min": min(values),
+        "max": max(values),
+    }
+
+
+def metadata(**extra: Any) -> dict[str, Any]:
+    """Environment of a run, plus benchmark-specific settings."""
+    try:
+        library_version = version("fritzboxvpn")
+    except PackageNotFoundError:
+        library_version = None
+    return {
+        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "fritzboxvpn": library_version,
+        **extra,
+    }
+
+
+def write_report(
+    results: list[dict[str, Any]], output: str | None, **extra: Any
+) -> None:
+    """Write ``{"meta": ..., "results": ...}`` to output, or to stdout."""
+    report = {"meta": metadata(**extra), "results": results}
+    if output:
+        with open(output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        return
+    json.dump(report, sys.stdout, indent=2)
+    print()
+
+
+def load_results(path: str) -> list[dict[str, Any]]:
+    """Results of a report written by write_report()."""
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)["results"]
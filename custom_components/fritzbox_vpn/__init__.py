@@ -1,18 +1,26 @@
 """The FritzBox VPN integration."""
 
 import logging
+from collections import defaultdict
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.exceptions import (
+    ConfigEntryAuthFailed,
+    ConfigEntryNotReady,
+    HomeAssistantError,
+    ServiceValidationError,
+)
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
+    ATTR_TURN_OFF,
+    ATTR_TURN_ON,
     CONF_CONFIG_ENTRY_ID,
     DOMAIN,
     ERROR_INDICATOR_AUTH,
@@ -21,10 +29,15 @@ from .const import (
     NAME_FRITZBOX,
     SERVICE_REMOVE_UNAVAILABLE_ENTITIES,
     SERVICE_REPAIR_ENTITY_ID_SUFFIXES,
+    SERVICE_SET_CONNECTIONS,
+    UNIQUE_ID_SUFFIX_SWITCH,
     host_from_config,
 )
-from .coordinator import FritzBoxVPNCoordinator
+from .coordinator import FritzBoxVPNCoordinator, identity_store, session_store
 from .entity_registry import (
+    async_drop_entity_registry_index,
+    async_remove_entity_objects,
+    connection_uid_from_entity_unique_id,
     get_orphaned_entity_entries,
     remove_orphaned_entities,
     remove_unexpected_entity_entries,
@@ -32,8 +45,10 @@ from .entity_registry import (
     repair_entity_ids,
     repair_legacy_entity_object_ids,
     repair_orphan_base_suffix_merges,
+    unique_id_suffix_from_entity_unique_id,
 )
-from .models import FritzboxVpnConfigEntry, FritzboxVpnRuntimeData
+from .models import FritzboxVpnConfigEntry, FritzboxVpnRuntimeData, runtime_from_hass
+from .shared_session import async_release_shared_session
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,12 +60,21 @@ PLATFORMS: list[Platform] = [
 SERVICE_REGISTRATION_FLAG = "_service_remove_unavailable_registered"
 
 SERVICE_SCHEMA_OPTIONAL_ENTRY_ID = vol.Schema({vol.Optional(CONF_CONFIG_ENTRY_ID): str})
+SERVICE_SCHEMA_SET_CONNECTIONS = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_TURN_ON): cv.entity_ids,
+            vol.Optional(ATTR_TURN_OFF): cv.entity_ids,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_TURN_ON, ATTR_TURN_OFF),
+)
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
 def _domain_store(hass: HomeAssistant) -> dict:
-    """Integration domain store in hass.data (service registration only)."""
+    """Integration domain store in hass.data (service flag, shared sessions)."""
     return hass.data.setdefault(DOMAIN, {})
 
 
@@ -79,23 +103,30 @@ async def _async_remove_unavailable_entities(
             continue
         if not to_remove:
             continue
+        removed_in_place = await async_remove_entity_objects(
+            hass, entry_id, [entry.entity_id for entry in to_remove]
+        )
         remove_orphaned_entities(hass, entry_id, to_remove)
-        await hass.config_entries.async_reload(entry_id)
+        if not removed_in_place:
+            await hass.config_entries.async_reload(entry_id)
         _LOGGER.info(
-            "Remove unavailable entities: removed %d entities and reloaded entry %s",
+            "Remove unavailable entities: removed %d entities from entry %s (%s)",
             len(to_remove),
             entry_id,
+            "in place" if removed_in_place else "reloaded",
         )
 
 
 async def _async_repair_entity_id_suffixes(
     hass: HomeAssistant, call: ServiceCall
 ) -> None:
-    """Repair legacy and suffixed entity IDs, then reload when anything changed."""
+    """Repair legacy and suffixed entity IDs; reload only entries that are not loaded."""
     for entry_id in _entry_ids_for_cleanup_service(hass, call):
         count, _ = repair_entity_ids(hass, entry_id)
         if count:
-            await hass.config_entries.async_reload(entry_id)
+            # Loaded entities follow registry renames and removals themselves.
+            if runtime_from_hass(hass, entry_id) is None:
+                await hass.config_entries.async_reload(entry_id)
             _LOGGER.info(
                 "Repair entity IDs: repaired %d entities for entry %s",
                 count,
@@ -103,6 +134,78 @@ async def _async_repair_entity_id_suffixes(
             )
 
 
+def _vpn_states_by_entry(
+    hass: HomeAssistant, call: ServiceCall
+) -> dict[str, dict[str, tuple[str, bool]]]:
+    """Group requested switch states per config entry: uid -> (entity_id, on)."""
+    turn_on = call.data.get(ATTR_TURN_ON, [])
+    turn_off = call.data.get(ATTR_TURN_OFF, [])
+    if not turn_on and not turn_off:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="set_connections_no_entities",
+        )
+    for entity_id in turn_on:
+        if entity_id in turn_off:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="set_connections_conflicting_entity",
+                translation_placeholders={"entity_id": entity_id},
+            )
+    registry = er.async_get(hass)
+    requested = [(entity_id, True) for entity_id in turn_on]
+    requested += [(entity_id, False) for entity_id in turn_off]
+    by_entry: dict[str, dict[str, tuple[str, bool]]] = defaultdict(dict)
+    for entity_id, enable in requested:
+        entry = registry.async_get(entity_id)
+        uid = None
+        if (
+            entry is not None
+            and entry.platform == DOMAIN
+            and entry.config_entry_id is not None
+            and unique_id_suffix_from_entity_unique_id(entry.unique_id)
+            == UNIQUE_ID_SUFFIX_SWITCH
+        ):
+            uid = connection_uid_from_entity_unique_id(entry.unique_id)
+        if entry is None or uid is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="set_connections_invalid_entity",
+                translation_placeholders={"entity_id": entity_id},
+            )
+        by_entry[entry.config_entry_id][uid] = (entity_id, enable)
+    return by_entry
+
+
+async def _async_set_connections(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Switch several VPN connections with one batch per Fritz!Box."""
+    failed: list[str] = []
+    for entry_id, states in _vpn_states_by_entry(hass, call).items():
+        runtime = runtime_from_hass(hass, entry_id)
+        if runtime is None:
+            failed.extend(entity_id for entity_id, _ in states.values())
+            continue
+        coordinator = runtime.coordinator
+        try:
+            results = await coordinator.set_vpn_states(
+                {uid: enable for uid, (_, enable) in states.items()}
+            )
+        except Exception as err:
+            _LOGGER.error("Set VPN connections failed for entry %s: %s", entry_id, err)
+            results = {}
+        failed.extend(
+            entity_id
+            for uid, (entity_id, _) in states.items()
+            if not results.get(uid, False)
+        )
+    if failed:
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="set_connections_failed",
+            translation_placeholders={"entities": ", ".join(sorted(failed))},
+        )
+
+
 def _register_services_if_needed(hass: HomeAssistant) -> None:
     """Register integration services once per HA instance."""
     store = _domain_store(hass)
@@ -116,6 +219,9 @@ def _register_services_if_needed(hass: HomeAssistant) -> None:
     async def _handle_repair_suffixes(call: ServiceCall) -> None:
         await _async_repair_entity_id_suffixes(hass, call)
 
+    async def _handle_set_connections(call: ServiceCall) -> None:
+        await _async_set_connections(hass, call)
+
     hass.services.async_register(
         DOMAIN,
         SERVICE_REMOVE_UNAVAILABLE_ENTITIES,
@@ -128,6 +234,12 @@ def _register_services_if_needed(hass: HomeAssistant) -> None:
         _handle_repair_suffixes,
         schema=SERVICE_SCHEMA_OPTIONAL_ENTRY_ID,
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_CONNECTIONS,
+        _handle_set_connections,
+        schema=SERVICE_SCHEMA_SET_CONNECTIONS,
+    )
 
 
 def _cleanup_empty_connection_devices(hass: HomeAssistant, entry_id: str) -> int:
@@ -215,6 +327,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: FritzboxVpnConfigEntry)
             len(coordinator.data) if coordinator.data else 0,
         )
     except Exception as err:
+        await async_release_shared_session(
+            hass, coordinator.fritz_session, entry.entry_id
+        )
         err_lower = str(err).lower()
         if any(ind in err_lower for ind in ERROR_INDICATOR_AUTH):
             _LOGGER.error(
@@ -270,6 +385,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: FritzboxVpnConfigEntry)
         _LOGGER.info("Successfully set up all platforms")
     except Exception as err:
         _LOGGER.error("Failed to set up platforms: %s", err, exc_info=True)
+        await async_release_shared_session(
+            hass, coordinator.fritz_session, entry.entry_id
+        )
         return False
 
     removed_empty_devices = _cleanup_empty_connection_devices(hass, entry.entry_id)
@@ -290,8 +408,11 @@ async def async_unload_entry(
 
     if unload_ok:
         if entry.runtime_data is not None:
-            await entry.runtime_data.coordinator.fritz_session.async_close()
+            await async_release_shared_session(
+                hass, entry.runtime_data.coordinator.fritz_session, entry.entry_id
+            )
         entry.runtime_data = None
+        async_drop_entity_registry_index(hass, entry.entry_id)
 
         other_loaded = [
             e
@@ -303,10 +424,20 @@ async def async_unload_entry(
         ):
             hass.services.async_remove(DOMAIN, SERVICE_REMOVE_UNAVAILABLE_ENTITIES)
             hass.services.async_remove(DOMAIN, SERVICE_REPAIR_ENTITY_ID_SUFFIXES)
+            hass.services.async_remove(DOMAIN, SERVICE_SET_CONNECTIONS)
 
     return unload_ok
 
 
+async def async_remove_entry(
+    hass: HomeAssistant, entry: FritzboxVpnConfigEntry
+) -> None:
+    """Delete persisted session and identity state when the entry is removed."""
+    await session_store(hass, entry.entry_id).async_remove()
+    await identity_store(hass, entry.entry_id).async_remove()
+    async_drop_entity_registry_index(hass, entry.entry_id)
+
+
 async def async_reload_entry(
     hass: HomeAssistant, entry: FritzboxVpnConfigEntry
 ) -> None:
@@ -30,6 +30,7 @@ from .const import (
     password_from_sources,
 )
 from .entity_registry import (
+    async_remove_entity_objects,
     count_repairable_entity_issues,
     get_entity_id_suffix_repairs,
     get_legacy_entity_object_id_repairs,
@@ -40,6 +41,7 @@ from .entity_registry import (
 )
 from .flow_forms import CannotConnect, InvalidAuth
 from .fritz_config_source import get_existing_fritz_config
+from .models import runtime_from_hass
 from .ssdp_unique_id import (
     host_from_ssdp,
     is_fritzbox_router_discovery,
@@ -422,8 +424,13 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             )
 
         async def on_cleanup(confirmed_entry_id: str) -> None:
-            remove_orphaned_entities(self.hass, confirmed_entry_id, to_remove or [])
-            await self.hass.config_entries.async_reload(confirmed_entry_id)
+            entries = to_remove or []
+            removed_in_place = await async_remove_entity_objects(
+                self.hass, confirmed_entry_id, [entry.entity_id for entry in entries]
+            )
+            remove_orphaned_entities(self.hass, confirmed_entry_id, entries)
+            if not removed_in_place:
+                await self.hass.config_entries.async_reload(confirmed_entry_id)
 
         return await self._confirm_options_action(
             step_id="cleanup_confirm",
@@ -449,7 +456,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
         async def on_repair(confirmed_entry_id: str) -> None:
             count, _ = repair_entity_ids(self.hass, confirmed_entry_id)
-            if count:
+            if count and runtime_from_hass(self.hass, confirmed_entry_id) is None:
                 await self.hass.config_entries.async_reload(confirmed_entry_id)
 
         return await self._confirm_options_action(
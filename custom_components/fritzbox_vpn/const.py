@@ -11,12 +11,47 @@ NAME_FRITZBOX = fritzboxvpn_const.NAME_FRITZBOX
 
 DOMAIN = "fritzbox_vpn"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_PERSIST_SESSION = "persist_session"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_MAX_UPDATE_INTERVAL = "max_update_interval"
 
 DEFAULT_HOST = "192.168.178.1"
 HOST_FALLBACK_UNKNOWN = "unknown"
 DEFAULT_UPDATE_INTERVAL = 30
 UPDATE_INTERVAL_MIN = 5
 UPDATE_INTERVAL_MAX = 3600
+DEFAULT_PERSIST_SESSION = False
+# Adaptive polling: the update interval is the normal rate; unchanged polls
+# back off (doubling every ADAPTIVE_BACKOFF_POLLS) up to the max interval.
+DEFAULT_ADAPTIVE_POLLING = False
+DEFAULT_MAX_UPDATE_INTERVAL = 300
+ADAPTIVE_BACKOFF_POLLS = 5
+# Fast rate after a toggle or an observed change, and for how long (seconds).
+ADAPTIVE_FAST_INTERVAL = UPDATE_INTERVAL_MIN
+ADAPTIVE_FAST_WINDOW = 60
+# Enabled-but-not-connected keeps the fast rate only this long after the last
+# change, so a peer that stays offline does not pin 5 s polling forever.
+ADAPTIVE_CONNECT_WINDOW = 180
+# Persisted web-API session state (SID, protocol, listing mode) per entry.
+SESSION_STORE_VERSION = 1
+SESSION_STORE_SAVE_DELAY = 10
+# Persisted connection identity (seen UIDs, names, remaps, recovery) per entry.
+# hass.data[DOMAIN] key: sessions shared by entries targeting the same box.
+SHARED_SESSIONS_KEY = "shared_sessions"
+# hass.data[DOMAIN] key: per-entry entity registry indexes (entity_registry.py).
+REGISTRY_INDEXES_KEY = "registry_indexes"
+UNIQUE_ID_PARSE_CACHE_SIZE = 4096
+IDENTITY_STORE_VERSION = 1
+IDENTITY_STORE_SAVE_DELAY = 30
+IDENTITY_KEY_SEEN_UIDS = "seen_uids"
+IDENTITY_KEY_UID_NAMES = "uid_names"
+IDENTITY_KEY_UID_REMAP = "uid_remap"
+IDENTITY_KEY_MISSING_COUNTS = "missing_uid_counts"
+IDENTITY_KEY_CONFIRMED_ORPHANS = "confirmed_orphan_uids"
+IDENTITY_KEY_RECOVERING_UNTIL = "recovering_until"
+IDENTITY_KEY_RECOVERY_STARTED_AT = "recovery_started_at"
+IDENTITY_KEY_BOX_BOOT_TIME = "box_boot_time"
+IDENTITY_KEY_BOX_REBOOTED = "box_rebooted"
 # Short enough for Fritz!Box reboot recovery; long enough to avoid hammering
 # during temporary outages / login BlockTime (see issue #42).
 RETRY_AFTER_SECONDS = 60
@@ -30,6 +65,18 @@ RECOVERY_MIN_INTERVAL_FACTOR = 3
 # Cap recovery so a permanently empty VPN list cannot block forever
 # (max = factor × minimum recovery window).
 RECOVERY_MAX_WINDOW_FACTOR = 2
+# Box uptime (TR-064 DeviceInfo) tells a reboot from a network blip. Read it
+# on every poll while recovering, otherwise at most this often.
+UPTIME_CHECK_INTERVAL = 300
+# Upper bound for one uptime read, and the pause after a failed one (TR-064
+# disabled, missing rights, no fritzconnection) before the next attempt.
+UPTIME_TIMEOUT = 5
+UPTIME_FAILURE_BACKOFF = 900
+# Boot time is derived as now - uptime; allow clock and request jitter.
+BOOT_TIME_TOLERANCE = 30
+TR064_SERVICE_DEVICE_INFO = "DeviceInfo1"
+TR064_ACTION_GET_INFO = "GetInfo"
+TR064_ARG_UP_TIME = "NewUpTime"
 
 ATTR_UID = "uid"
 ATTR_VPN_UID = "vpn_uid"
@@ -53,6 +100,9 @@ OPTIONS_ACTION_CLEANUP = "cleanup"
 OPTIONS_ACTION_REPAIR_ENTITY_IDS = "repair_entity_ids"
 SERVICE_REMOVE_UNAVAILABLE_ENTITIES = "remove_unavailable_entities"
 SERVICE_REPAIR_ENTITY_ID_SUFFIXES = "repair_entity_id_suffixes"
+SERVICE_SET_CONNECTIONS = "set_connections"
+ATTR_TURN_ON = "turn_on"
+ATTR_TURN_OFF = "turn_off"
 CONF_CONFIG_ENTRY_ID = "config_entry_id"
 
 LOG_MSG_VPN_CONNECTIONS_REMOVED = (
@@ -70,6 +120,11 @@ LOG_MSG_RECOVERY_ARMED = (
 LOG_MSG_RECOVERY_CLEARED = (
     "Recovery window cleared for %s after %d stable non-empty poll(s)."
 )
+LOG_MSG_BOX_REBOOTED = (
+    "%s rebooted (uptime %ss); remapping UIDs now, orphan tracking resumes "
+    "after stable non-empty polls (seen_uids=%d)."
+)
+LOG_MSG_RECOVERY_NO_REBOOT = "%s answered without rebooting; recovery window skipped."
 LOG_MSG_EMPTY_DURING_RECOVERY = (
     "Empty VPN list from %s while recovering after outage "
     "(seen_uids=%d); treating as outage, not connection removal."
@@ -86,6 +141,10 @@ LOG_MSG_UID_REMAP_REFUSED = (
     "VPN UID set changed after outage on %s but name bijection remap was refused "
     "(%s). added=%s removed=%s"
 )
+LOG_MSG_SHARED_SESSION = (
+    "Sharing the %s session with entry %s (already used by %s); "
+    "one poll feeds all entries."
+)
 LOG_MSG_SESSION_MODE_FALLBACK = (
     "Fritzconnection WireGuard support unavailable; using fritzboxvpn web-API "
     "for host %s (expected fallback, not an error)."
@@ -94,6 +153,9 @@ LOG_MSG_ORPHAN_BASE_MERGE = (
     "Merged orphan base entity_id with live suffixed entity: %s → %s "
     "(removed orphan unique_id=%s)"
 )
+LOG_MSG_IN_PLACE_REMOVAL_FAILED = (
+    "Could not remove entity %s in place (%s); reloading entry %s instead."
+)
 
 MANUFACTURER_AVM = "AVM"
 MODEL_FRITZBOX = "Fritz!Box"
@@ -115,6 +177,16 @@ def auth_error_notification_id(host: str) -> str:
     return f"{DOMAIN}_auth_error_{host or HOST_FALLBACK_UNKNOWN}"
 
 
+def session_store_key(entry_id: str) -> str:
+    """Storage key for an entry's persisted web-API session state."""
+    return f"{DOMAIN}.session.{entry_id}"
+
+
+def identity_store_key(entry_id: str) -> str:
+    """Storage key for an entry's persisted connection identity state."""
+    return f"{DOMAIN}.identity.{entry_id}"
+
+
 def host_from_config(config: Mapping[str, Any]) -> str:
     """Host from config/entry data; HOST_FALLBACK_UNKNOWN if missing."""
     return config.get(CONF_HOST, HOST_FALLBACK_UNKNOWN)
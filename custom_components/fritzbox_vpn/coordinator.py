@@ -5,7 +5,7 @@ from __future__ import annotations
 import inspect
 import logging
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from datetime import timedelta
 from typing import Any
 
@@ -13,21 +13,50 @@ from fritzboxvpn import (
     API_KEY_ACTIVE,
     API_KEY_CONNECTED,
     API_KEY_NAME,
+    BreakerState,
+    CircuitBreaker,
+    is_connection_refused,
+    is_transport_error,
 )
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
+    ADAPTIVE_BACKOFF_POLLS,
+    ADAPTIVE_CONNECT_WINDOW,
+    ADAPTIVE_FAST_INTERVAL,
+    ADAPTIVE_FAST_WINDOW,
     AUTH_INDICATORS,
+    BOOT_TIME_TOLERANCE,
+    CONF_ADAPTIVE_POLLING,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_PERSIST_SESSION,
     CONF_UPDATE_INTERVAL,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_PERSIST_SESSION,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
+    IDENTITY_KEY_BOX_BOOT_TIME,
+    IDENTITY_KEY_BOX_REBOOTED,
+    IDENTITY_KEY_CONFIRMED_ORPHANS,
+    IDENTITY_KEY_MISSING_COUNTS,
+    IDENTITY_KEY_RECOVERING_UNTIL,
+    IDENTITY_KEY_RECOVERY_STARTED_AT,
+    IDENTITY_KEY_SEEN_UIDS,
+    IDENTITY_KEY_UID_NAMES,
+    IDENTITY_KEY_UID_REMAP,
+    IDENTITY_STORE_SAVE_DELAY,
+    IDENTITY_STORE_VERSION,
+    LOG_MSG_BOX_REBOOTED,
     LOG_MSG_EMPTY_DURING_RECOVERY,
     LOG_MSG_RECOVERY_ARMED,
     LOG_MSG_RECOVERY_CLEARED,
     LOG_MSG_RECOVERY_EMPTY_ACCEPTED,
+    LOG_MSG_RECOVERY_NO_REBOOT,
     LOG_MSG_UID_DELTA,
     LOG_MSG_UID_REMAP,
     LOG_MSG_UID_REMAP_REFUSED,
@@ -39,16 +68,22 @@ from .const import (
     RECOVERY_MIN_INTERVAL_FACTOR,
     RECOVERY_STABLE_POLLS,
     RETRY_AFTER_SECONDS,
+    SESSION_STORE_SAVE_DELAY,
+    SESSION_STORE_VERSION,
     STATUS_CONNECTED,
     STATUS_DISABLED,
     STATUS_ENABLED,
     STATUS_UNKNOWN,
     UPDATE_INTERVAL_MAX,
     UPDATE_INTERVAL_MIN,
+    UPTIME_CHECK_INTERVAL,
     host_from_config,
+    identity_store_key,
+    session_store_key,
 )
 from .entity_registry import remap_connection_uids
 from .fritzconnection_session import FritzConnectionVPNSession
+from .shared_session import acquire_shared_session, shared_session_users
 from .uid_identity import name_bijection_uid_remap
 
 _LOGGER = logging.getLogger(__name__)
@@ -84,6 +119,20 @@ def normalize_update_interval(value: Any) -> int:
         return DEFAULT_UPDATE_INTERVAL
 
 
+def normalize_max_update_interval(value: Any, update_interval: int) -> int:
+    """Adaptive polling ceiling as int between the update interval and the max."""
+    try:
+        ceiling = int(value) if value is not None else DEFAULT_MAX_UPDATE_INTERVAL
+    except (ValueError, TypeError):
+        _LOGGER.warning(
+            "Invalid max_update_interval value %r, using default %s",
+            value,
+            DEFAULT_MAX_UPDATE_INTERVAL,
+        )
+        ceiling = DEFAULT_MAX_UPDATE_INTERVAL
+    return max(update_interval, min(ceiling, UPDATE_INTERVAL_MAX))
+
+
 def _resolve_update_interval_seconds(
     config: dict[str, Any],
     options: dict[str, Any] | None,
@@ -98,6 +147,30 @@ def _resolve_update_interval_seconds(
     return normalize_update_interval(value)
 
 
+def session_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Private store for an entry's web-API session state (holds the SID)."""
+    return Store(hass, SESSION_STORE_VERSION, session_store_key(entry_id), private=True)
+
+
+def identity_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Store for an entry's connection identity (UIDs, names, remaps, recovery)."""
+    return Store(hass, IDENTITY_STORE_VERSION, identity_store_key(entry_id))
+
+
+def _monotonic_to_wall(value: float | None) -> int | None:
+    """Monotonic timestamp as wall-clock seconds, so it survives a restart."""
+    if value is None:
+        return None
+    return round(time.time() + value - time.monotonic())
+
+
+def _wall_to_monotonic(value: Any) -> float | None:
+    """Inverse of _monotonic_to_wall for restored values; None if invalid."""
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        return None
+    return time.monotonic() + value - time.time()
+
+
 def recovery_window_seconds(update_interval_seconds: int) -> int:
     """Minimum recovery window after connectivity outage."""
     return max(
@@ -124,19 +197,29 @@ class FritzBoxVPNCoordinator(DataUpdateCoordinator):
     ):
         update_interval_seconds = _resolve_update_interval_seconds(config, options)
         self._update_interval_seconds = update_interval_seconds
+        # DataUpdateCoordinator rewrites _update_interval_seconds whenever
+        # update_interval changes; adaptive polling needs the configured rate.
+        self._configured_update_interval = update_interval_seconds
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=update_interval_seconds),
+            # Unchanged polls return the previous data object; skip listeners.
+            always_update=False,
         )
-        self.fritz_session = FritzConnectionVPNSession(
-            hass,
-            host_from_config(config),
-            config[CONF_USERNAME],
-            config[CONF_PASSWORD],
-            use_tls=True,
+        # Entries for the same box and credentials share one session and poll.
+        self.fritz_session = (
+            acquire_shared_session(hass, config, entry_id)
+            if entry_id
+            else FritzConnectionVPNSession(
+                hass,
+                host_from_config(config),
+                config[CONF_USERNAME],
+                config[CONF_PASSWORD],
+                use_tls=True,
+            )
         )
         self.config = config
         self.entry_id = entry_id
@@ -150,6 +233,175 @@ class FritzBoxVPNCoordinator(DataUpdateCoordinator):
         self._recovering_until: float | None = None
         self._recovery_started_at: float | None = None
         self._recovery_stable_polls: int = 0
+        # Wall-clock boot time derived from the box uptime (reboot detection).
+        self._box_boot_time: float | None = None
+        self._uptime_checked_at: float | None = None
+        self._box_rebooted = False
+        self.persist_session = bool(
+            (options or {}).get(CONF_PERSIST_SESSION, DEFAULT_PERSIST_SESSION)
+        )
+        self._session_store: Store[dict[str, Any]] | None = (
+            session_store(hass, entry_id) if self.persist_session and entry_id else None
+        )
+        self._session_state_saved: dict[str, Any] | None = None
+        self._identity_store: Store[dict[str, Any]] | None = (
+            identity_store(hass, entry_id) if entry_id else None
+        )
+        self._identity_saved: dict[str, Any] | None = None
+        self.adaptive_polling = bool(
+            (options or {}).get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING)
+        )
+        self._max_update_interval_seconds = normalize_max_update_interval(
+            (options or {}).get(CONF_MAX_UPDATE_INTERVAL), update_interval_seconds
+        )
+        self._unchanged_polls = 0
+        # Spaces out (and jitters) retries while the box is unreachable.
+        self.breaker = CircuitBreaker(base_delay=RETRY_AFTER_SECONDS)
+        self._fast_poll_until: float | None = None
+        self._last_change_at: float | None = None
+        # Data/success last handed to listeners; basis for per-UID dispatch.
+        self._dispatched_data: dict[str, Any] | None = None
+        self._dispatched_success: bool | None = None
+
+    async def _async_setup(self) -> None:
+        """Restore persisted identity and session state before the first refresh."""
+        if not self.entry_id:
+            return
+        if self._identity_store is not None:
+            identity = await self._identity_store.async_load()
+            if isinstance(identity, dict):
+                self.restore_identity_state(identity)
+                self._identity_saved = self.export_identity_state()
+        if self._session_store is None:
+            # Opt-in only: drop state left behind when the option was turned off.
+            await session_store(self.hass, self.entry_id).async_remove()
+            return
+        state = await self._session_store.async_load()
+        if isinstance(state, dict):
+            self.fritz_session.restore_session_state(state)
+            self._session_state_saved = state
+
+    def _schedule_session_state_save(self) -> None:
+        """Queue a store write when SID, protocol or listing mode changed."""
+        if self._session_store is None:
+            return
+        state = self.fritz_session.export_session_state()
+        if not state or state == self._session_state_saved:
+            return
+        self._session_state_saved = state
+        # Snapshot now: the session may be closed before the delayed write runs.
+        self._session_store.async_delay_save(lambda: state, SESSION_STORE_SAVE_DELAY)
+
+    def export_identity_state(self) -> dict[str, Any]:
+        """Identity tracking state worth keeping across HA restarts."""
+        return {
+            IDENTITY_KEY_SEEN_UIDS: sorted(self._seen_uids),
+            IDENTITY_KEY_UID_NAMES: dict(self._uid_names),
+            IDENTITY_KEY_UID_REMAP: dict(self._uid_remap),
+            IDENTITY_KEY_MISSING_COUNTS: dict(self._missing_uid_counts),
+            IDENTITY_KEY_CONFIRMED_ORPHANS: sorted(self._confirmed_orphan_uids),
+            IDENTITY_KEY_RECOVERING_UNTIL: _monotonic_to_wall(self._recovering_until),
+            IDENTITY_KEY_RECOVERY_STARTED_AT: _monotonic_to_wall(
+                self._recovery_started_at
+            ),
+            IDENTITY_KEY_BOX_BOOT_TIME: self._box_boot_time,
+            IDENTITY_KEY_BOX_REBOOTED: self._box_rebooted,
+        }
+
+    def restore_identity_state(self, state: Mapping[str, Any]) -> None:
+        """Apply state from export_identity_state(); invalid fields are skipped."""
+        seen = state.get(IDENTITY_KEY_SEEN_UIDS)
+        if isinstance(seen, list):
+            self._seen_uids |= {uid for uid in seen if isinstance(uid, str)}
+        confirmed = state.get(IDENTITY_KEY_CONFIRMED_ORPHANS)
+        if isinstance(confirmed, list):
+            self._confirmed_orphan_uids |= {
+                uid for uid in confirmed if isinstance(uid, str)
+            }
+        for key, target in (
+            (IDENTITY_KEY_UID_NAMES, self._uid_names),
+            (IDENTITY_KEY_UID_REMAP, self._uid_remap),
+        ):
+            values = state.get(key)
+            if isinstance(values, dict):
+                target.update(
+                    (uid, value)
+                    for uid, value in values.items()
+                    if isinstance(value, str)
+                )
+        missing = state.get(IDENTITY_KEY_MISSING_COUNTS)
+        if isinstance(missing, dict):
+            self._missing_uid_counts.update(
+                (uid, count)
+                for uid, count in missing.items()
+                if isinstance(count, int) and not isinstance(count, bool)
+            )
+        recovering_until = _wall_to_monotonic(state.get(IDENTITY_KEY_RECOVERING_UNTIL))
+        if recovering_until is not None:
+            self._recovering_until = recovering_until
+            self._recovery_started_at = _wall_to_monotonic(
+                state.get(IDENTITY_KEY_RECOVERY_STARTED_AT)
+            )
+            self._box_rebooted = state.get(IDENTITY_KEY_BOX_REBOOTED) is True
+        boot_time = state.get(IDENTITY_KEY_BOX_BOOT_TIME)
+        if isinstance(boot_time, int | float) and not isinstance(boot_time, bool):
+            self._box_boot_time = float(boot_time)
+
+    def _schedule_identity_save(self) -> None:
+        """Queue a delayed store write when identity state changed.
+
+        Writes are batched: the store serializes the latest state when the
+        delay expires, however many polls changed it in between.
+        """
+        if self._identity_store is None:
+            return
+        state = self.export_identity_state()
+        if state == self._identity_saved:
+            return
+        self._identity_saved = state
+        self._identity_store.async_delay_save(
+            self.export_identity_state, IDENTITY_STORE_SAVE_DELAY
+        )
+
+    def _changed_connection_uids(self) -> set[str] | None:
+        """UIDs whose payload changed since the last dispatch; None means all."""
+        previous = self._dispatched_data
+        current = self.data
+        if (
+            previous is None
+            or current is None
+            or not self.last_update_success
+            or self._dispatched_success is not True
+        ):
+            return None
+        if previous is current:
+            return set()
+        return {
+            uid
+            for uid in previous.keys() | current.keys()
+            if previous.get(uid) != current.get(uid)
+        }
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify connection-bound listeners only when their connection changed.
+
+        Listeners without a context (platform setup) always run. Availability
+        changes (failed poll, recovery) and the first data notify everyone.
+        """
+        changed = self._changed_connection_uids()
+        self._dispatched_data = self.data
+        self._dispatched_success = self.last_update_success
+        if changed is None:
+            super().async_update_listeners()
+            return
+        for update_callback, context in list(self._listeners.values()):
+            if (
+                context is None
+                or context in changed
+                or self.resolve_connection_uid(context) in changed
+            ):
+                update_callback()
 
     def resolve_connection_uid(self, connection_uid: str) -> str:
         """Map a pre-remap entity UID to the current coordinator data key."""
@@ -177,11 +429,46 @@ class FritzBoxVPNCoordinator(DataUpdateCoordinator):
         return any(ind in str(error).lower() for ind in AUTH_INDICATORS)
 
     def _prepare_session_for_retry(self, error: Exception) -> None:
-        """Drop cached SID/protocol after transient failures so the next poll recovers."""
+        """Drop cached SID/protocol only on evidence of a reboot or expiry.
+
+        Timeouts and resets keep the session (no re-login, no re-probe); a
+        refused connection or an answer from the box (403/HTML, HTTP status,
+        missing payload) resets it.
+        """
         if self._is_auth_error(error):
             return
+        if is_transport_error(error) and not is_connection_refused(error):
+            return
         self.fritz_session.invalidate_session()
 
+    def _transport_retry_after(self, error: Exception) -> float:
+        """Backoff for the next poll; only transport failures feed the breaker.
+
+        A box that answers with an error status or without the payload is up,
+        so HEAD probes would not tell anything new.
+        """
+        if is_transport_error(error):
+            return self.breaker.record_failure()
+        return RETRY_AFTER_SECONDS
+
+    async def _async_check_breaker(self) -> None:
+        """Fail fast while open; probe reachability once before half-open polls."""
+        state = self.breaker.before_request()
+        if state is BreakerState.CLOSED:
+            return
+        if state is BreakerState.OPEN:
+            raise UpdateFailed(
+                f"{host_from_config(self.config)} unreachable; next attempt in "
+                f"{self.breaker.seconds_until_retry():.0f}s",
+                retry_after=max(self.breaker.seconds_until_retry(), 1.0),
+            )
+        if await self.fritz_session.async_probe_reachable():
+            return
+        raise UpdateFailed(
+            f"{host_from_config(self.config)} still unreachable",
+            retry_after=self.breaker.record_failure(),
+        )
+
     def _schedule_reauth(self) -> None:
         """Start re-authentication flow once per auth failure cycle."""
         if self._reauth_scheduled or not self.entry_id:
@@ -223,7 +510,7 @@ class FritzBoxVPNCoordinator(DataUpdateCoordinator):
         if self.data:
             self._seen_uids |= set(self.data.keys())
             self._remember_connection_names(self.data)
-        duration = recovery_window_seconds(self._update_interval_seconds)
+        duration = recovery_window_seconds(self._configured_update_interval)
         until = time.monotonic() + duration
         was_recovering = self._recovering_until is not None
         if self._recovery_started_at is None:
@@ -245,6 +532,78 @@ class FritzBoxVPNCoordinator(DataUpdateCoordinator):
         self._recovering_until = None
         self._recovery_started_at = None
         self._recovery_stable_polls = 0
+        self._box_rebooted = False
+
+    def _uptime_due(self) -> bool:
+        """Read uptime on first poll, around outages, and every UPTIME_CHECK_INTERVAL."""
+        return (
+            self._uptime_checked_at is None
+            or self._in_recovery()
+            or not self.last_update_success
+            or time.monotonic() >= self._uptime_checked_at + UPTIME_CHECK_INTERVAL
+        )
+
+    async def _async_fetch_uptime(self) -> int | None:
+        """Box uptime in seconds when due and available; never raises."""
+        if not self._uptime_due():
+            return None
+        self._uptime_checked_at = time.monotonic()
+        try:
+            uptime = await self.fritz_session.async_get_uptime()
+        except Exception:
+            _LOGGER.debug("Uptime check failed", exc_info=True)
+            return None
+        if isinstance(uptime, bool) or not isinstance(uptime, int):
+            return None
+        return uptime
+
+    def _box_rebooted_since_last_check(self, uptime: int | None) -> bool | None:
+        """True on a new boot, False when the boot time held, None if unknown."""
+        if uptime is None:
+            return None
+        boot_time = time.time() - uptime
+        previous = self._box_boot_time
+        if previous is not None and boot_time - previous <= BOOT_TIME_TOLERANCE:
+            return False
+        self._box_boot_time = boot_time
+        return None if previous is None else True
+
+    def _note_box_reboot(self, uptime: int) -> None:
+        """Confirmed reboot: remap UIDs on this poll, gate only on stable polls."""
+        if self.data:
+            self._seen_uids |= set(self.data.keys())
+            self._remember_connection_names(self.data)
+        now = time.monotonic()
+        if self._recovery_started_at is None:
+            self._recovery_started_at = now
+        # No minimum window: the box is back, only its listing may lag.
+        self._recovering_until = now
+        self._recovery_stable_polls = 0
+        self._box_rebooted = True
+        self._reset_orphan_miss_streaks()
+        _LOGGER.warning(
+            LOG_MSG_BOX_REBOOTED,
+            host_from_config(self.config),
+            uptime,
+            len(self._seen_uids),
+        )
+
+    def _apply_boot_signal(
+        self, uptime: int | None, connections: dict[str, Any]
+    ) -> None:
+        """Size the recovery window from an explicit reboot / no-reboot signal."""
+        rebooted = self._box_rebooted_since_last_check(uptime)
+        if rebooted and uptime is not None:
+            self._note_box_reboot(uptime)
+        elif (
+            rebooted is False
+            and connections
+            and self._in_recovery()
+            and not self._box_rebooted
+        ):
+            # Network blip: UIDs cannot have changed, resume orphan tracking.
+            self._clear_recovery()
+            _LOGGER.info(LOG_MSG_RECOVERY_NO_REBOOT, host_from_config(self.config))
 
     def _recovery_max_elapsed(self) -> bool:
         """True when recovery has exceeded the hard empty-list cap."""
@@ -252,7 +611,7 @@ class FritzBoxVPNCoordinator(DataUpdateCoordinator):
             return False
         return time.monotonic() >= (
             self._recovery_started_at
-            + recovery_max_seconds(self._update_interval_seconds)
+            + recovery_max_seconds(self._configured_update_interval)
         )
 
     def _note_successful_poll(self, connections: dict[str, Any]) -> None:
@@ -373,15 +732,124 @@ class FritzBoxVPNCoordinator(DataUpdateCoordinator):
                 newly_confirmed.add(uid)
         return newly_confirmed
 
+    def _awaiting_connect(self, connections: dict[str, Any], now: float) -> bool:
+        """True shortly after a change while a connection is enabled, not connected."""
+        if (
+            self._last_change_at is None
+            or now >= self._last_change_at + ADAPTIVE_CONNECT_WINDOW
+        ):
+            return False
+        return any(
+            isinstance(conn, dict)
+            and conn.get(API_KEY_ACTIVE)
+            and not conn.get(API_KEY_CONNECTED)
+            for conn in connections.values()
+        )
+
+    def _adaptive_interval_seconds(self, connections: dict[str, Any]) -> int:
+        """Fast after toggles/changes, backed off after unchanged polls."""
+        now = time.monotonic()
+        if (
+            self._fast_poll_until is not None and now < self._fast_poll_until
+        ) or self._awaiting_connect(connections, now):
+            return ADAPTIVE_FAST_INTERVAL
+        backoff = self._configured_update_interval << min(
+            self._unchanged_polls // ADAPTIVE_BACKOFF_POLLS, 16
+        )
+        return min(backoff, self._max_update_interval_seconds)
+
+    def _apply_adaptive_interval(self, connections: dict[str, Any]) -> None:
+        """Set the interval used to schedule the next poll."""
+        self.update_interval = timedelta(
+            seconds=self._adaptive_interval_seconds(connections)
+        )
+
+    def _arm_fast_polling(self) -> None:
+        """Poll fast for ADAPTIVE_FAST_WINDOW after a toggle or observed change."""
+        if not self.adaptive_polling:
+            return
+        now = time.monotonic()
+        self._fast_poll_until = now + ADAPTIVE_FAST_WINDOW
+        self._last_change_at = now
+        self._unchanged_polls = 0
+        self._apply_adaptive_interval(self.data or {})
+
+    def _note_poll_change(self, connections: dict[str, Any]) -> None:
+        """Feed the adaptive scheduler with whether this poll changed anything."""
+        if not self.adaptive_polling:
+            return
+        if self.data is not None and connections != self.data:
+            self._arm_fast_polling()
+        elif self.update_interval != timedelta(seconds=ADAPTIVE_FAST_INTERVAL):
+            # Fast polls do not count toward backoff.
+            self._unchanged_polls += 1
+        self._apply_adaptive_interval(connections)
+
+    @property
+    def effective_update_interval(self) -> int:
+        """Seconds until the next scheduled poll (adaptive or configured)."""
+        if self.update_interval is None:
+            return self._configured_update_interval
+        return int(self.update_interval.total_seconds())
+
+    def _shared_listing_max_age(self) -> float:
+        """Reuse another entry's listing from within one own poll interval."""
+        if not self.entry_id or shared_session_users(self.hass, self.fritz_session) < 2:
+            return 0
+        return self.effective_update_interval
+
+    def _listing_unchanged(self, connections: dict[str, Any]) -> bool:
+        """True when the session returned the very listing already in self.data."""
+        return self.fritz_session.listing_unchanged is True and connections is self.data
+
+    def _orphan_confirmation_pending(self) -> bool:
+        """True while a missing UID still needs polls before it is confirmed."""
+        return bool(self._missing_uid_counts.keys() - self._confirmed_orphan_uids)
+
+    def _process_listing(self, connections: dict[str, Any]) -> None:
+        """Track names, UID deltas, remaps and orphans for a changed listing."""
+        current_uids = set(connections.keys())
+        self._remember_connection_names(connections)
+        self._log_uid_delta(current_uids)
+        self._apply_uid_remap_if_needed(connections)
+
+        if self._in_recovery():
+            self._reset_orphan_miss_streaks()
+            if self.data:
+                self._seen_uids |= set(self.data.keys())
+            self._seen_uids |= current_uids
+            newly_confirmed: set[str] = set()
+        else:
+            newly_confirmed = self._track_missing_uids(current_uids)
+
+        if newly_confirmed:
+            names = [self._uid_names.get(uid, uid) for uid in newly_confirmed]
+            _LOGGER.warning(
+                LOG_MSG_VPN_CONNECTIONS_REMOVED,
+                NAME_FRITZBOX,
+                names or list(newly_confirmed),
+                sorted(newly_confirmed),
+            )
+            _LOGGER.info(LOG_MSG_VPN_CONNECTIONS_REMOVED_HINT)
+            if self._on_orphaned_removed and self.entry_id:
+                self._on_orphaned_removed(self.entry_id, current_uids)
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch latest VPN data from Fritz!Box."""
         try:
-            connections = await self.fritz_session.async_get_vpn_connections()
+            await self._async_check_breaker()
+            connections = await self.fritz_session.async_get_vpn_connections(
+                max_age=self._shared_listing_max_age(), requester=self.entry_id
+            )
+            self.breaker.record_success()
+            # Uptime only once the box answered: a slow or failing TR-064 read
+            # (bounded by UPTIME_TIMEOUT) never holds up or fails a poll.
+            self._apply_boot_signal(await self._async_fetch_uptime(), connections)
             had_connections = bool(self._seen_uids) or bool(self.data)
             if not connections and self._in_recovery() and had_connections:
                 seen_count = len(self._seen_uids) or len(self.data or {})
                 if self._recovery_max_elapsed():
-                    max_seconds = recovery_max_seconds(self._update_interval_seconds)
+                    max_seconds = recovery_max_seconds(self._configured_update_interval)
                     _LOGGER.warning(
                         LOG_MSG_RECOVERY_EMPTY_ACCEPTED,
                         host_from_config(self.config),
@@ -402,34 +870,16 @@ class FritzBoxVPNCoordinator(DataUpdateCoordinator):
                         retry_after=RETRY_AFTER_SECONDS,
                     )
 
-            current_uids = set(connections.keys())
-            self._remember_connection_names(connections)
-            self._log_uid_delta(current_uids)
-            self._apply_uid_remap_if_needed(connections)
-
-            if self._in_recovery():
-                self._reset_orphan_miss_streaks()
-                if self.data:
-                    self._seen_uids |= set(self.data.keys())
-                self._seen_uids |= current_uids
-                newly_confirmed: set[str] = set()
-            else:
-                newly_confirmed = self._track_missing_uids(current_uids)
-
-            if newly_confirmed:
-                names = [self._uid_names.get(uid, uid) for uid in newly_confirmed]
-                _LOGGER.warning(
-                    LOG_MSG_VPN_CONNECTIONS_REMOVED,
-                    NAME_FRITZBOX,
-                    names or list(newly_confirmed),
-                    sorted(newly_confirmed),
-                )
-                _LOGGER.info(LOG_MSG_VPN_CONNECTIONS_REMOVED_HINT)
-                if self._on_orphaned_removed and self.entry_id:
-                    self._on_orphaned_removed(self.entry_id, current_uids)
+            if (
+                not self._listing_unchanged(connections)
+                or self._orphan_confirmation_pending()
+            ):
+                self._process_listing(connections)
 
+            self._note_poll_change(connections)
             self._note_successful_poll(connections)
             self._reauth_scheduled = False
+            self._schedule_session_state_save()
             return connections
         except UpdateFailed:
             raise
@@ -441,14 +891,14 @@ class FritzBoxVPNCoordinator(DataUpdateCoordinator):
             self._arm_recovery()
             raise UpdateFailed(
                 f"Error fetching VPN data: {err}",
-                retry_after=RETRY_AFTER_SECONDS,
+                retry_after=self._transport_retry_after(err),
             ) from err
         except TimeoutError as err:
             self._arm_recovery()
             self._prepare_session_for_retry(err)
             raise UpdateFailed(
                 f"Error fetching VPN data: {err}",
-                retry_after=RETRY_AFTER_SECONDS,
+                retry_after=self._transport_retry_after(err),
             ) from err
         except Exception as err:
             self._prepare_session_for_retry(err)
@@ -461,15 +911,48 @@ class FritzBoxVPNCoordinator(DataUpdateCoordinator):
             _LOGGER.exception("Unexpected error fetching VPN data")
             raise UpdateFailed(
                 f"Unexpected error fetching VPN data: {err}",
-                retry_after=RETRY_AFTER_SECONDS,
+                retry_after=self._transport_retry_after(err),
             ) from err
+        finally:
+            self._schedule_identity_save()
+
+    async def _async_publish_verified_listing(self) -> None:
+        """Publish the listing verified by a toggle; poll only if there is none."""
+        snapshot = self.fritz_session.listing_snapshot()
+        if not isinstance(snapshot, dict):
+            await self.async_request_refresh()
+            return
+        self.async_set_updated_data(snapshot)
+
+    async def set_vpn_states(self, states: Mapping[str, bool]) -> dict[str, bool]:
+        """Switch several VPNs in one batch; success keyed by the given UIDs."""
+        resolved = {uid: self.resolve_connection_uid(uid) for uid in states}
+        self._arm_fast_polling()
+        try:
+            results = await self.fritz_session.async_set_vpn_states(
+                {resolved[uid]: enable for uid, enable in states.items()}
+            )
+        except Exception as err:
+            if self._is_auth_error(err):
+                self._schedule_reauth()
+            raise
+        await self._async_publish_verified_listing()
+        return {uid: results.get(resolved[uid], False) for uid in states}
 
     async def toggle_vpn(self, connection_uid: str, enable: bool) -> bool:
-        """Toggle VPN on/off; schedule reauth on authentication errors."""
+        """Toggle VPN on/off and publish the verified listing.
+
+        The web-API session verifies the toggle against a fresh listing; that
+        snapshot replaces coordinator data instead of a second poll. Schedule
+        reauth on authentication errors.
+        """
         resolved = self.resolve_connection_uid(connection_uid)
+        self._arm_fast_polling()
         try:
-            return await self.fritz_session.async_toggle_vpn(resolved, enable)
+            success = await self.fritz_session.async_toggle_vpn(resolved, enable)
         except Exception as err:
             if self._is_auth_error(err):
                 self._schedule_reauth()
             raise
+        await self._async_publish_verified_listing()
+        return success
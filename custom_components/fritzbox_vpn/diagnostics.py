@@ -25,12 +25,25 @@ async def async_get_config_entry_diagnostics(
     )
 
     last_update_success: bool | None = None
+    effective_update_interval: int | None = None
+    adaptive_polling: bool | None = None
+    circuit_breaker: dict[str, Any] | None = None
+    session_stats: dict[str, Any] | None = None
     vpn_connections: list[dict[str, Any]] = []
 
     runtime = runtime_from_entry(entry)
     if runtime is not None:
         coordinator = runtime.coordinator
         last_update_success = coordinator.last_update_success
+        effective_update_interval = getattr(
+            coordinator, "effective_update_interval", None
+        )
+        adaptive_polling = getattr(coordinator, "adaptive_polling", None)
+        breaker = getattr(coordinator, "breaker", None)
+        if breaker is not None:
+            circuit_breaker = breaker.as_dict()
+        fritz_session = getattr(coordinator, "fritz_session", None)
+        session_stats = getattr(fritz_session, "session_stats", None)
         if coordinator.data:
             for uid, conn in coordinator.data.items():
                 if not isinstance(conn, dict):
@@ -48,7 +61,11 @@ async def async_get_config_entry_diagnostics(
         "entry": async_redact_data(entry.as_dict(), TO_REDACT),
         "host": host,
         "update_interval_seconds": update_interval,
+        "adaptive_polling": adaptive_polling,
+        "effective_update_interval_seconds": effective_update_interval,
         "last_update_success": last_update_success,
+        "circuit_breaker": circuit_breaker,
+        "session_stats": session_stats,
         "vpn_connection_count": len(vpn_connections),
         "vpn_connections": vpn_connections,
     }
@@ -144,7 +144,11 @@ def raise_toggle_failed(vpn_name: str, error: str = "") -> None:
 
 
 class FritzBoxVPNEntity(CoordinatorEntity):
-    """Base entity bound to one VPN connection on the coordinator."""
+    """Base entity bound to one VPN connection on the coordinator.
+
+    The connection UID is the coordinator context, so the entity is only
+    updated when its own connection payload changed.
+    """
 
     _attr_has_entity_name = True
     _attr_translation_domain = DOMAIN
@@ -162,7 +166,7 @@ class FritzBoxVPNEntity(CoordinatorEntity):
         translation_key: str | None = None,
         object_id_suffix: str | None = None,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=connection_uid)
         self._entry = entry
         self._connection_uid = connection_uid
         self._connection_data = connection_payload
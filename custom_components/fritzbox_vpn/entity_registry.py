@@ -4,15 +4,21 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Callable
+from functools import lru_cache
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_platform import async_get_platforms
 from homeassistant.util import slugify
 
 from .const import (
     DOMAIN,
+    LOG_MSG_IN_PLACE_REMOVAL_FAILED,
     LOG_MSG_ORPHAN_BASE_MERGE,
+    REGISTRY_INDEXES_KEY,
+    UNIQUE_ID_PARSE_CACHE_SIZE,
     UNIQUE_ID_PREFIX,
     UNIQUE_ID_SUFFIX_SWITCH,
     UNIQUE_ID_SUFFIXES,
@@ -25,24 +31,119 @@ _LOGGER = logging.getLogger(__name__)
 _ENTITY_ID_OBJECT_ID_SUFFIX_RE = re.compile(r"^(.+)_(\d+)$")
 
 
-def unique_id_suffix_from_entity_unique_id(unique_id: str) -> str | None:
-    """Platform suffix token from entity unique_id; None if not our format."""
+@lru_cache(maxsize=UNIQUE_ID_PARSE_CACHE_SIZE)
+def _parse_entity_unique_id(unique_id: str) -> tuple[str, str] | None:
+    """(connection_uid, suffix) from an entity unique_id; None if not ours."""
     if not unique_id or not unique_id.startswith(UNIQUE_ID_PREFIX):
         return None
     rest = unique_id[len(UNIQUE_ID_PREFIX) :]
     for suffix in UNIQUE_ID_SUFFIXES:
         if rest.endswith("_" + suffix):
-            return suffix
+            return (rest[: -len(suffix) - 1], suffix)
     return None
 
 
+def unique_id_suffix_from_entity_unique_id(unique_id: str) -> str | None:
+    """Platform suffix token from entity unique_id; None if not our format."""
+    parsed = _parse_entity_unique_id(unique_id)
+    return parsed[1] if parsed is not None else None
+
+
 def connection_uid_from_entity_unique_id(unique_id: str) -> str | None:
     """Connection UID from entity unique_id; None if not our format."""
-    suffix = unique_id_suffix_from_entity_unique_id(unique_id)
-    if suffix is None:
-        return None
-    rest = unique_id[len(UNIQUE_ID_PREFIX) :]
-    return rest[: -len(suffix) - 1]
+    parsed = _parse_entity_unique_id(unique_id)
+    return parsed[0] if parsed is not None else None
+
+
+class EntityRegistryIndex:
+    """One config entry's entity registry rows, indexed for the repair helpers.
+
+    Built on first use and rebuilt lazily after an entity registry update
+    that touches the entry, so back-to-back helpers share a single scan.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self.hass = hass
+        self.entry_id = entry_id
+        self.entries: list[er.RegistryEntry] = []
+        self.by_entity_id: dict[str, er.RegistryEntry] = {}
+        self.by_uid: dict[str, list[er.RegistryEntry]] = {}
+        self.suffixed_by_base: dict[str, list[er.RegistryEntry]] = {}
+        # Our unique_id prefix without a valid ``{uid}_{suffix}`` tail.
+        self.malformed: list[er.RegistryEntry] = []
+        self.unsubscribe: Callable[[], None] | None = None
+        self._stale = True
+
+    def invalidate(self) -> None:
+        """Rebuild on next access."""
+        self._stale = True
+
+    def refresh(self) -> EntityRegistryIndex:
+        """Rebuild from the entity registry when stale; return self."""
+        if not self._stale:
+            return self
+        registry = er.async_get(self.hass)
+        self.entries = er.async_entries_for_config_entry(registry, self.entry_id)
+        self.by_entity_id = {}
+        self.by_uid = {}
+        self.suffixed_by_base = {}
+        self.malformed = []
+        for entry in self.entries:
+            self.by_entity_id[entry.entity_id] = entry
+            unique_id = entry.unique_id or ""
+            uid = connection_uid_from_entity_unique_id(unique_id)
+            if uid is not None:
+                self.by_uid.setdefault(uid, []).append(entry)
+            elif unique_id.startswith(UNIQUE_ID_PREFIX):
+                self.malformed.append(entry)
+            base = entity_id_base(entry.entity_id)
+            if base:
+                self.suffixed_by_base.setdefault(base, []).append(entry)
+        self._stale = False
+        return self
+
+    @callback
+    def async_registry_updated(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Mark stale when a change concerns this entry's entities."""
+        if self._stale:
+            return
+        data = event.data
+        entity_id = data["entity_id"]
+        if (
+            entity_id in self.by_entity_id
+            or data.get("old_entity_id") in self.by_entity_id
+        ):
+            self._stale = True
+            return
+        if data["action"] == "remove":
+            return
+        entry = er.async_get(self.hass).async_get(entity_id)
+        if entry is not None and entry.config_entry_id == self.entry_id:
+            self._stale = True
+
+
+def entity_registry_index(hass: HomeAssistant, entry_id: str) -> EntityRegistryIndex:
+    """Current registry index for entry_id, created and subscribed on first use."""
+    indexes: dict[str, EntityRegistryIndex] = hass.data.setdefault(
+        DOMAIN, {}
+    ).setdefault(REGISTRY_INDEXES_KEY, {})
+    index = indexes.get(entry_id)
+    if index is None:
+        index = indexes[entry_id] = EntityRegistryIndex(hass, entry_id)
+        index.unsubscribe = hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, index.async_registry_updated
+        )
+    return index.refresh()
+
+
+@callback
+def async_drop_entity_registry_index(hass: HomeAssistant, entry_id: str) -> None:
+    """Forget the entry's index and stop listening for registry updates."""
+    index = hass.data.get(DOMAIN, {}).get(REGISTRY_INDEXES_KEY, {}).pop(entry_id, None)
+    if index is not None and index.unsubscribe is not None:
+        index.unsubscribe()
 
 
 def expected_object_id_for_device_suffix(
@@ -96,12 +197,14 @@ def get_orphaned_entity_entries(
         current_uids, error_key = resolve_current_uids(hass, entry_id)
         if error_key is not None:
             return (None, error_key)
-    registry = er.async_get(hass)
-    to_remove = []
-    for entry in er.async_entries_for_config_entry(registry, entry_id):
-        uid = connection_uid_from_entity_unique_id(entry.unique_id or "")
-        if uid is not None and uid not in current_uids:
-            to_remove.append(entry)
+    index = entity_registry_index(hass, entry_id)
+    to_remove = [
+        entry
+        for entry in index.entries
+        if (uid := connection_uid_from_entity_unique_id(entry.unique_id or ""))
+        is not None
+        and uid not in current_uids
+    ]
     return (to_remove, None)
 
 
@@ -122,16 +225,7 @@ def remove_unexpected_entity_entries(
     """
     _ = current_uids
 
-    entity_registry = er.async_get(hass)
-    to_remove: list[er.RegistryEntry] = []
-    for entry in er.async_entries_for_config_entry(entity_registry, entry_id):
-        unique_id = entry.unique_id or ""
-        if not unique_id.startswith(UNIQUE_ID_PREFIX):
-            continue
-        if connection_uid_from_entity_unique_id(unique_id) is not None:
-            continue
-        to_remove.append(entry)
-
+    to_remove = list(entity_registry_index(hass, entry_id).malformed)
     remove_orphaned_entities(hass, entry_id, to_remove)
     return len(to_remove)
 
@@ -184,7 +278,7 @@ def get_legacy_entity_object_id_repairs(
     device_registry = dr.async_get(hass)
     repairs: list[tuple[er.RegistryEntry, str]] = []
 
-    for entry in er.async_entries_for_config_entry(registry, entry_id):
+    for entry in entity_registry_index(hass, entry_id).entries:
         target_entity_id = expected_entity_id_for_registry_entry(device_registry, entry)
         if target_entity_id is None or entry.entity_id == target_entity_id:
             continue
@@ -235,18 +329,11 @@ def get_entity_id_suffix_repairs(
     existing base (delete base, rename ``_2``) causes recorder history
     migration warnings and can orphan correct entities on every reload.
     """
-    all_entries = er.async_entries_for_config_entry(registry, entry_id)
-    by_entity_id = {e.entity_id: e for e in all_entries}
-    suffixed_by_base: dict[str, list[er.RegistryEntry]] = {}
-
-    for entry in all_entries:
-        base = entity_id_base(entry.entity_id)
-        if not base:
-            continue
-        suffixed_by_base.setdefault(base, []).append(entry)
+    index = entity_registry_index(registry.hass, entry_id)
+    by_entity_id = index.by_entity_id
 
     result: list[tuple[er.RegistryEntry, str, bool]] = []
-    for base_entity_id, suffixed_entries in suffixed_by_base.items():
+    for base_entity_id, suffixed_entries in index.suffixed_by_base.items():
         preferred = sorted(
             suffixed_entries,
             key=lambda e: (entity_id_suffix_number(e.entity_id) or 10_000, e.entity_id),
@@ -337,23 +424,23 @@ def remap_connection_uids(
     planned_devices: dict[str, dr.DeviceEntry] = {}
     conflicted: set[str] = set()
 
-    for entry in list(er.async_entries_for_config_entry(entity_registry, entry_id)):
-        unique_id = entry.unique_id or ""
-        old_uid = connection_uid_from_entity_unique_id(unique_id)
-        suffix = unique_id_suffix_from_entity_unique_id(unique_id)
-        if old_uid is None or suffix is None or old_uid not in old_to_new:
-            continue
-        new_uid = old_to_new[old_uid]
-        new_unique_id = entity_unique_id(new_uid, suffix)
-        if entity_registry.async_get_entity_id(entry.domain, DOMAIN, new_unique_id):
-            _LOGGER.error(
-                "Cannot remap unique_id %s → %s; target already exists",
-                unique_id,
-                new_unique_id,
-            )
-            conflicted.add(old_uid)
-            continue
-        planned_entities.setdefault(old_uid, []).append((entry, new_unique_id))
+    by_uid = entity_registry_index(hass, entry_id).by_uid
+    for old_uid, new_uid in old_to_new.items():
+        for entry in by_uid.get(old_uid, ()):
+            unique_id = entry.unique_id or ""
+            suffix = unique_id_suffix_from_entity_unique_id(unique_id)
+            if suffix is None:
+                continue
+            new_unique_id = entity_unique_id(new_uid, suffix)
+            if entity_registry.async_get_entity_id(entry.domain, DOMAIN, new_unique_id):
+                _LOGGER.error(
+                    "Cannot remap unique_id %s → %s; target already exists",
+                    unique_id,
+                    new_unique_id,
+                )
+                conflicted.add(old_uid)
+                continue
+            planned_entities.setdefault(old_uid, []).append((entry, new_unique_id))
 
     for old_uid, new_uid in old_to_new.items():
         device = device_registry.async_get_device(
@@ -417,29 +504,23 @@ def get_orphan_base_suffix_merges(
         if error_key is not None or current_uids is None:
             return []
 
-    registry = er.async_get(hass)
-    all_entries = er.async_entries_for_config_entry(registry, entry_id)
-    by_entity_id = {e.entity_id: e for e in all_entries}
+    index = entity_registry_index(hass, entry_id)
     result: list[tuple[er.RegistryEntry, er.RegistryEntry, str]] = []
 
-    for entry in all_entries:
-        base_entity_id = entity_id_base(entry.entity_id)
-        if not base_entity_id:
-            continue
-        base_entry = by_entity_id.get(base_entity_id)
+    for base_entity_id, suffixed_entries in index.suffixed_by_base.items():
+        base_entry = index.by_entity_id.get(base_entity_id)
         if base_entry is None or base_entry.config_entry_id != entry_id:
             continue
         base_uid = connection_uid_from_entity_unique_id(base_entry.unique_id or "")
-        live_uid = connection_uid_from_entity_unique_id(entry.unique_id or "")
-        if base_uid is None or live_uid is None:
-            continue
-        if base_uid in current_uids:
-            continue
-        if live_uid not in current_uids:
+        if base_uid is None or base_uid in current_uids:
             continue
-        if base_uid == live_uid:
-            continue
-        result.append((base_entry, entry, base_entity_id))
+        for entry in suffixed_entries:
+            live_uid = connection_uid_from_entity_unique_id(entry.unique_id or "")
+            if live_uid is None or live_uid not in current_uids:
+                continue
+            if base_uid == live_uid:
+                continue
+            result.append((base_entry, entry, base_entity_id))
 
     # Prefer lowest numeric suffix per base when multiple exist.
     preferred: dict[str, tuple[er.RegistryEntry, er.RegistryEntry, str]] = {}
@@ -516,6 +597,37 @@ def count_repairable_entity_issues(hass: HomeAssistant, entry_id: str) -> int:
     return len(legacy) + len(merges) + len(suffixes)
 
 
+async def async_remove_entity_objects(
+    hass: HomeAssistant, entry_id: str, entity_ids: list[str]
+) -> bool:
+    """Remove live entity objects from the entry's platforms without a reload.
+
+    Returns False when the entry is not loaded or a removal failed, i.e. the
+    caller has to fall back to reloading the entry.
+    """
+    if runtime_from_hass(hass, entry_id) is None:
+        return False
+    platforms = [
+        platform
+        for platform in async_get_platforms(hass, DOMAIN)
+        if platform.config_entry is not None
+        and platform.config_entry.entry_id == entry_id
+    ]
+    for entity_id in entity_ids:
+        for platform in platforms:
+            entity = platform.entities.get(entity_id)
+            if entity is None:
+                continue
+            try:
+                await entity.async_remove(force_remove=True)
+            except Exception as err:
+                _LOGGER.warning(
+                    LOG_MSG_IN_PLACE_REMOVAL_FAILED, entity_id, err, entry_id
+                )
+                return False
+    return True
+
+
 def remove_orphaned_entities(
     hass: HomeAssistant,
     entry_id: str,
@@ -13,8 +13,13 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_PERSIST_SESSION,
     CONF_UPDATE_INTERVAL,
+    DEFAULT_ADAPTIVE_POLLING,
     DEFAULT_HOST,
+    DEFAULT_PERSIST_SESSION,
     DEFAULT_UPDATE_INTERVAL,
     ERROR_INDICATOR_AUTH,
     ERROR_INDICATOR_CONNECT,
@@ -27,7 +32,7 @@ from .const import (
     UPDATE_INTERVAL_MIN,
     password_from_sources,
 )
-from .coordinator import normalize_update_interval
+from .coordinator import normalize_max_update_interval, normalize_update_interval
 from .fritzconnection_session import FritzConnectionVPNSession
 
 _LOGGER = logging.getLogger(__name__)
@@ -130,6 +135,9 @@ def configure_schema(
     default_update_interval = normalize_update_interval(
         current_options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
     )
+    default_max_update_interval = normalize_max_update_interval(
+        current_options.get(CONF_MAX_UPDATE_INTERVAL), default_update_interval
+    )
     return vol.Schema(
         {
             vol.Required(CONF_HOST, default=host_default): str,
@@ -141,6 +149,24 @@ def configure_schema(
                 vol.Coerce(int),
                 vol.Range(min=UPDATE_INTERVAL_MIN, max=UPDATE_INTERVAL_MAX),
             ),
+            vol.Optional(
+                CONF_PERSIST_SESSION,
+                default=bool(
+                    current_options.get(CONF_PERSIST_SESSION, DEFAULT_PERSIST_SESSION)
+                ),
+            ): bool,
+            vol.Optional(
+                CONF_ADAPTIVE_POLLING,
+                default=bool(
+                    current_options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING)
+                ),
+            ): bool,
+            vol.Optional(
+                CONF_MAX_UPDATE_INTERVAL, default=default_max_update_interval
+            ): vol.All(
+                vol.Coerce(int),
+                vol.Range(min=UPDATE_INTERVAL_MIN, max=UPDATE_INTERVAL_MAX),
+            ),
         }
     )
 
@@ -194,10 +220,20 @@ def config_and_options_from_configure_input(
         CONF_USERNAME: user_input[CONF_USERNAME],
         CONF_PASSWORD: user_input[CONF_PASSWORD],
     }
+    update_interval = normalize_update_interval(
+        user_input.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+    )
     options_data = {
-        CONF_UPDATE_INTERVAL: normalize_update_interval(
-            user_input.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
-        )
+        CONF_UPDATE_INTERVAL: update_interval,
+        CONF_PERSIST_SESSION: bool(
+            user_input.get(CONF_PERSIST_SESSION, DEFAULT_PERSIST_SESSION)
+        ),
+        CONF_ADAPTIVE_POLLING: bool(
+            user_input.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING)
+        ),
+        CONF_MAX_UPDATE_INTERVAL: normalize_max_update_interval(
+            user_input.get(CONF_MAX_UPDATE_INTERVAL), update_interval
+        ),
     }
     return config_data, options_data
 
@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import Awaitable, Callable
+import time
+from collections.abc import Awaitable, Callable, Mapping
 from typing import TYPE_CHECKING, Any, TypeVar
 
-from fritzboxvpn.const import DEFAULT_TIMEOUT
+from fritzboxvpn import FritzBoxTransportError, async_probe_login_page
+from fritzboxvpn.const import DEFAULT_TIMEOUT, PROTOCOL_HTTP, PROTOCOL_HTTPS
 from requests.exceptions import ConnectionError as RequestsConnectionError
 from requests.exceptions import Timeout as RequestsTimeout
 
-from .const import LOG_MSG_SESSION_MODE_FALLBACK
+from .const import (
+    LOG_MSG_SESSION_MODE_FALLBACK,
+    TR064_ACTION_GET_INFO,
+    TR064_ARG_UP_TIME,
+    TR064_SERVICE_DEVICE_INFO,
+    UPTIME_FAILURE_BACKOFF,
+    UPTIME_TIMEOUT,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,12 +31,22 @@ if TYPE_CHECKING:  # pragma: no cover
 T = TypeVar("T")
 
 
+def _retrieve_exception(task: asyncio.Task[Any]) -> None:
+    """Joined callers may all be cancelled; never leave an error unretrieved."""
+    if not task.cancelled():
+        task.exception()
+
+
 class FritzConnectionVPNSession:
     """Async wrapper for FritzConnection (sync) WireGuard calls.
 
     The integration expects these methods:
-    - async_get_vpn_connections() -> dict[connection_uid, connection_payload]
+    - async_get_vpn_connections(max_age=, requester=) -> dict[uid, payload]
     - async_toggle_vpn(connection_uid, enable) -> bool
+    - async_set_vpn_states({connection_uid: enable}) -> dict[connection_uid, bool]
+    - listing_snapshot() -> verified listing after a toggle, or None
+    - async_probe_reachable() -> bool (cheap HEAD, no login)
+    - async_get_uptime() -> box uptime in seconds, or None
     - invalidate_session()
     - async_close()
     """
@@ -52,6 +72,14 @@ class FritzConnectionVPNSession:
         self._fc: FritzConnection | None = None  # type: ignore[name-defined]
         self._fwg: FritzWireguard | None = None  # type: ignore[name-defined]
         self._fallback_session: Any | None = None
+        # TR-064 client for DeviceInfo only (web-API mode has no FritzConnection).
+        self._uptime_fc: FritzConnection | None = None  # type: ignore[name-defined]
+        # Monotonic time before which uptime reads are skipped after a failure.
+        self._uptime_retry_at = 0.0
+        self._pending_session_state: dict[str, Any] | None = None
+        # Last listing, reused by entries sharing this session (shared_session.py).
+        self._listing_task: asyncio.Task[dict[str, Any]] | None = None
+        self._listing: tuple[float, str | None, dict[str, Any]] | None = None
 
     def _ensure_client(self) -> None:
         if (
@@ -85,7 +113,13 @@ class FritzConnectionVPNSession:
                 self._username,
                 self._password,
                 protocol=protocol,
+                keepalive=True,
+                # HA owns the task: tracked, and cancelled at shutdown.
+                create_task=self._hass.async_create_background_task,
             )
+            if self._pending_session_state is not None:
+                self._fallback_session.restore_state(self._pending_session_state)
+                self._pending_session_state = None
             self._mode = "fritzboxvpn"
             if not self._fallback_mode_logged:
                 self._fallback_mode_logged = True
@@ -96,15 +130,100 @@ class FritzConnectionVPNSession:
 
         # Router API discovery happens here — callers must invoke this from a
         # path that maps Timeout/Connection/auth errors (see async_* methods).
-        self._fc = FritzConnection(
+        self._fc = self._new_fritzconnection(FritzConnection)
+        self._fwg = FritzWireguard(fc=self._fc)
+        self._mode = "fritzconnection"
+
+    def _new_fritzconnection(
+        self, factory: Callable[..., Any], timeout: float = float(DEFAULT_TIMEOUT)
+    ) -> Any:
+        return factory(
             address=self._host,
             user=self._username or None,
             password=self._password,
-            timeout=float(DEFAULT_TIMEOUT),
+            timeout=timeout,
             use_tls=self._use_tls,
         )
-        self._fwg = FritzWireguard(fc=self._fc)
-        self._mode = "fritzconnection"
+
+    @property
+    def session_stats(self) -> dict[str, Any] | None:
+        """Web-API session counters; None unless the fritzboxvpn fallback is active."""
+        if self._fallback_session is None:
+            return None
+        return self._fallback_session.stats.as_dict()
+
+    @property
+    def listing_unchanged(self) -> bool:
+        """True when the last web-API listing body matched the previous one."""
+        if self._fallback_session is None:
+            return False
+        return self._fallback_session.listing_unchanged
+
+    def listing_snapshot(self) -> dict[str, Any] | None:
+        """Listing verified by the last toggle; None in FritzConnection mode."""
+        if self._fallback_session is None:
+            return None
+        return self._fallback_session.listing_snapshot()
+
+    async def async_probe_reachable(self) -> bool:
+        """HEAD login_sid.lua without logging in; True once the box answers."""
+        if self._fallback_session is not None:
+            return await self._fallback_session.async_probe_reachable()
+        from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+        protocols = (
+            [PROTOCOL_HTTPS, PROTOCOL_HTTP]
+            if self._use_tls
+            else [PROTOCOL_HTTP, PROTOCOL_HTTPS]
+        )
+        protocol = await async_probe_login_page(
+            async_get_clientsession(self._hass), self._host, protocols
+        )
+        return protocol is not None
+
+    def _get_uptime_sync(self) -> int:
+        fc = self._fc
+        if fc is None:
+            if self._uptime_fc is None:
+                from fritzconnection import FritzConnection  # type: ignore
+
+                self._uptime_fc = self._new_fritzconnection(
+                    FritzConnection, float(UPTIME_TIMEOUT)
+                )
+            fc = self._uptime_fc
+        info = fc.call_action(TR064_SERVICE_DEVICE_INFO, TR064_ACTION_GET_INFO)
+        return int(info[TR064_ARG_UP_TIME])
+
+    async def async_get_uptime(self) -> int | None:
+        """Box uptime in seconds from TR-064 DeviceInfo; None when unavailable.
+
+        Best effort: TR-064 may be disabled or the user may lack the right, so
+        failures never affect the listing. A read is cut off after
+        UPTIME_TIMEOUT, and after a failure (including building the TR-064
+        client) none is tried for UPTIME_FAILURE_BACKOFF.
+        """
+        if time.monotonic() < self._uptime_retry_at:
+            return None
+        try:
+            async with asyncio.timeout(UPTIME_TIMEOUT):
+                return await self._hass.async_add_executor_job(self._get_uptime_sync)
+        except Exception as err:
+            self._uptime_retry_at = time.monotonic() + UPTIME_FAILURE_BACKOFF
+            _LOGGER.debug("Could not read uptime from %s: %s", self._host, err)
+            return None
+
+    def export_session_state(self) -> dict[str, Any] | None:
+        """Persistable web-API session state; None in FritzConnection mode."""
+        if self._fallback_session is None:
+            return None
+        return self._fallback_session.export_state()
+
+    def restore_session_state(self, state: Mapping[str, Any]) -> None:
+        """Hand persisted state to the web-API session once it exists."""
+        if self._fallback_session is not None:
+            self._fallback_session.restore_state(state)
+            return
+        self._pending_session_state = dict(state)
 
     @staticmethod
     def _is_fritz_authorization_error(err: Exception) -> bool:
@@ -118,6 +237,9 @@ class FritzConnectionVPNSession:
         return isinstance(err, FritzAuthorizationError)
 
     def _close_sync(self) -> None:
+        if self._uptime_fc is not None:
+            self._uptime_fc.session.close()
+            self._uptime_fc = None
         if self._fc is None:
             return
         # requests.Session.close() is safe and synchronous
@@ -133,13 +255,17 @@ class FritzConnectionVPNSession:
         """
         if self._fallback_session is not None:
             self._fallback_session.invalidate_session()
-        if self._fc is not None:
+        for fc in (self._fc, self._uptime_fc):
+            if fc is None:
+                continue
             try:
-                self._fc.session.close()
+                fc.session.close()
             except Exception:  # pragma: no cover - best-effort cleanup
                 _LOGGER.debug("Error closing FritzConnection session", exc_info=True)
         self._fc = None
         self._fwg = None
+        self._uptime_fc = None
+        self._listing = None
         self._use_tls = True
         # Keep mode/fallback; only the active transport cache is cleared.
 
@@ -161,8 +287,7 @@ class FritzConnectionVPNSession:
         """Close only already-initialized transport; never bootstrap a client."""
         if self._fallback_session is not None:
             await self._fallback_session.async_close()
-            return
-        if self._fc is not None:
+        if self._fc is not None or self._uptime_fc is not None:
             await self._hass.async_add_executor_job(self._close_sync)
 
     def _raise_auth_error(self, err: Exception, *, as_value_error: bool) -> None:
@@ -187,7 +312,7 @@ class FritzConnectionVPNSession:
                 return await fallback_primary()
             return await self._hass.async_add_executor_job(sync_call)
         except RequestsTimeout as err:
-            self.invalidate_session()
+            # Transient: keep the client, SID and TLS preference for the next poll.
             raise TimeoutError(str(err)) from err
         except RequestsConnectionError as err:
             if self._use_tls:
@@ -205,7 +330,9 @@ class FritzConnectionVPNSession:
                     raise TimeoutError(str(retry_err)) from retry_err
                 except RequestsConnectionError as retry_err:
                     self.invalidate_session()
-                    raise ConnectionError(f"{fail_message}: {retry_err}") from retry_err
+                    raise FritzBoxTransportError(
+                        f"{fail_message}: {retry_err}"
+                    ) from retry_err
                 except Exception as retry_err:
                     if self._is_fritz_authorization_error(retry_err):
                         self._raise_auth_error(
@@ -213,25 +340,52 @@ class FritzConnectionVPNSession:
                         )
                     raise
             self.invalidate_session()
-            raise ConnectionError(f"{fail_message}: {err}") from err
+            raise FritzBoxTransportError(f"{fail_message}: {err}") from err
         except Exception as err:
             if self._is_fritz_authorization_error(err):
                 self._raise_auth_error(err, as_value_error=auth_as_value_error)
             raise
 
-    async def async_get_vpn_connections(self) -> dict[str, Any]:
-        """Fetch latest VPN connections with HTTPS->HTTP fallback."""
+    async def async_get_vpn_connections(
+        self, *, max_age: float = 0, requester: str | None = None
+    ) -> dict[str, Any]:
+        """Fetch latest VPN connections with HTTPS->HTTP fallback.
+
+        Concurrent callers join one request. With ``max_age``, a listing
+        another requester started that recently is returned as is, so entries
+        sharing this session cost one poll per interval.
+        """
+        listing = self._listing
+        if (
+            listing is not None
+            and listing[1] != requester
+            and time.monotonic() - listing[0] < max_age
+        ):
+            return listing[2]
+        task = self._listing_task
+        if task is None or task.done():
+            task = asyncio.create_task(self._async_fetch_vpn_connections(requester))
+            task.add_done_callback(_retrieve_exception)
+            self._listing_task = task
+        return await asyncio.shield(task)
+
+    async def _async_fetch_vpn_connections(
+        self, requester: str | None
+    ) -> dict[str, Any]:
+        started = time.monotonic()
 
         async def _fallback_primary() -> dict[str, Any]:
             assert self._fallback_session is not None
             return await self._fallback_session.async_get_vpn_connections()
 
-        return await self._async_with_https_http_fallback(
+        connections = await self._async_with_https_http_fallback(
             fallback_primary=_fallback_primary,
             sync_call=self._get_vpn_connections_sync,
             fail_message="failed to get login page",
             auth_as_value_error=True,
         )
+        self._listing = (started, requester, connections)
+        return connections
 
     async def async_toggle_vpn(self, connection_uid: str, enable: bool) -> bool:
         """Toggle VPN on/off with HTTPS->HTTP fallback and auth propagation."""
@@ -240,9 +394,33 @@ class FritzConnectionVPNSession:
             assert self._fallback_session is not None
             return await self._fallback_session.async_toggle_vpn(connection_uid, enable)
 
+        self._listing = None
+
         return await self._async_with_https_http_fallback(
             fallback_primary=_fallback_primary,
             sync_call=lambda: self._toggle_vpn_sync(connection_uid, enable),
             fail_message="failed to toggle VPN",
             auth_as_value_error=False,
         )
+
+    async def async_set_vpn_states(self, states: Mapping[str, bool]) -> dict[str, bool]:
+        """Switch several VPNs; one batched request set in fritzboxvpn mode."""
+
+        async def _fallback_primary() -> dict[str, bool]:
+            assert self._fallback_session is not None
+            return await self._fallback_session.async_set_vpn_states(states)
+
+        self._listing = None
+
+        def _set_states_sync() -> dict[str, bool]:
+            return {
+                uid: self._toggle_vpn_sync(uid, enable)
+                for uid, enable in states.items()
+            }
+
+        return await self._async_with_https_http_fallback(
+            fallback_primary=_fallback_primary,
+            sync_call=_set_states_sync,
+            fail_message="failed to toggle VPN",
+            auth_as_value_error=False,
+        )
@@ -0,0 +1,98 @@
+"""Host-keyed session registry shared by config entries for the same box."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DOMAIN,
+    LOG_MSG_SHARED_SESSION,
+    SHARED_SESSIONS_KEY,
+    host_from_config,
+)
+from .fritzconnection_session import FritzConnectionVPNSession
+
+_LOGGER = logging.getLogger(__name__)
+
+SessionKey = tuple[str, str, str]
+
+
+@dataclass
+class SharedSession:
+    """One session per box and credentials, reference-counted by entry_id."""
+
+    session: FritzConnectionVPNSession
+    entry_ids: set[str] = field(default_factory=set)
+
+
+def _shared_sessions(hass: HomeAssistant) -> dict[SessionKey, SharedSession]:
+    """Registry in hass.data[DOMAIN]; survives entry reloads."""
+    return hass.data.setdefault(DOMAIN, {}).setdefault(SHARED_SESSIONS_KEY, {})
+
+
+def _session_key(config: dict[str, Any]) -> SessionKey:
+    """Same host and credentials → same session (SSDP vs. manual entries)."""
+    return (
+        host_from_config(config).strip().lower(),
+        config[CONF_USERNAME],
+        config[CONF_PASSWORD],
+    )
+
+
+def acquire_shared_session(
+    hass: HomeAssistant, config: dict[str, Any], entry_id: str
+) -> FritzConnectionVPNSession:
+    """Session for the entry's box; created on first use, then shared."""
+    sessions = _shared_sessions(hass)
+    key = _session_key(config)
+    shared = sessions.get(key)
+    if shared is None:
+        shared = sessions[key] = SharedSession(
+            FritzConnectionVPNSession(
+                hass,
+                host_from_config(config),
+                config[CONF_USERNAME],
+                config[CONF_PASSWORD],
+                use_tls=True,
+            )
+        )
+    elif entry_id not in shared.entry_ids:
+        _LOGGER.info(
+            LOG_MSG_SHARED_SESSION,
+            host_from_config(config),
+            entry_id,
+            sorted(shared.entry_ids),
+        )
+    shared.entry_ids.add(entry_id)
+    return shared.session
+
+
+def shared_session_users(
+    hass: HomeAssistant, session: FritzConnectionVPNSession
+) -> int:
+    """Number of config entries currently using session."""
+    for shared in _shared_sessions(hass).values():
+        if shared.session is session:
+            return len(shared.entry_ids)
+    return 0
+
+
+async def async_release_shared_session(
+    hass: HomeAssistant, session: FritzConnectionVPNSession, entry_id: str
+) -> None:
+    """Drop the entry's reference; close the session once no entry uses it."""
+    sessions = _shared_sessions(hass)
+    for key, shared in sessions.items():
+        if shared.session is not session:
+            continue
+        shared.entry_ids.discard(entry_id)
+        if shared.entry_ids:
+            return
+        del sessions[key]
+        break
+    await session.async_close()
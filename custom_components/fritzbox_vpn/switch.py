@@ -65,10 +65,14 @@ class FritzBoxVPNSwitch(FritzBoxVPNEntity, SwitchEntity):
             connection_data,
             unique_id_suffix=UNIQUE_ID_SUFFIX_SWITCH,
         )
+        # Requested state shown while a toggle is being verified.
+        self._optimistic_is_on: bool | None = None
 
     @property
     def is_on(self) -> bool:
-        """True if the VPN connection is active."""
+        """True if the VPN connection is active (or is being switched on)."""
+        if self._optimistic_is_on is not None:
+            return self._optimistic_is_on
         conn = self._vpn_connection()
         if conn is None:
             return False
@@ -79,16 +83,24 @@ class FritzBoxVPNSwitch(FritzBoxVPNEntity, SwitchEntity):
         """Additional state attributes."""
         return vpn_switch_attributes(self.coordinator, self._connection_uid)
 
+    def _set_optimistic_state(self, is_on: bool | None) -> None:
+        """Show (or drop) the requested state until the toggle is verified."""
+        self._optimistic_is_on = is_on
+        if self.hass is not None:
+            self.async_write_ha_state()
+
     async def _async_toggle_connection(self, enable: bool) -> None:
-        """Turn VPN connection on or off; refresh coordinator afterward."""
+        """Turn VPN connection on or off; the coordinator publishes the result."""
         vpn_name = self._connection_data.get(API_KEY_NAME, DEFAULT_NAME_UNKNOWN)
         action = "on" if enable else "off"
         _LOGGER.info("Turning %s VPN connection: %s", action, vpn_name)
+        self._set_optimistic_state(enable)
         try:
             success = await self.coordinator.toggle_vpn(self._connection_uid, enable)
         except Exception as err:
             raise_toggle_failed(vpn_name, str(err))
-        await self.coordinator.async_request_refresh()
+        finally:
+            self._set_optimistic_state(None)
         if success:
             _LOGGER.info("Successfully turned %s VPN connection: %s", action, vpn_name)
             return
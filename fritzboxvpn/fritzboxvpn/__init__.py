@@ -1,26 +1,54 @@
 """Async library for AVM Fritz!Box WireGuard VPN Web API."""
 
+from .breaker import BreakerState, CircuitBreaker
+from .client import create_client_session
 from .const import API_KEY_ACTIVE, API_KEY_CONNECTED, API_KEY_NAME, API_KEY_UID
 from .parsing import (
     extract_box_connections_from_data,
+    extract_connection_from_rest,
     extract_wireguard_connections_from_rest,
     normalize_box_connections,
     parse_blocktime_from_login_xml,
+    parse_box_connections,
     parse_challenge_from_login_xml,
+    parse_data_lua_listing,
+    parse_rest_listing,
     parse_sid_from_login_response,
 )
-from .session import FritzBoxVPNSession
+from .session import (
+    FritzBoxTransportError,
+    FritzBoxVPNSession,
+    async_probe_login_page,
+    is_connection_refused,
+    is_transport_error,
+)
+from .stats import FritzBoxVPNSessionStats, ListingModeStats
+from .streaming import BoxConnectionsScanner
 
 __all__ = [
     "API_KEY_ACTIVE",
     "API_KEY_CONNECTED",
     "API_KEY_NAME",
     "API_KEY_UID",
+    "BoxConnectionsScanner",
+    "BreakerState",
+    "CircuitBreaker",
+    "FritzBoxTransportError",
     "FritzBoxVPNSession",
+    "FritzBoxVPNSessionStats",
+    "ListingModeStats",
+    "async_probe_login_page",
+    "create_client_session",
     "extract_box_connections_from_data",
+    "extract_connection_from_rest",
     "extract_wireguard_connections_from_rest",
+    "is_connection_refused",
+    "is_transport_error",
     "normalize_box_connections",
     "parse_blocktime_from_login_xml",
+    "parse_box_connections",
     "parse_challenge_from_login_xml",
+    "parse_data_lua_listing",
+    "parse_rest_listing",
     "parse_sid_from_login_response",
 ]
@@ -0,0 +1,104 @@
+"""Circuit breaker that spaces out requests while a Fritz!Box is unreachable."""
+
+from __future__ import annotations
+
+import random
+import time
+from datetime import UTC, datetime
+from enum import StrEnum
+from typing import Any
+
+from .const import (
+    BREAKER_BASE_DELAY,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_JITTER,
+    BREAKER_MAX_DELAY,
+)
+
+
+class BreakerState(StrEnum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Closed → open after repeated transport failures → half-open probe.
+
+    Every failure returns a jittered, exponentially growing delay so several
+    config entries (or integrations) do not retry a rebooting box in lockstep.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        base_delay: float = BREAKER_BASE_DELAY,
+        max_delay: float = BREAKER_MAX_DELAY,
+        jitter: float = BREAKER_JITTER,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self._rng = rng or random.Random()
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        # Monotonic time before which an open breaker refuses requests.
+        self._retry_at: float | None = None
+        # Wall clock twin of _retry_at for diagnostics.
+        self._retry_at_wall: float | None = None
+
+    def _delay(self) -> float:
+        """base * 2^(failures - 1), capped, minus up to ``jitter`` of it."""
+        exponent = min(max(self.failures - 1, 0), 16)
+        delay = min(self.base_delay * (2**exponent), self.max_delay)
+        # Jitter only shortens the delay: never retry later than nominal.
+        return delay * self._rng.uniform(1 - self.jitter, 1.0)
+
+    def seconds_until_retry(self) -> float:
+        """Seconds an open breaker still waits; 0 when a request may go out."""
+        if self._retry_at is None:
+            return 0.0
+        return max(0.0, self._retry_at - time.monotonic())
+
+    def before_request(self) -> BreakerState:
+        """State for the next attempt; an expired open breaker turns half-open."""
+        if self.state is BreakerState.OPEN and self.seconds_until_retry() <= 0:
+            self.state = BreakerState.HALF_OPEN
+        return self.state
+
+    def record_success(self) -> None:
+        """Close the breaker and forget the failure streak."""
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self._retry_at = None
+        self._retry_at_wall = None
+
+    def record_failure(self) -> float:
+        """Count a transport failure; return the delay before the next attempt."""
+        self.failures += 1
+        delay = self._delay()
+        if (
+            self.state is BreakerState.HALF_OPEN
+            or self.failures >= self.failure_threshold
+        ):
+            self.state = BreakerState.OPEN
+        self._retry_at = time.monotonic() + delay
+        self._retry_at_wall = time.time() + delay
+        return delay
+
+    def as_dict(self) -> dict[str, Any]:
+        """Plain dict for diagnostics."""
+        next_attempt = None
+        if self._retry_at_wall is not None and self.state is not BreakerState.CLOSED:
+            next_attempt = datetime.fromtimestamp(self._retry_at_wall, UTC).isoformat()
+        return {
+            "state": str(self.state),
+            "consecutive_failures": self.failures,
+            "next_attempt": next_attempt,
+            "seconds_until_retry": round(self.seconds_until_retry(), 1),
+        }
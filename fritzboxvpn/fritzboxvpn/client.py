@@ -0,0 +1,69 @@
+"""Library-owned aiohttp client tuned for a single Fritz!Box."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from aiohttp import (
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionReuseconnParams,
+)
+
+from .const import (
+    CONNECTOR_DNS_CACHE_TTL,
+    CONNECTOR_KEEPALIVE_TIMEOUT,
+    CONNECTOR_LIMIT,
+    DEFAULT_TIMEOUT,
+)
+from .stats import FritzBoxVPNSessionStats
+
+
+def _connection_trace(stats: FritzBoxVPNSessionStats) -> TraceConfig:
+    """Count new connections (TCP/TLS handshakes) versus pooled reuse."""
+
+    async def _on_create(
+        _session: ClientSession,
+        _ctx: SimpleNamespace,
+        _params: TraceConnectionCreateEndParams,
+    ) -> None:
+        stats.connections_created += 1
+
+    async def _on_reuse(
+        _session: ClientSession,
+        _ctx: SimpleNamespace,
+        _params: TraceConnectionReuseconnParams,
+    ) -> None:
+        stats.connections_reused += 1
+
+    trace = TraceConfig()
+    trace.on_connection_create_end.append(_on_create)
+    trace.on_connection_reuseconn.append(_on_reuse)
+    return trace
+
+
+def create_client_session(
+    stats: FritzBoxVPNSessionStats | None = None,
+) -> ClientSession:
+    """ClientSession with a keep-alive connector for one Fritz!Box host.
+
+    Must be called from a running event loop; the caller owns the session
+    and has to close it (FritzBoxVPNSession.create() does this in async_close).
+    """
+    connector = TCPConnector(
+        limit=CONNECTOR_LIMIT,
+        limit_per_host=CONNECTOR_LIMIT,
+        keepalive_timeout=CONNECTOR_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=CONNECTOR_DNS_CACHE_TTL,
+        # Fritz!Box certificates are self-signed; aiohttp reuses one
+        # unverified SSL context for ssl=False across all connections.
+        ssl=False,
+    )
+    return ClientSession(
+        connector=connector,
+        timeout=ClientTimeout(total=DEFAULT_TIMEOUT),
+        trace_configs=[_connection_trace(stats)] if stats is not None else None,
+    )
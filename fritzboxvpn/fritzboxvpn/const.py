@@ -21,24 +21,75 @@ API_KEY_NAME = "name"
 API_KEY_ACCESS_TYPE = "access_type"
 ACCESS_TYPE_WIREGUARD = "4"
 WIREGUARD_STATE_READY = "ready"
+LOGIN_QUERY_SID = "sid"
 HEADER_CLIENT_NAME = "Client-Name"
 HEADER_VALUE_CLIENT_NAME = "WebGUI"
 LISTING_MODE_DATA_LUA = "data_lua"
 LISTING_MODE_REST = "rest"
 # Prefer legacy data.lua, then FRITZ!OS 8.40+ REST listing.
 LISTING_PROBE_ORDER = (LISTING_MODE_DATA_LUA, LISTING_MODE_REST)
+# The next listing mode joins a still-running probe after this head start.
+LISTING_PROBE_STAGGER = 0.5
+# Weight of the newest sample in the per-mode latency average.
+LISTING_LATENCY_SMOOTHING = 0.3
+# data.lua listings are scanned in chunks of this many bytes as they arrive.
+LISTING_READ_CHUNK_SIZE = 64 * 1024
+
+# Keys of the persisted session state (export_state / restore_state).
+STATE_KEY_SID = "sid"
+STATE_KEY_SID_VALIDATED_AT = "sid_validated_at"
+STATE_KEY_PROTOCOL = "protocol"
+STATE_KEY_LISTING_MODE = "listing_mode"
+STATE_KEY_FIRMWARE_FINGERPRINT = "firmware_fingerprint"
+LOGIN_FINGERPRINT_MD5 = "md5"
 
 DEFAULT_TIMEOUT = 10
 DEFAULT_PROTOCOL = "https"
 VERIFICATION_DELAY = 1.5
+# Toggle verification polls the single-connection REST endpoint with
+# exponential backoff (seconds) until the new state shows or time runs out.
+TOGGLE_VERIFY_INITIAL_DELAY = 0.25
+TOGGLE_VERIFY_MAX_DELAY = 1.0
+TOGGLE_VERIFY_TIMEOUT = 5.0
+# A listing this recent (seconds) serves the pre-check of a toggle.
+LISTING_CACHE_MAX_AGE = 30
+# Concurrent PUTs of async_set_vpn_states().
+SET_STATES_CONCURRENCY = 4
+# FRITZ!OS drops a SID after 20 minutes without renewal.
+SID_INACTIVITY_TIMEOUT = 1200
+# Keep-alive renews the SID this long before the inactivity timeout.
+SID_REFRESH_MARGIN = 300
+# Wait after a failed keep-alive before trying again.
+SID_REFRESH_RETRY_DELAY = 60
+# First-stage PBKDF2 hashes kept per session; FRITZ!OS keeps salt1/iter1 fixed.
+PBKDF2_STAGE1_CACHE_SIZE = 4
+# Library-owned HTTP client (create_client_session): the box's embedded web
+# server handles few parallel connections and slow TLS handshakes.
+CONNECTOR_LIMIT = 4
+CONNECTOR_KEEPALIVE_TIMEOUT = 60
+CONNECTOR_DNS_CACHE_TTL = 300
+# Circuit breaker: open after this many consecutive transport failures, then
+# wait base * 2^n seconds (capped, up to jitter shorter) before a cheap
+# reachability probe.
+BREAKER_FAILURE_THRESHOLD = 2
+BREAKER_BASE_DELAY = 60
+BREAKER_MAX_DELAY = 300
+BREAKER_JITTER = 0.2
+# HEAD on login_sid.lua while half-open.
+REACHABILITY_PROBE_TIMEOUT = 3
 
 PROTOCOL_HTTP = "http"
 PROTOCOL_HTTPS = "https"
 PROTOCOLS_ALLOWED = (PROTOCOL_HTTP, PROTOCOL_HTTPS)
+# HTTPS gets this head start before HTTP joins the login-page race.
+PROTOCOL_RACE_STAGGER = 0.3
+# A race winner is kept across invalidations for this long, then re-probed.
+PROTOCOL_REPROBE_INTERVAL = 3600
 CONTENT_TYPE_JSON = "json"
 
 HTTP_STATUS_OK = 200
 HTTP_STATUS_FORBIDDEN = 403
+HTTP_STATUS_SERVER_ERROR = 500
 HTTP_STATUS_NOT_FOUND = 404
 HTTPS_FALLBACK_STATUS_CODES = (400, HTTP_STATUS_NOT_FOUND, 502, 503)
 
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import xml.etree.ElementTree as ET
+from collections.abc import Iterable
 from typing import Any
 
 from .const import (
@@ -28,8 +30,15 @@ from .const import (
     WIREGUARD_STATE_READY,
 )
 
+try:
+    import orjson
+except ImportError:  # optional speed-up (the "fast" extra)
+    orjson = None
+
 _LOGGER = logging.getLogger(__name__)
 
+_UTF8_CHARSETS = ("utf-8", "utf8")
+
 
 def connection_active_from_api(conn: dict[str, Any]) -> bool:
     """Active state from API (active/activated, int/str/bool)."""
@@ -57,16 +66,37 @@ def normalize_connection_uid(raw_uid: Any) -> str | None:
     return uid
 
 
-def normalize_box_connections(box: Any) -> dict[str, Any]:
-    """API boxConnections (list or dict) → dict keyed by uid with normalized active."""
-    result: dict[str, Any] = {}
+def _box_items(box: Any) -> Iterable[tuple[Any, Any]]:
+    """(dict key or None, entry) pairs of a boxConnections list or dict."""
     if isinstance(box, dict):
-        items_with_keys = box.items()
-    elif isinstance(box, list):
-        items_with_keys = ((None, c) for c in box)
-    else:
-        items_with_keys = ()
-    for dict_key, c in items_with_keys:
+        return box.items()
+    if isinstance(box, list):
+        return ((None, c) for c in box)
+    return ()
+
+
+def _store_connection(
+    result: dict[str, Any], uid: str, raw_uid: Any, entry: dict[str, Any]
+) -> None:
+    """Add one normalized entry; the latest payload wins on duplicate uids."""
+    if uid in result:
+        _LOGGER.warning(
+            "Duplicate VPN uid detected after normalization: %r. Latest payload wins.",
+            uid,
+        )
+    elif isinstance(raw_uid, str) and raw_uid != uid:
+        _LOGGER.debug(
+            "Normalized VPN uid from %r to %r",
+            raw_uid,
+            uid,
+        )
+    result[uid] = entry
+
+
+def _normalize_entries(box: Any, *, copy: bool) -> dict[str, Any]:
+    """Single pass over boxConnections; copy=False updates the entries in place."""
+    result: dict[str, Any] = {}
+    for dict_key, c in _box_items(box):
         if not isinstance(c, dict):
             continue
         raw_uid = c.get(API_KEY_UID)
@@ -77,24 +107,19 @@ def normalize_box_connections(box: Any) -> dict[str, Any]:
         uid = normalize_connection_uid(raw_uid)
         if uid is None:
             continue
-        entry = dict(c)
+        active = connection_active_from_api(c)
+        entry = dict(c) if copy else c
         entry[API_KEY_UID] = uid
-        entry[API_KEY_ACTIVE] = connection_active_from_api(c)
-        if uid in result:
-            _LOGGER.warning(
-                "Duplicate VPN uid detected after normalization: %r. Latest payload wins.",
-                uid,
-            )
-        elif isinstance(raw_uid, str) and raw_uid != uid:
-            _LOGGER.debug(
-                "Normalized VPN uid from %r to %r",
-                raw_uid,
-                uid,
-            )
-        result[uid] = entry
+        entry[API_KEY_ACTIVE] = active
+        _store_connection(result, uid, raw_uid, entry)
     return result
 
 
+def normalize_box_connections(box: Any) -> dict[str, Any]:
+    """API boxConnections (list or dict) → dict keyed by uid with normalized active."""
+    return _normalize_entries(box, copy=True)
+
+
 def parse_challenge_from_login_xml(content: str) -> str | None:
     """Challenge from login_sid.lua XML; None if missing or parse error."""
     if not (content and content.strip()):
@@ -131,6 +156,31 @@ def parse_blocktime_from_login_xml(content: str) -> int | None:
         return None
 
 
+def is_utf8_charset(charset: str | None) -> bool:
+    """True for an absent or UTF-8 charset (JSON's default encoding)."""
+    return not charset or charset.lower() in _UTF8_CHARSETS
+
+
+def decode_json_body(body: bytes, charset: str | None = None) -> Any:
+    """Decode a raw JSON response body; ValueError when it is not valid JSON.
+
+    Uses orjson when installed; the stdlib parser is the fallback and also
+    retries what orjson rejects (e.g. a UTF-8 BOM). Bodies in a declared
+    non-UTF-8 charset are decoded to text first.
+    """
+    if not is_utf8_charset(charset):
+        try:
+            return json.loads(body.decode(charset))
+        except LookupError:
+            pass
+    if orjson is not None:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(body)
+
+
 def describe_json_value(value: Any, *, max_keys: int = 20) -> dict[str, Any]:
     """Return a small summary for debug logs (no full payload)."""
     if isinstance(value, dict):
@@ -176,6 +226,8 @@ def extract_box_connections_from_data(data: dict[str, Any], page: str) -> Any:
         if box_connections is not None:
             return box_connections
 
+    if not _LOGGER.isEnabledFor(logging.DEBUG):
+        return None
     _LOGGER.debug(
         "Could not extract boxConnections from data.lua JSON. data.lua structure summary=%s",
         {
@@ -231,6 +283,49 @@ def _rest_wireguard_entry(conn: dict[str, Any]) -> dict[str, Any] | None:
     }
 
 
+def extract_connection_from_rest(data: dict[str, Any]) -> dict[str, Any] | None:
+    """Extract one connection from GET /api/v0/generic/vpn/connection/<uid> JSON.
+
+    Accepts the bare connection object or one wrapped in ``connection``.
+    Returns None when neither carries an activation state.
+    """
+    if not isinstance(data, dict):
+        return None
+    conn: Any = data
+    if API_KEY_ACTIVATED not in conn and API_KEY_ACTIVE not in conn:
+        conn = data.get(API_KEY_CONNECTION)
+        if isinstance(conn, list) and len(conn) == 1:
+            conn = conn[0]
+    if not isinstance(conn, dict) or (
+        API_KEY_ACTIVATED not in conn and API_KEY_ACTIVE not in conn
+    ):
+        return None
+    return {
+        API_KEY_UID: conn.get(API_KEY_UID, conn.get(API_KEY_UID_REST)),
+        API_KEY_NAME: conn.get(API_KEY_NAME),
+        API_KEY_ACTIVE: connection_active_from_api(conn),
+        API_KEY_CONNECTED: _connection_connected_from_rest(conn),
+    }
+
+
+def _rest_connection_list(data: dict[str, Any]) -> list[Any] | None:
+    """The ``connection`` list of a REST VPN listing; None when absent."""
+    raw_connections = data.get(API_KEY_CONNECTION)
+    if raw_connections is None:
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Could not extract connection list from REST VPN JSON. structure summary=%s",
+                {
+                    "data_keys": list(data.keys())[:50],
+                    "connection": describe_json_value(raw_connections),
+                },
+            )
+        return None
+    if not isinstance(raw_connections, list):
+        return None
+    return raw_connections
+
+
 def extract_wireguard_connections_from_rest(
     data: dict[str, Any],
 ) -> list[dict[str, Any]] | None:
@@ -241,17 +336,8 @@ def extract_wireguard_connections_from_rest(
     """
     if not isinstance(data, dict):
         return None
-    raw_connections = data.get(API_KEY_CONNECTION)
+    raw_connections = _rest_connection_list(data)
     if raw_connections is None:
-        _LOGGER.debug(
-            "Could not extract connection list from REST VPN JSON. structure summary=%s",
-            {
-                "data_keys": list(data.keys())[:50],
-                "connection": describe_json_value(data.get(API_KEY_CONNECTION)),
-            },
-        )
-        return None
-    if not isinstance(raw_connections, list):
         return None
 
     result: list[dict[str, Any]] = []
@@ -262,3 +348,63 @@ def extract_wireguard_connections_from_rest(
         if entry is not None:
             result.append(entry)
     return result
+
+
+def parse_data_lua_listing(data: dict[str, Any], page: str) -> dict[str, Any] | None:
+    """data.lua JSON → normalized connections, None when boxConnections is absent.
+
+    Same result as normalize_box_connections(extract_box_connections_from_data())
+    but the entries are normalized in place, so ``data`` must be owned by the
+    caller (e.g. fresh json.loads output).
+    """
+    box = extract_box_connections_from_data(data, page)
+    if box is None:
+        return None
+    return parse_box_connections(box)
+
+
+def parse_box_connections(box: Any) -> dict[str, Any]:
+    """Decoded boxConnections → normalized connections, entries updated in place.
+
+    Same result as normalize_box_connections() for a ``box`` owned by the
+    caller, e.g. what BoxConnectionsScanner.finish() returned.
+    """
+    return _normalize_entries(box, copy=False)
+
+
+def parse_rest_listing(data: dict[str, Any]) -> dict[str, Any] | None:
+    """REST VPN JSON → normalized WireGuard connections in one pass.
+
+    Same result as normalize_box_connections(extract_wireguard_connections_from_rest()).
+    """
+    if not isinstance(data, dict):
+        return None
+    raw_connections = _rest_connection_list(data)
+    if raw_connections is None:
+        return None
+
+    result: dict[str, Any] = {}
+    for conn in raw_connections:
+        if not isinstance(conn, dict):
+            continue
+        if str(conn.get(API_KEY_ACCESS_TYPE)).strip() != ACCESS_TYPE_WIREGUARD:
+            continue
+        raw_uid = conn.get(API_KEY_UID)
+        if raw_uid is None:
+            raw_uid = conn.get(API_KEY_UID_REST)
+        uid = normalize_connection_uid(raw_uid)
+        if uid is None:
+            continue
+        _store_connection(
+            result,
+            uid,
+            raw_uid,
+            {
+                API_KEY_UID: uid,
+                API_KEY_NAME: conn.get(API_KEY_NAME),
+                API_KEY_ACTIVATED: conn.get(API_KEY_ACTIVATED),
+                API_KEY_ACTIVE: connection_active_from_api(conn),
+                API_KEY_CONNECTED: _connection_connected_from_rest(conn),
+            },
+        )
+    return result
@@ -3,20 +3,26 @@
 from __future__ import annotations
 
 import asyncio
+import errno
 import hashlib
-import json
 import logging
-from typing import Any, NoReturn
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine, Mapping, Sequence
+from contextlib import suppress
+from typing import Any, NoReturn, TypeVar
 from urllib.parse import urlsplit
 
 from aiohttp import (
     ClientConnectorError,
+    ClientError,
     ClientResponse,
     ClientSession,
     ClientTimeout,
     hdrs,
 )
 
+from .client import create_client_session
 from .const import (
     API_DATA,
     API_KEY_ACTIVATED,
@@ -43,32 +49,187 @@ from .const import (
     HTTP_STATUS_FORBIDDEN,
     HTTP_STATUS_NOT_FOUND,
     HTTP_STATUS_OK,
+    HTTP_STATUS_SERVER_ERROR,
     HTTPS_FALLBACK_STATUS_CODES,
     INVALID_SID_VALUE,
+    LISTING_CACHE_MAX_AGE,
+    LISTING_LATENCY_SMOOTHING,
     LISTING_MODE_DATA_LUA,
     LISTING_MODE_REST,
     LISTING_PROBE_ORDER,
+    LISTING_PROBE_STAGGER,
+    LISTING_READ_CHUNK_SIZE,
     LOG_LABEL_ACTIVATED,
     LOG_LABEL_DEACTIVATED,
+    LOGIN_FINGERPRINT_MD5,
     LOGIN_FORM_RESPONSE,
     LOGIN_FORM_USERNAME,
+    LOGIN_QUERY_SID,
     NAME_FRITZBOX,
+    PBKDF2_STAGE1_CACHE_SIZE,
     PROTOCOL_HTTP,
     PROTOCOL_HTTPS,
+    PROTOCOL_RACE_STAGGER,
+    PROTOCOL_REPROBE_INTERVAL,
     PROTOCOLS_ALLOWED,
+    REACHABILITY_PROBE_TIMEOUT,
+    SET_STATES_CONCURRENCY,
+    SID_INACTIVITY_TIMEOUT,
+    SID_REFRESH_MARGIN,
+    SID_REFRESH_RETRY_DELAY,
+    STATE_KEY_FIRMWARE_FINGERPRINT,
+    STATE_KEY_LISTING_MODE,
+    STATE_KEY_PROTOCOL,
+    STATE_KEY_SID,
+    STATE_KEY_SID_VALIDATED_AT,
+    TOGGLE_VERIFY_INITIAL_DELAY,
+    TOGGLE_VERIFY_MAX_DELAY,
+    TOGGLE_VERIFY_TIMEOUT,
     VERIFICATION_DELAY,
 )
 from .parsing import (
-    extract_box_connections_from_data,
-    extract_wireguard_connections_from_rest,
-    normalize_box_connections,
+    decode_json_body,
+    extract_connection_from_rest,
+    is_utf8_charset,
     parse_blocktime_from_login_xml,
+    parse_box_connections,
     parse_challenge_from_login_xml,
+    parse_data_lua_listing,
+    parse_rest_listing,
     parse_sid_from_login_response,
 )
+from .stats import FritzBoxVPNSessionStats, ListingModeStats
+from .streaming import BoxConnectionsScanner
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# ClientTimeout is immutable; build it once instead of per request.
+_REQUEST_TIMEOUT = ClientTimeout(total=DEFAULT_TIMEOUT)
+
+# Starts a named background task, e.g. hass.async_create_background_task.
+TaskFactory = Callable[[Coroutine[Any, Any, None], str], "asyncio.Task[None]"]
+
+_FLIGHT_LOGIN = "login"
+_FLIGHT_VALIDATE_RESTORED = "validate_restored"
+_FLIGHT_LISTING_PROBE = "listing_probe"
+
+
+def _login_fingerprint(challenge: str) -> str:
+    """Stable login-flavour marker; changes when a firmware update alters login."""
+    parts = challenge.split("$")
+    if len(parts) >= 5 and parts[0] == "2":
+        digest = hashlib.sha256(f"{parts[1]}${parts[2]}".encode()).hexdigest()
+        return f"pbkdf2:{digest[:16]}"
+    return LOGIN_FINGERPRINT_MD5
+
+
+def _body_fingerprint(body: bytes) -> bytes:
+    """Short digest of a raw listing body to spot byte-identical polls."""
+    return hashlib.blake2b(body, digest_size=16).digest()
+
+
+class _LoginPageStatusError(ConnectionError):
+    """Login page answered with a non-200 status."""
+
+    def __init__(self, status: int) -> None:
+        super().__init__(f"Failed to get login page: {status}")
+        self.status = status
+
+
+def _https_answer_is_final(task: asyncio.Task[str]) -> bool:
+    """True when a finished HTTPS request settles the race on its own.
+
+    Success does, and so does any status outside HTTPS_FALLBACK_STATUS_CODES
+    (e.g. 401/403): the HTTPS server is up, so HTTP must not win.
+    """
+    err = task.exception()
+    return err is None or (
+        isinstance(err, _LoginPageStatusError)
+        and err.status not in HTTPS_FALLBACK_STATUS_CODES
+    )
+
+
+class FritzBoxTransportError(ConnectionError):
+    """The box could not be reached: refused, reset, timed out or unresolvable.
+
+    A plain ConnectionError means the box did answer, with an unexpected
+    HTTP status or without the expected payload.
+    """
+
+
+def is_transport_error(err: BaseException | None) -> bool:
+    """True if err or an exception it was raised from is a transport failure.
+
+    The builtin ConnectionError subclasses OSError but, raised on its own,
+    reports an HTTP status or payload problem; it does not count.
+    """
+    seen: set[int] = set()
+    while err is not None and id(err) not in seen:
+        seen.add(id(err))
+        if isinstance(err, FritzBoxTransportError | ClientError):
+            return True
+        if isinstance(err, OSError) and (
+            not isinstance(err, ConnectionError)
+            or isinstance(
+                err,
+                ConnectionRefusedError
+                | ConnectionResetError
+                | ConnectionAbortedError
+                | BrokenPipeError,
+            )
+        ):
+            return True
+        err = err.__cause__
+    return False
+
+
+def is_connection_refused(err: BaseException | None) -> bool:
+    """True if err or anything in its cause chain is a refused TCP connection.
+
+    A refused port is evidence of a restarting web server (reboot); unlike
+    timeouts and resets it justifies dropping the cached SID and protocol.
+    """
+    seen: set[int] = set()
+    while err is not None and id(err) not in seen:
+        seen.add(id(err))
+        if isinstance(err, ConnectionRefusedError) or (
+            isinstance(err, OSError) and err.errno == errno.ECONNREFUSED
+        ):
+            return True
+        err = err.__cause__ or err.__context__
+    return False
+
+
+async def async_probe_login_page(
+    session: ClientSession, host: str, protocols: Sequence[str]
+) -> str | None:
+    """HEAD login_sid.lua per protocol; the first that answers, else None.
+
+    Any non-5xx answer means the box's web server is up again. No login,
+    no SID; cheap enough to run while a circuit breaker is half-open.
+    """
+    timeout = ClientTimeout(total=REACHABILITY_PROBE_TIMEOUT)
+    for protocol in protocols:
+        try:
+            async with session.head(
+                f"{protocol}://{host}{API_LOGIN}",
+                timeout=timeout,
+                ssl=False,
+                allow_redirects=False,
+            ) as response:
+                if response.status < HTTP_STATUS_SERVER_ERROR:
+                    return protocol
+        except (ClientError, OSError):
+            continue
+    return None
+
+
+def _pbkdf2_sha256(secret: bytes, salt_hex: str, iterations: int) -> bytes:
+    """One PBKDF2-HMAC-SHA256 stage of the FRITZ!OS version=2 login."""
+    return hashlib.pbkdf2_hmac("sha256", secret, bytes.fromhex(salt_hex), iterations)
+
 
 class FritzBoxVPNSession:
     """Session manager for Fritz!Box Web-UI API."""
@@ -80,6 +241,10 @@ class FritzBoxVPNSession:
         username: str,
         password: str,
         protocol: str = DEFAULT_PROTOCOL,
+        *,
+        keepalive: bool = False,
+        stream_listing: bool = False,
+        create_task: TaskFactory | None = None,
     ) -> None:
         self.session = session
         self.host = host
@@ -88,6 +253,67 @@ class FritzBoxVPNSession:
         self.protocol = protocol if protocol in PROTOCOLS_ALLOWED else DEFAULT_PROTOCOL
         self.sid: str | None = None
         self._listing_mode: str | None = None
+        # (monotonic time, copy of the last successful listing).
+        self._listing_cache: tuple[float, dict[str, Any]] | None = None
+        # (listing mode, body digest, normalized result) of the last parsed body.
+        self._listing_body: tuple[str, bytes, dict[str, Any]] | None = None
+        # True when the last listing body matched the previous one byte for byte
+        # and the previous normalized result object was returned unchanged.
+        self.listing_unchanged = False
+        # Monotonic time the HTTPS/HTTP race last picked self.protocol.
+        self._protocol_probed_at: float | None = None
+        # Wall clock so the value survives a restart via export_state().
+        self._sid_validated_at: float | None = None
+        self._firmware_fingerprint: str | None = None
+        self._restored_sid_unverified = False
+        # (password fingerprint, salt1, iter1) -> first-stage PBKDF2 hash.
+        self._pbkdf2_stage1_cache: OrderedDict[tuple[bytes, str, int], bytes] = (
+            OrderedDict()
+        )
+        # Shared in-flight work (login, listing probe) keyed by operation.
+        self._in_flight: dict[str, asyncio.Task[Any]] = {}
+        self.stats = FritzBoxVPNSessionStats()
+        # Optional background SID renewal, started with the first login.
+        self._keepalive = keepalive
+        self._keepalive_task: asyncio.Task[None] | None = None
+        # Lets the host application own the keep-alive task (and its lifetime).
+        self._create_task = create_task
+        # Scan data.lua listings in chunks instead of decoding the whole page.
+        self._stream_listing = stream_listing
+        # True when self.session came from create() and must be closed here.
+        self._owns_session = False
+
+    @classmethod
+    def create(
+        cls,
+        host: str,
+        username: str,
+        password: str,
+        protocol: str = DEFAULT_PROTOCOL,
+        *,
+        keepalive: bool = False,
+        stream_listing: bool = False,
+        create_task: TaskFactory | None = None,
+    ) -> FritzBoxVPNSession:
+        """Session with its own keep-alive HTTP client, closed by async_close.
+
+        Call from a running event loop. Connection reuse versus new
+        handshakes is counted in stats.connections_reused/created.
+        """
+        stats = FritzBoxVPNSessionStats()
+        fritz = cls(
+            create_client_session(stats),
+            host,
+            username,
+            password,
+            protocol,
+            keepalive=keepalive,
+            stream_listing=stream_listing,
+            create_task=create_task,
+        )
+        fritz.stats = stats
+        fritz._owns_session = True
+        return fritz
 
     def _base_url(self) -> str:
         """Protocol + host origin for REST URLs and browser-like headers."""
@@ -115,9 +341,8 @@ class FritzBoxVPNSession:
             headers[hdrs.REFERER] = f"{base}/"
         return headers
 
-    @staticmethod
-    async def _response_json_dict(
-        response: ClientResponse, *, require_json: bool = False
+    def _response_json_dict(
+        self, response: ClientResponse, body: bytes, *, require_json: bool = False
     ) -> dict[str, Any] | None:
         """Parse response body as a JSON object; None when contract is absent."""
         content_type = (response.headers.get(hdrs.CONTENT_TYPE) or "").lower()
@@ -125,12 +350,15 @@ class FritzBoxVPNSession:
             if require_json:
                 raise ValueError(ERROR_MSG_INVALID_SID_HTML)
             return None
+        started = time.perf_counter()
         try:
-            data = json.loads(await response.text())
-        except (json.JSONDecodeError, TypeError) as err:
+            data = decode_json_body(body, response.charset)
+        except (ValueError, TypeError) as err:
             if require_json:
                 raise ValueError(ERROR_MSG_INVALID_SID_HTML) from err
             return None
+        finally:
+            self.stats.record_json_decode(time.perf_counter() - started, len(body))
         if isinstance(data, dict):
             return data
         return None
@@ -150,12 +378,105 @@ class FritzBoxVPNSession:
                 f"Failed to get VPN connections{source}: HTTP {response.status}"
             )
 
+    def _record_listing_cost(self, mode: str, started: float, size: int) -> None:
+        """Update the latency/size record of a listing mode that just worked."""
+        record = self.stats.listing_modes.setdefault(mode, ListingModeStats())
+        record.record(time.monotonic() - started, size, LISTING_LATENCY_SMOOTHING)
+
+    def _unchanged_listing(
+        self, mode: str, started: float, body: bytes, size: int
+    ) -> tuple[bytes, dict[str, Any] | None]:
+        """Body digest plus the previous result when the body is byte-identical.
+
+        ``body`` is what the result is parsed from (the whole REST body, or
+        just the boxConnections JSON of a data.lua page); ``size`` is the
+        number of bytes received.
+        """
+        digest = _body_fingerprint(body)
+        previous = self._listing_body
+        if previous is None or previous[0] != mode or previous[1] != digest:
+            return digest, None
+        self._record_listing_cost(mode, started, size)
+        self.stats.listings_unchanged += 1
+        return digest, previous[2]
+
+    def _remember_listing(
+        self,
+        mode: str,
+        started: float,
+        size: int,
+        digest: bytes,
+        connections: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Keep a changed, parsed listing for the next comparison."""
+        self._record_listing_cost(mode, started, size)
+        self._listing_body = (mode, digest, connections)
+        return connections
+
+    def _listing_probe_order(self, skip: str | None = None) -> list[str]:
+        """Known-working modes cheapest first, then the remaining default order."""
+        measured = sorted(
+            (mode for mode in LISTING_PROBE_ORDER if mode in self.stats.listing_modes),
+            key=lambda mode: self.stats.listing_modes[mode].latency,
+        )
+        order = [
+            *measured,
+            *(mode for mode in LISTING_PROBE_ORDER if mode not in measured),
+        ]
+        return [mode for mode in order if mode != skip]
+
+    @property
+    def preferred_listing_mode(self) -> str | None:
+        """Listing mode in use, else the cheapest one seen working; None if unknown."""
+        if self._listing_mode is not None:
+            return self._listing_mode
+        order = self._listing_probe_order()
+        if order and order[0] in self.stats.listing_modes:
+            return order[0]
+        return None
+
+    def _single_flight(
+        self, key: str, factory: Callable[[], Coroutine[Any, Any, _T]]
+    ) -> tuple[asyncio.Task[_T], bool]:
+        """Return the in-flight task for key (joined=True) or start a new one."""
+        task = self._in_flight.get(key)
+        if task is not None and not task.done():
+            return task, True
+        task = asyncio.create_task(factory())
+        self._in_flight[key] = task
+
+        def _done(finished: asyncio.Task[_T]) -> None:
+            if self._in_flight.get(key) is finished:
+                del self._in_flight[key]
+            # Callers may have been cancelled; never leave the error unretrieved.
+            if not finished.cancelled():
+                finished.exception()
+
+        task.add_done_callback(_done)
+        return task, False
+
     async def async_get_session(self) -> tuple[ClientSession, str]:
-        """Return session and SID; reuse cached SID if valid."""
+        """Return session and SID; concurrent logins share one challenge-response."""
+        if self.sid is not None and self._restored_sid_unverified:
+            task, _ = self._single_flight(
+                _FLIGHT_VALIDATE_RESTORED, self._async_validate_restored_sid
+            )
+            await asyncio.shield(task)
         if self.sid is not None:
             return self.session, self.sid
 
-        timeout = ClientTimeout(total=DEFAULT_TIMEOUT)
+        task, joined = self._single_flight(_FLIGHT_LOGIN, self._async_login)
+        if joined:
+            self.stats.logins_coalesced += 1
+            _LOGGER.debug("Joining in-flight %s login.", NAME_FRITZBOX)
+        else:
+            self.stats.logins += 1
+        sid = await asyncio.shield(task)
+        return self.session, sid
+
+    async def _async_login(self) -> str:
+        """Run PBKDF2 (or legacy MD5) challenge-response and cache the SID."""
+        timeout = _REQUEST_TIMEOUT
 
         sid = None
         try:
@@ -167,8 +488,8 @@ class FritzBoxVPNSession:
 
         if sid:
             _LOGGER.debug("Using PBKDF2 login flow for session generation.")
-            self.sid = sid
-            return self.session, self.sid
+            self._set_sid(sid)
+            return sid
         if sid is None:
             _LOGGER.debug(
                 "PBKDF2 not supported by this Fritz!OS (or challenge format mismatch); "
@@ -193,6 +514,7 @@ class FritzBoxVPNSession:
             raise ValueError("Could not parse login response XML or find challenge")
 
         _LOGGER.debug("Using legacy MD5 login flow for session generation.")
+        self._firmware_fingerprint = LOGIN_FINGERPRINT_MD5
 
         md5_input = f"{challenge}-{self.password}".encode("utf-16le")
         # codeql[py/weak-sensitive-data-hashing]: FRITZ!Box legacy login protocol requires MD5 challenge-response.
@@ -220,8 +542,170 @@ class FritzBoxVPNSession:
             raise ValueError(
                 ERROR_MSG_LOGIN_FAILED_SID.format(name_fritzbox=NAME_FRITZBOX)
             )
+        self._set_sid(sid)
+        return sid
+
+    def _set_sid(self, sid: str) -> None:
+        """Cache a freshly issued or confirmed SID."""
         self.sid = sid
-        return self.session, self.sid
+        self._sid_validated_at = time.time()
+        self._restored_sid_unverified = False
+        self._ensure_keepalive()
+
+    def _note_sid_used(self, sid: str) -> None:
+        """An authenticated request succeeded, so FRITZ!OS renewed the SID."""
+        if self.sid == sid:
+            self._sid_validated_at = time.time()
+
+    def _ensure_keepalive(self) -> None:
+        """Start the SID keep-alive task once, if enabled.
+
+        Uses the create_task factory when one was given, so the application
+        tracks the task; async_close() cancels it either way.
+        """
+        if not self._keepalive:
+            return
+        if self._keepalive_task is not None and not self._keepalive_task.done():
+            return
+        name = f"fritzboxvpn SID keep-alive for {self.host}"
+        if self._create_task is not None:
+            self._keepalive_task = self._create_task(self._async_keepalive_loop(), name)
+        else:
+            self._keepalive_task = asyncio.create_task(
+                self._async_keepalive_loop(), name=name
+            )
+
+    def _keepalive_delay(self) -> float:
+        """Seconds until the cached SID should be renewed."""
+        interval = SID_INACTIVITY_TIMEOUT - SID_REFRESH_MARGIN
+        if self.sid is None or self._sid_validated_at is None:
+            return interval
+        due = self._sid_validated_at + interval - time.time()
+        return min(max(due, 0.0), interval)
+
+    async def _async_keepalive_loop(self) -> None:
+        """Renew the SID before FRITZ!OS drops it for inactivity.
+
+        Requests that used the SID in the meantime push the renewal back, so
+        the check only goes out while the session is idle.
+        """
+        delay = self._keepalive_delay()
+        while True:
+            await asyncio.sleep(delay)
+            delay = self._keepalive_delay()
+            if delay > 0:
+                continue
+            if await self._async_keepalive_once():
+                delay = self._keepalive_delay()
+            else:
+                delay = max(self._keepalive_delay(), SID_REFRESH_RETRY_DELAY)
+
+    async def _async_keepalive_once(self) -> bool:
+        """One keep-alive round; False when the box could not be reached."""
+        sid = self.sid
+        if sid is None:
+            return True
+        try:
+            if await self._async_check_sid(sid):
+                self.stats.sid_refreshes += 1
+                return True
+            _LOGGER.debug("Keep-alive found an expired SID; logging in again.")
+            if self.sid == sid:
+                self.sid = None
+                self._sid_validated_at = None
+            self.stats.sid_refresh_relogins += 1
+            await self.async_get_session()
+        except (ConnectionError, ValueError, TimeoutError) as err:
+            # Polls surface real outages; keep the SID for transient failures.
+            _LOGGER.debug("SID keep-alive failed: %s", err)
+            self.stats.sid_refresh_failures += 1
+            return False
+        return True
+
+    async def _async_check_sid(self, sid: str) -> bool:
+        """Cheap ``login_sid.lua?sid=`` check; FRITZ!OS also renews a valid SID."""
+        timeout = _REQUEST_TIMEOUT
+        url = f"{self._login_url(version2=True)}&{LOGIN_QUERY_SID}={sid}"
+        content = await self._fetch_login_page(url, timeout)
+        if not content:
+            return False
+        challenge = parse_challenge_from_login_xml(content)
+        if challenge:
+            fingerprint = _login_fingerprint(challenge)
+            if (
+                self._firmware_fingerprint is not None
+                and fingerprint != self._firmware_fingerprint
+            ):
+                _LOGGER.debug(
+                    "%s login fingerprint changed; rediscovering listing mode.",
+                    NAME_FRITZBOX,
+                )
+                self._listing_mode = None
+            self._firmware_fingerprint = fingerprint
+        if parse_sid_from_login_response(content) != sid:
+            return False
+        if self.sid == sid:
+            self._set_sid(sid)
+        return True
+
+    async def _async_validate_restored_sid(self) -> None:
+        """Confirm a SID restored from persisted state before first use."""
+        sid = self.sid
+        self._restored_sid_unverified = False
+        if sid is None:
+            return
+        try:
+            valid = await self._async_check_sid(sid)
+        except (ConnectionError, ValueError) as err:
+            # A normal login follows and surfaces real outages itself.
+            _LOGGER.debug("Restored SID check failed: %s", err)
+            valid = False
+        if not valid and self.sid == sid:
+            _LOGGER.debug("Restored SID is no longer valid; logging in again.")
+            self.sid = None
+            self._sid_validated_at = None
+
+    def export_state(self) -> dict[str, Any]:
+        """Session state worth persisting across restarts (contains the SID)."""
+        return {
+            STATE_KEY_SID: self.sid,
+            STATE_KEY_SID_VALIDATED_AT: self._sid_validated_at,
+            STATE_KEY_PROTOCOL: self.protocol,
+            STATE_KEY_LISTING_MODE: self._listing_mode,
+            STATE_KEY_FIRMWARE_FINGERPRINT: self._firmware_fingerprint,
+        }
+
+    def restore_state(self, state: Mapping[str, Any]) -> bool:
+        """Apply state from export_state(); True when a SID was restored.
+
+        Protocol, listing mode and fingerprint are always taken over. The SID
+        is only restored while FRITZ!OS could still consider it active, and is
+        re-checked with one cheap login_sid.lua request before first use.
+        """
+        protocol = state.get(STATE_KEY_PROTOCOL)
+        if protocol in PROTOCOLS_ALLOWED:
+            self.protocol = protocol
+        listing_mode = state.get(STATE_KEY_LISTING_MODE)
+        if listing_mode in LISTING_PROBE_ORDER:
+            self._listing_mode = listing_mode
+        fingerprint = state.get(STATE_KEY_FIRMWARE_FINGERPRINT)
+        if isinstance(fingerprint, str):
+            self._firmware_fingerprint = fingerprint
+
+        sid = state.get(STATE_KEY_SID)
+        validated_at = state.get(STATE_KEY_SID_VALIDATED_AT)
+        if (
+            not isinstance(sid, str)
+            or not sid
+            or sid == INVALID_SID_VALUE
+            or not isinstance(validated_at, int | float)
+            or time.time() - validated_at >= SID_INACTIVITY_TIMEOUT
+        ):
+            return False
+        self.sid = sid
+        self._sid_validated_at = float(validated_at)
+        self._restored_sid_unverified = True
+        return True
 
     async def _try_get_session_via_pbkdf2(self, timeout: ClientTimeout) -> str | None:
         """Return valid SID via pbkdf2 challenge-response, or None if unsupported."""
@@ -236,13 +720,14 @@ class FritzBoxVPNSession:
                 "PBKDF2 not supported (challenge format mismatch); falling back."
             )
             return None
+        self._firmware_fingerprint = _login_fingerprint(challenge)
 
         blocktime = parse_blocktime_from_login_xml(content)
         if blocktime and blocktime > 0:
             _LOGGER.debug("PBKDF2 BlockTime=%d; waiting before login.", blocktime)
             await asyncio.sleep(blocktime)
 
-        response = self._calculate_pbkdf2_response(challenge, self.password)
+        response = await self._async_pbkdf2_response(challenge)
         login_data = {
             LOGIN_FORM_USERNAME: self.username,
             LOGIN_FORM_RESPONSE: response,
@@ -270,86 +755,174 @@ class FritzBoxVPNSession:
         return sid
 
     def _raise_transport_error(self, err: BaseException) -> NoReturn:
-        """Clear SID/protocol and raise ConnectionError for transport failures."""
-        self.invalidate_session()
-        raise ConnectionError(f"Cannot connect to {self.host}: {err}") from err
+        """Raise FritzBoxTransportError; clear SID/protocol only when refused.
+
+        Timeouts and resets are transient: the SID, protocol and listing mode
+        survive, so the next poll does not pay for a login and re-probe.
+        """
+        if is_connection_refused(err):
+            self.invalidate_session()
+        else:
+            self.stats.transient_errors += 1
+        raise FritzBoxTransportError(f"Cannot connect to {self.host}: {err}") from err
 
     @staticmethod
-    def _calculate_pbkdf2_response(challenge: str, password: str) -> str:
-        """Calculate PBKDF2-based Fritz!Box web login response."""
+    def _parse_pbkdf2_challenge(challenge: str) -> tuple[int, str, int, str]:
+        """Split a ``2$iter1$salt1$iter2$salt2`` challenge; ValueError if malformed."""
         parts = challenge.split("$")
         if len(parts) < 5 or parts[0] != "2":
             raise ValueError("Unexpected PBKDF2 challenge format")
+        iter1, salt1_hex, iter2, salt2_hex = parts[1:5]
+        # Validate salts here so malformed challenges fail before any hashing.
+        bytes.fromhex(salt1_hex)
+        bytes.fromhex(salt2_hex)
+        return int(iter1), salt1_hex, int(iter2), salt2_hex
 
-        iter1 = int(parts[1])
-        salt1_hex = parts[2]
-        iter2 = int(parts[3])
-        salt2_hex = parts[4]
+    @staticmethod
+    def _calculate_pbkdf2_response(challenge: str, password: str) -> str:
+        """Calculate PBKDF2-based Fritz!Box web login response."""
+        iter1, salt1_hex, iter2, salt2_hex = FritzBoxVPNSession._parse_pbkdf2_challenge(
+            challenge
+        )
+        hash1 = _pbkdf2_sha256(password.encode(), salt1_hex, iter1)
+        hash2 = _pbkdf2_sha256(hash1, salt2_hex, iter2)
+        return f"{salt2_hex}${hash2.hex()}"
 
-        salt1 = bytes.fromhex(salt1_hex)
-        salt2 = bytes.fromhex(salt2_hex)
+    async def _async_pbkdf2_response(self, challenge: str) -> str:
+        """PBKDF2 login response computed in an executor.
 
-        hash1 = hashlib.pbkdf2_hmac("sha256", password.encode(), salt1, iter1)
-        hash2 = hashlib.pbkdf2_hmac("sha256", hash1, salt2, iter2)
+        The static first stage (password, salt1, iter1) is cached per session,
+        so re-logins only pay for the cheap second stage.
+        """
+        iter1, salt1_hex, iter2, salt2_hex = self._parse_pbkdf2_challenge(challenge)
+        password = self.password.encode()
+        key = (hashlib.sha256(password).digest(), salt1_hex, iter1)
+        loop = asyncio.get_running_loop()
 
-        return f"{salt2_hex}${hash2.hex()}"
+        hash1 = self._pbkdf2_stage1_cache.get(key)
+        if hash1 is None:
+            hash1 = await loop.run_in_executor(
+                None, _pbkdf2_sha256, password, salt1_hex, iter1
+            )
+            self._pbkdf2_stage1_cache[key] = hash1
+            while len(self._pbkdf2_stage1_cache) > PBKDF2_STAGE1_CACHE_SIZE:
+                self._pbkdf2_stage1_cache.popitem(last=False)
+        else:
+            self._pbkdf2_stage1_cache.move_to_end(key)
+            _LOGGER.debug("Reusing cached first-stage PBKDF2 hash.")
 
-    async def _get_login_page_http(
-        self, api_path: str, query: str, timeout: ClientTimeout
-    ) -> str:
-        """GET login page over HTTP and switch protocol only after success."""
-        login_url = (
-            f"{PROTOCOL_HTTP}://{self.host}{api_path}{'?' + query if query else ''}"
+        hash2 = await loop.run_in_executor(
+            None, _pbkdf2_sha256, hash1, salt2_hex, iter2
         )
+        return f"{salt2_hex}${hash2.hex()}"
+
+    async def _get_login_page(self, url: str, timeout: ClientTimeout) -> str:
+        """GET one login page; ConnectionError on transport failure or non-200."""
         try:
-            async with self.session.get(
-                login_url, ssl=False, timeout=timeout
-            ) as response:
+            async with self.session.get(url, ssl=False, timeout=timeout) as response:
                 if response.status != HTTP_STATUS_OK:
-                    raise ConnectionError(
-                        f"Failed to get login page: {response.status}"
-                    )
-                content = await response.text()
+                    raise _LoginPageStatusError(response.status)
+                return await response.text()
         except ConnectionError:
             raise
         except (ClientConnectorError, OSError) as err:
-            raise ConnectionError(f"Cannot connect to {self.host}: {err}") from err
-        self.protocol = PROTOCOL_HTTP
+            raise FritzBoxTransportError(
+                f"Cannot connect to {self.host}: {err}"
+            ) from err
+
+    def _protocol_probe_fresh(self) -> bool:
+        """True while the last race result is recent enough to keep."""
+        return (
+            self._protocol_probed_at is not None
+            and time.monotonic() - self._protocol_probed_at < PROTOCOL_REPROBE_INTERVAL
+        )
+
+    async def _race_login_page(self, path: str, timeout: ClientTimeout) -> str:
+        """Race HTTPS against a staggered HTTP request; the first success wins.
+
+        HTTPS gets a short head start and wins outright when it answers in
+        time, so boxes with working HTTPS never see the HTTP request. Boxes
+        without HTTPS no longer wait for the full HTTPS timeout. An HTTPS
+        status outside HTTPS_FALLBACK_STATUS_CODES ends the race with that
+        error instead of handing it to HTTP.
+        """
+        self.stats.protocol_races += 1
+        https_task = asyncio.create_task(
+            self._get_login_page(f"{PROTOCOL_HTTPS}://{self.host}{path}", timeout)
+        )
+        http_task: asyncio.Task[str] | None = None
+        try:
+            await asyncio.wait({https_task}, timeout=PROTOCOL_RACE_STAGGER)
+            # result() re-raises a final HTTPS error status.
+            if https_task.done() and _https_answer_is_final(https_task):
+                return self._protocol_won(PROTOCOL_HTTPS, https_task.result())
+
+            http_task = asyncio.create_task(
+                self._get_login_page(f"{PROTOCOL_HTTP}://{self.host}{path}", timeout)
+            )
+            pending: set[asyncio.Task[str]] = {http_task}
+            if not https_task.done():
+                pending.add(https_task)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # HTTPS is preferred when both answer in the same iteration.
+                if https_task in done and _https_answer_is_final(https_task):
+                    return self._protocol_won(PROTOCOL_HTTPS, https_task.result())
+                if http_task in done and http_task.exception() is None:
+                    return self._protocol_won(PROTOCOL_HTTP, http_task.result())
+        finally:
+            losers = [
+                task for task in (https_task, http_task) if task and not task.done()
+            ]
+            for task in losers:
+                task.cancel()
+            if losers:
+                await asyncio.gather(*losers, return_exceptions=True)
+
+        _LOGGER.warning(
+            "HTTPS connection failed (%s), HTTP fallback failed too.",
+            https_task.exception(),
+        )
+        http_error = http_task.exception()
+        assert http_error is not None
+        raise http_error
+
+    def _protocol_won(self, protocol: str, content: str) -> str:
+        """Remember the race winner until the next re-probe."""
+        if protocol == PROTOCOL_HTTP:
+            self.stats.protocol_http_wins += 1
+            _LOGGER.warning(
+                "HTTPS login page unavailable, using HTTP. "
+                "Consider using HTTP if your %s doesn't support HTTPS.",
+                NAME_FRITZBOX,
+            )
+        self.protocol = protocol
+        self._protocol_probed_at = time.monotonic()
         return content
 
     async def _fetch_login_page(
         self, login_url: str, timeout: ClientTimeout
     ) -> str | None:
-        """GET login page; HTTPS→HTTP fallback. Returns content or None."""
+        """GET login page; HTTPS races a staggered HTTP fallback."""
         parsed = urlsplit(login_url)
-        api_path = parsed.path
-        query = parsed.query
+        path = f"{parsed.path}{'?' + parsed.query if parsed.query else ''}"
+        if (
+            self.protocol == PROTOCOL_HTTP
+            and self._protocol_probed_at is not None
+            and not self._protocol_probe_fresh()
+        ):
+            _LOGGER.debug("Re-probing HTTPS for %s.", NAME_FRITZBOX)
+            self.protocol = PROTOCOL_HTTPS
+        if self.protocol == PROTOCOL_HTTPS:
+            return await self._race_login_page(path, timeout)
         try:
-            async with self.session.get(
-                login_url, ssl=False, timeout=timeout
-            ) as response:
-                if response.status == HTTP_STATUS_OK:
-                    return await response.text()
-                if (
-                    self.protocol == PROTOCOL_HTTPS
-                    and response.status in HTTPS_FALLBACK_STATUS_CODES
-                ):
-                    _LOGGER.warning(
-                        "HTTPS connection failed (status %d), falling back to HTTP. "
-                        "Consider using HTTP if your %s doesn't support HTTPS.",
-                        response.status,
-                        NAME_FRITZBOX,
-                    )
-                    return await self._get_login_page_http(api_path, query, timeout)
-                raise ConnectionError(f"Failed to get login page: {response.status}")
-        except (ClientConnectorError, OSError) as err:
-            if self.protocol != PROTOCOL_HTTPS:
-                raise ConnectionError(f"Cannot connect to {self.host}: {err}") from err
-            _LOGGER.warning(
-                "HTTPS connection failed (%s), falling back to HTTP.",
-                err,
-            )
-            return await self._get_login_page_http(api_path, query, timeout)
+            return await self._get_login_page(f"{self._base_url()}{path}", timeout)
+        except ConnectionError:
+            # Let the next invalidation reset to HTTPS and race again.
+            self._protocol_probed_at = None
+            raise
 
     async def _fetch_listing_by_mode(
         self, mode: str, session: ClientSession, sid: str
@@ -365,7 +938,8 @@ class FritzBoxVPNSession:
         self, session: ClientSession, sid: str
     ) -> dict[str, Any] | None:
         """GET /api/v0/generic/vpn; None when the REST listing contract is absent."""
-        timeout = ClientTimeout(total=DEFAULT_TIMEOUT)
+        timeout = _REQUEST_TIMEOUT
+        started = time.monotonic()
         try:
             async with session.get(
                 f"{self._base_url()}{API_VPN_ROOT}",
@@ -376,13 +950,21 @@ class FritzBoxVPNSession:
                 if response.status == HTTP_STATUS_NOT_FOUND:
                     return None
                 self._validate_vpn_listing_status(response, source=" via REST")
-                data = await self._response_json_dict(response)
+                body = await response.read()
+                digest, unchanged = self._unchanged_listing(
+                    LISTING_MODE_REST, started, body, len(body)
+                )
+                if unchanged is not None:
+                    return unchanged
+                data = self._response_json_dict(response, body)
                 if data is None:
                     return None
-                box = extract_wireguard_connections_from_rest(data)
-                if box is None:
+                connections = parse_rest_listing(data)
+                if connections is None:
                     return None
-                return normalize_box_connections(box)
+                return self._remember_listing(
+                    LISTING_MODE_REST, started, len(body), digest, connections
+                )
         except (ClientConnectorError, OSError) as err:
             self._raise_transport_error(err)
 
@@ -395,9 +977,9 @@ class FritzBoxVPNSession:
             "xhr": "1",
             "xhrId": "all",
             "page": API_PAGE_SHAREWIREGUARD,
-            "no_sidrenew": "",
         }
-        timeout = ClientTimeout(total=DEFAULT_TIMEOUT)
+        timeout = _REQUEST_TIMEOUT
+        started = time.monotonic()
         try:
             async with session.post(
                 f"{self._base_url()}{API_DATA}",
@@ -406,17 +988,126 @@ class FritzBoxVPNSession:
                 ssl=False,
             ) as response:
                 self._validate_vpn_listing_status(response, source="")
-                data = await self._response_json_dict(response, require_json=True)
+                if self._stream_listing and is_utf8_charset(response.charset):
+                    return await self._stream_data_lua_listing(response, started)
+                body = await response.read()
+                digest, unchanged = self._unchanged_listing(
+                    LISTING_MODE_DATA_LUA, started, body, len(body)
+                )
+                if unchanged is not None:
+                    return unchanged
+                data = self._response_json_dict(response, body, require_json=True)
                 if data is None:
                     return None
-                box = extract_box_connections_from_data(data, API_PAGE_SHAREWIREGUARD)
-                if box is None:
+                connections = parse_data_lua_listing(data, API_PAGE_SHAREWIREGUARD)
+                if connections is None:
                     return None
-                return normalize_box_connections(box)
+                return self._remember_listing(
+                    LISTING_MODE_DATA_LUA, started, len(body), digest, connections
+                )
         except (ClientConnectorError, OSError) as err:
-            # Reboot / port-down: clear cached SID+protocol so the next poll recovers.
+            # Refused (reboot / port-down) clears SID+protocol; timeouts keep them.
             self._raise_transport_error(err)
 
+    async def _stream_data_lua_listing(
+        self, response: ClientResponse, started: float
+    ) -> dict[str, Any] | None:
+        """data.lua listing read in chunks; only boxConnections is decoded.
+
+        The rest of the page is dropped as it arrives (BoxConnectionsScanner).
+        Polls count as unchanged when the boxConnections JSON is identical,
+        whatever else changed on the page.
+        """
+        content_type = (response.headers.get(hdrs.CONTENT_TYPE) or "").lower()
+        if CONTENT_TYPE_JSON not in content_type:
+            raise ValueError(ERROR_MSG_INVALID_SID_HTML)
+        scanner = BoxConnectionsScanner(API_PAGE_SHAREWIREGUARD)
+        seconds = 0.0
+        try:
+            async for chunk in response.content.iter_chunked(LISTING_READ_CHUNK_SIZE):
+                scan_started = time.perf_counter()
+                scanner.feed(chunk)
+                seconds += time.perf_counter() - scan_started
+            scan_started = time.perf_counter()
+            box = scanner.finish()
+            seconds += time.perf_counter() - scan_started
+        except ValueError as err:
+            raise ValueError(ERROR_MSG_INVALID_SID_HTML) from err
+        finally:
+            self.stats.record_json_decode(seconds, scanner.size)
+        if box is None or scanner.box_json is None:
+            return None
+        digest, unchanged = self._unchanged_listing(
+            LISTING_MODE_DATA_LUA, started, scanner.box_json, scanner.size
+        )
+        if unchanged is not None:
+            return unchanged
+        return self._remember_listing(
+            LISTING_MODE_DATA_LUA,
+            started,
+            scanner.size,
+            digest,
+            parse_box_connections(box),
+        )
+
+    async def _probe_listing_modes(
+        self, session: ClientSession, sid: str, skip: str | None
+    ) -> dict[str, Any]:
+        """Probe listing modes concurrently and remember the first that works.
+
+        Modes start cheapest-known first; the next one joins after
+        LISTING_PROBE_STAGGER, or at once when the running mode reports its
+        payload absent. An error with nothing else in flight is raised as-is.
+        """
+        queue = self._listing_probe_order(skip)
+        running: dict[asyncio.Task[dict[str, Any] | None], str] = {}
+        errors: dict[str, BaseException] = {}
+
+        def _launch() -> None:
+            mode = queue.pop(0)
+            task = asyncio.create_task(self._fetch_listing_by_mode(mode, session, sid))
+            running[task] = mode
+
+        try:
+            if queue:
+                _launch()
+            while running:
+                done, _ = await asyncio.wait(
+                    running,
+                    timeout=LISTING_PROBE_STAGGER if queue else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    _LOGGER.debug("Listing probe slow; starting %s too.", queue[0])
+                    _launch()
+                    continue
+                results: dict[str, dict[str, Any]] = {}
+                for task in done:
+                    mode = running.pop(task)
+                    if (error := task.exception()) is not None:
+                        errors[mode] = error
+                    elif (result := task.result()) is not None:
+                        results[mode] = result
+                for mode in LISTING_PROBE_ORDER:
+                    if mode in results:
+                        self._listing_mode = mode
+                        return results[mode]
+                if not running and queue and not errors:
+                    _launch()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        for mode in LISTING_PROBE_ORDER:
+            if mode in errors:
+                raise errors[mode]
+        # Missing payloads are typical while the box is rebooting or the
+        # cached SID/protocol is stale — do not soft-succeed with {}.
+        self.invalidate_session()
+        raise ConnectionError(ERROR_MSG_VPN_PAYLOAD_MISSING)
+
     async def _fetch_vpn_connections_once(self) -> dict[str, Any]:
         """Single VPN connections request; raises on outage/missing payload."""
         session, sid = await self.async_get_session()
@@ -425,31 +1116,37 @@ class FritzBoxVPNSession:
         if preferred is not None:
             result = await self._fetch_listing_by_mode(preferred, session, sid)
             if result is not None:
+                self._note_sid_used(sid)
                 return result
             self._listing_mode = None
 
-        for mode in LISTING_PROBE_ORDER:
-            if mode == preferred:
-                continue
-            result = await self._fetch_listing_by_mode(mode, session, sid)
-            if result is not None:
-                self._listing_mode = mode
-                return result
-
-        # Missing payloads are typical while the box is rebooting or the
-        # cached SID/protocol is stale — do not soft-succeed with {}.
-        self.invalidate_session()
-        raise ConnectionError(ERROR_MSG_VPN_PAYLOAD_MISSING)
+        task, joined = self._single_flight(
+            _FLIGHT_LISTING_PROBE,
+            lambda: self._probe_listing_modes(session, sid, preferred),
+        )
+        if joined:
+            self.stats.listing_probes_coalesced += 1
+        else:
+            self.stats.listing_probes += 1
+        result = await asyncio.shield(task)
+        self._note_sid_used(sid)
+        return result
 
     async def async_get_vpn_connections(self) -> dict[str, Any]:
-        """WireGuard VPN connections; cached session, retry once on SID expiry."""
+        """WireGuard VPN connections; cached session, retry once on SID expiry.
+
+        A byte-identical listing body returns the previous result object and
+        sets listing_unchanged, so callers can skip downstream work.
+        """
+        previous = self._listing_body
+        self.listing_unchanged = False
         try:
-            return await self._fetch_vpn_connections_once()
+            connections = await self._fetch_vpn_connections_once()
         except ValueError as err:
-            if ERROR_MSG_INVALID_SID in str(err):
-                self.invalidate_session()
-                return await self._fetch_vpn_connections_once()
-            raise
+            if ERROR_MSG_INVALID_SID not in str(err):
+                raise
+            self.invalidate_session()
+            connections = await self._fetch_vpn_connections_once()
         except TimeoutError as err:
             _LOGGER.error("Timeout getting VPN connections: %s", err)
             raise
@@ -459,12 +1156,143 @@ class FritzBoxVPNSession:
         except Exception as err:
             _LOGGER.error("Error getting VPN connections: %s", err)
             raise
+        self._listing_cache = (time.monotonic(), dict(connections))
+        self.listing_unchanged = previous is not None and connections is previous[2]
+        return connections
+
+    def _recent_listing(self) -> dict[str, Any] | None:
+        """Last listing if younger than LISTING_CACHE_MAX_AGE, else None."""
+        if self._listing_cache is None:
+            return None
+        fetched_at, connections = self._listing_cache
+        if time.monotonic() - fetched_at >= LISTING_CACHE_MAX_AGE:
+            return None
+        return connections
+
+    def listing_snapshot(self) -> dict[str, Any] | None:
+        """Copy of the recent listing, including states verified by a toggle.
+
+        None when no listing younger than LISTING_CACHE_MAX_AGE is cached.
+        """
+        connections = self._recent_listing()
+        if connections is None:
+            return None
+        return dict(connections)
+
+    def _update_cached_active(self, connection_uid: str, active: bool) -> None:
+        """Reflect a verified toggle in the cached listing."""
+        if self._listing_cache is None:
+            return
+        _, connections = self._listing_cache
+        conn = connections.get(connection_uid)
+        if conn is not None:
+            connections[connection_uid] = {**conn, API_KEY_ACTIVE: active}
+
+    async def _fetch_connection_active(
+        self, session: ClientSession, sid: str, vpn_uid: str
+    ) -> bool | None:
+        """Active flag from GET API_VPN_CONNECTION; None if the endpoint is unusable."""
+        try:
+            async with session.get(
+                f"{self._base_url()}{API_VPN_CONNECTION.format(uid=vpn_uid)}",
+                headers=self._rest_headers(sid),
+                timeout=_REQUEST_TIMEOUT,
+                ssl=False,
+            ) as response:
+                if response.status != HTTP_STATUS_OK:
+                    return None
+                self._note_sid_used(sid)
+                data = self._response_json_dict(response, await response.read())
+        except (ClientConnectorError, OSError) as err:
+            self._raise_transport_error(err)
+        conn = extract_connection_from_rest(data) if data is not None else None
+        if conn is None:
+            return None
+        return conn[API_KEY_ACTIVE]
+
+    async def _async_verify_toggle(
+        self, session: ClientSession, sid: str, vpn_uid: str, enable: bool
+    ) -> bool | None:
+        """Poll one connection with backoff; last seen state, None if unsupported."""
+        delay = TOGGLE_VERIFY_INITIAL_DELAY
+        waited = 0.0
+        while True:
+            await asyncio.sleep(delay)
+            waited += delay
+            active = await self._fetch_connection_active(session, sid, vpn_uid)
+            if active is None or active == enable:
+                return active
+            if waited >= TOGGLE_VERIFY_TIMEOUT:
+                return active
+            delay = min(
+                delay * 2, TOGGLE_VERIFY_MAX_DELAY, TOGGLE_VERIFY_TIMEOUT - waited
+            )
+
+    async def _async_verify_toggle_via_listing(
+        self, connection_uid: str
+    ) -> bool | None:
+        """Fallback verification: fixed delay, then the full listing."""
+        await asyncio.sleep(VERIFICATION_DELAY)
+        new_connections = await self.async_get_vpn_connections()
+        if connection_uid not in new_connections:
+            _LOGGER.error("Could not verify VPN status change - connection not found")
+            return None
+        return new_connections[connection_uid].get(API_KEY_ACTIVE, False)
+
+    async def _async_confirm_active(
+        self, connection_uid: str, vpn_uid: str
+    ) -> bool | None:
+        """Active flag read from the box now; None when the connection is gone.
+
+        One GET of the connection, or a fresh listing when that endpoint is
+        unusable. The cached listing is updated to what the box reported.
+        """
+        session, sid = await self.async_get_session()
+        active = await self._fetch_connection_active(session, sid, vpn_uid)
+        if active is not None:
+            self._update_cached_active(connection_uid, active)
+            return active
+        conn = (await self.async_get_vpn_connections()).get(connection_uid)
+        if conn is None:
+            return None
+        return conn.get(API_KEY_ACTIVE, False)
+
+    async def _put_vpn_state(
+        self, session: ClientSession, sid: str, vpn_uid: str, enable: bool
+    ) -> tuple[int, str]:
+        """PUT the activation flag of one connection; (status, error body).
+
+        Transport failures are raised as ConnectionError (_raise_transport_error).
+        """
+        try:
+            async with session.put(
+                f"{self._base_url()}{API_VPN_CONNECTION.format(uid=vpn_uid)}",
+                json={API_KEY_ACTIVATED: 1 if enable else 0},
+                headers=self._rest_headers(sid, mutation=True),
+                timeout=_REQUEST_TIMEOUT,
+                ssl=False,
+            ) as response:
+                if response.status == HTTP_STATUS_OK:
+                    self._note_sid_used(sid)
+                    return response.status, ""
+                return response.status, await response.text()
+        except (ClientConnectorError, OSError) as err:
+            self._raise_transport_error(err)
 
     async def async_toggle_vpn(
         self, connection_uid: str, enable: bool, _sid_retry: bool = True
     ) -> bool:
-        """Toggle VPN on/off; retry once on 403 (expired SID)."""
-        connections = await self.async_get_vpn_connections()
+        """Toggle VPN on/off; retry once on 403 (expired SID).
+
+        The pre-check uses a recent cached listing when available, and the
+        result is verified by polling only the toggled connection. A cached
+        listing only resolves the UID: when it already shows the target
+        state, the box is asked before the PUT is skipped.
+        """
+        connections = self._recent_listing()
+        cached = connections is not None and connection_uid in connections
+        if not cached:
+            connections = await self.async_get_vpn_connections()
         if connection_uid not in connections:
             _LOGGER.error("VPN connection %s not found", connection_uid)
             return False
@@ -476,64 +1304,59 @@ class FritzBoxVPNSession:
             return False
 
         current_active = conn.get(API_KEY_ACTIVE, False)
+        vpn_name = conn.get(API_KEY_NAME, DEFAULT_NAME_UNKNOWN)
+        if current_active == enable and cached:
+            # Switched elsewhere (Fritz!Box UI, another client) since the listing?
+            current_active = await self._async_confirm_active(connection_uid, vpn_uid)
+            if current_active is None:
+                _LOGGER.error("VPN connection %s not found", connection_uid)
+                return False
         if current_active == enable:
-            vpn_name = conn.get(API_KEY_NAME, DEFAULT_NAME_UNKNOWN)
             label = LOG_LABEL_ACTIVATED if enable else LOG_LABEL_DEACTIVATED
             _LOGGER.info("VPN %s is already %s", vpn_name, label)
             return True
 
         session, sid = await self.async_get_session()
-        api_url = f"{self._base_url()}{API_VPN_CONNECTION.format(uid=vpn_uid)}"
-        headers = self._rest_headers(sid, mutation=True)
-        request_body = {API_KEY_ACTIVATED: 1 if enable else 0}
-
-        timeout = ClientTimeout(total=DEFAULT_TIMEOUT)
         try:
-            async with session.put(
-                api_url,
-                json=request_body,
-                headers=headers,
-                timeout=timeout,
-                ssl=False,
-            ) as response:
-                if response.status == HTTP_STATUS_FORBIDDEN and _sid_retry:
-                    self.invalidate_session()
-                    return await self.async_toggle_vpn(
-                        connection_uid, enable, _sid_retry=False
-                    )
-                if response.status != HTTP_STATUS_OK:
-                    error_text = await response.text()
-                    _LOGGER.error(
-                        "Error toggling VPN: HTTP %d, %s",
-                        response.status,
-                        error_text[:200],
-                    )
-                    return False
+            status, error_text = await self._put_vpn_state(
+                session, sid, vpn_uid, enable
+            )
+            if status == HTTP_STATUS_FORBIDDEN and _sid_retry:
+                self.invalidate_session()
+                return await self.async_toggle_vpn(
+                    connection_uid, enable, _sid_retry=False
+                )
+            if status != HTTP_STATUS_OK:
+                _LOGGER.error(
+                    "Error toggling VPN: HTTP %d, %s",
+                    status,
+                    error_text[:200],
+                )
+                return False
 
-                await asyncio.sleep(VERIFICATION_DELAY)
-                new_connections = await self.async_get_vpn_connections()
-                vpn_name = conn.get(API_KEY_NAME, DEFAULT_NAME_UNKNOWN)
-                if connection_uid not in new_connections:
-                    _LOGGER.error(
-                        "Could not verify VPN status change - connection not found"
-                    )
+            new_active = await self._async_verify_toggle(session, sid, vpn_uid, enable)
+            if new_active is None:
+                _LOGGER.debug(
+                    "Single-connection endpoint unusable; verifying via listing."
+                )
+                new_active = await self._async_verify_toggle_via_listing(connection_uid)
+                if new_active is None:
                     return False
-                new_conn = new_connections[connection_uid]
-                new_active = new_conn.get(API_KEY_ACTIVE, False)
-                if new_active == enable:
-                    label = LOG_LABEL_ACTIVATED if enable else LOG_LABEL_DEACTIVATED
-                    _LOGGER.info(
-                        "VPN %s successfully %s",
-                        vpn_name,
-                        label,
-                    )
-                    return True
-                _LOGGER.warning(
-                    "VPN status change failed. Expected: %s, Got: %s",
-                    enable,
-                    new_active,
+            if new_active == enable:
+                self._update_cached_active(connection_uid, enable)
+                label = LOG_LABEL_ACTIVATED if enable else LOG_LABEL_DEACTIVATED
+                _LOGGER.info(
+                    "VPN %s successfully %s",
+                    vpn_name,
+                    label,
                 )
-                return False
+                return True
+            _LOGGER.warning(
+                "VPN status change failed. Expected: %s, Got: %s",
+                enable,
+                new_active,
+            )
+            return False
         except TimeoutError as err:
             _LOGGER.error("Timeout toggling VPN: %s", err)
             return False
@@ -541,17 +1364,160 @@ class FritzBoxVPNSession:
             _LOGGER.exception("Error toggling VPN")
             return False
 
+    async def _put_vpn_states(
+        self, session: ClientSession, sid: str, changes: Mapping[str, tuple[str, bool]]
+    ) -> dict[str, int | BaseException]:
+        """PUT several connections concurrently; per connection uid, the HTTP
+        status or the exception that PUT raised (the others still complete).
+        """
+        semaphore = asyncio.Semaphore(SET_STATES_CONCURRENCY)
+
+        async def _put(vpn_uid: str, enable: bool) -> int:
+            async with semaphore:
+                status, error_text = await self._put_vpn_state(
+                    session, sid, vpn_uid, enable
+                )
+            if status not in (HTTP_STATUS_OK, HTTP_STATUS_FORBIDDEN):
+                _LOGGER.error(
+                    "Error toggling VPN %s: HTTP %d, %s",
+                    vpn_uid,
+                    status,
+                    error_text[:200],
+                )
+            return status
+
+        statuses = await asyncio.gather(
+            *(_put(vpn_uid, enable) for vpn_uid, enable in changes.values()),
+            return_exceptions=True,
+        )
+        for status in statuses:
+            if isinstance(status, asyncio.CancelledError):
+                raise status
+        return dict(zip(changes, statuses, strict=True))
+
+    async def async_set_vpn_states(self, states: Mapping[str, bool]) -> dict[str, bool]:
+        """Switch several connections at once; success per connection uid.
+
+        One listing serves all pre-checks, the PUTs run concurrently (at most
+        SET_STATES_CONCURRENCY at a time) and a single listing-based
+        verification pass confirms every change.
+        """
+        connections = self._recent_listing()
+        if connections is None or not set(states) <= set(connections):
+            connections = await self.async_get_vpn_connections()
+
+        results: dict[str, bool] = {}
+        changes: dict[str, tuple[str, bool]] = {}
+        for connection_uid, enable in states.items():
+            conn = connections.get(connection_uid)
+            vpn_uid = conn.get(API_KEY_UID) if conn is not None else None
+            if not vpn_uid:
+                _LOGGER.error("VPN connection %s not found", connection_uid)
+                results[connection_uid] = False
+            elif conn.get(API_KEY_ACTIVE, False) == enable:
+                results[connection_uid] = True
+            else:
+                changes[connection_uid] = (vpn_uid, enable)
+        if not changes:
+            return results
+
+        try:
+            session, sid = await self.async_get_session()
+            statuses = await self._put_vpn_states(session, sid, changes)
+            expired = {
+                uid: change
+                for uid, change in changes.items()
+                if statuses[uid] == HTTP_STATUS_FORBIDDEN
+            }
+            if expired:
+                self.invalidate_session()
+                session, sid = await self.async_get_session()
+                statuses.update(await self._put_vpn_states(session, sid, expired))
+        except TimeoutError as err:
+            _LOGGER.error("Timeout toggling VPNs: %s", err)
+            return {**results, **dict.fromkeys(changes, False)}
+        except (ClientError, ConnectionError, ValueError, OSError) as err:
+            _LOGGER.error("Error toggling VPNs: %s", err)
+            return {**results, **dict.fromkeys(changes, False)}
+
+        for uid, status in statuses.items():
+            if isinstance(status, BaseException):
+                _LOGGER.error("Error toggling VPN %s: %s", uid, status)
+        # Only PUTs the box accepted are verified; failed ones report False.
+        pending = {
+            uid: enable
+            for uid, (_, enable) in changes.items()
+            if statuses[uid] == HTTP_STATUS_OK
+        }
+        results.update(dict.fromkeys(set(changes) - set(pending), False))
+        results.update(await self._async_verify_states(pending))
+        return results
+
+    async def _async_verify_states(self, expected: dict[str, bool]) -> dict[str, bool]:
+        """Poll the listing with backoff until every expected state shows."""
+        verified: dict[str, bool] = {}
+        delay = TOGGLE_VERIFY_INITIAL_DELAY
+        waited = 0.0
+        while expected:
+            await asyncio.sleep(delay)
+            waited += delay
+            try:
+                connections = await self.async_get_vpn_connections()
+            except (ConnectionError, ValueError, TimeoutError) as err:
+                _LOGGER.error("Could not verify VPN status changes: %s", err)
+                break
+            for uid, enable in list(expected.items()):
+                conn = connections.get(uid)
+                if conn is not None and conn.get(API_KEY_ACTIVE, False) == enable:
+                    verified[uid] = True
+                    del expected[uid]
+            if waited >= TOGGLE_VERIFY_TIMEOUT:
+                break
+            delay = min(
+                delay * 2, TOGGLE_VERIFY_MAX_DELAY, TOGGLE_VERIFY_TIMEOUT - waited
+            )
+        if expected:
+            _LOGGER.warning("VPN status change not confirmed for %s", sorted(expected))
+        return {**verified, **dict.fromkeys(expected, False)}
+
+    async def async_probe_reachable(self) -> bool:
+        """Cheap reachability check (HEAD login_sid.lua), current protocol first."""
+        self.stats.reachability_probes += 1
+        others = [p for p in PROTOCOLS_ALLOWED if p != self.protocol]
+        return (
+            await async_probe_login_page(
+                self.session, self.host, [self.protocol, *others]
+            )
+            is not None
+        )
+
     def invalidate_session(self) -> None:
-        """Invalidate cached SID and reset protocol so the next request re-logins.
+        """Invalidate cached SID so the next request re-logins.
 
-        Protocol is reset to HTTPS because a temporary reboot outage can flip
-        HTTPS→HTTP permanently for the lifetime of this session object.
-        Listing mode is cleared so a firmware/API change is rediscovered.
+        The protocol is kept while the last HTTPS/HTTP race result is fresh
+        (PROTOCOL_REPROBE_INTERVAL); otherwise it is reset to HTTPS so a
+        temporary reboot outage cannot pin HTTP forever. Listing mode is
+        cleared so a firmware/API change is rediscovered.
         """
         self.sid = None
-        self.protocol = DEFAULT_PROTOCOL
+        self._sid_validated_at = None
+        self._restored_sid_unverified = False
+        if not self._protocol_probe_fresh():
+            self.protocol = DEFAULT_PROTOCOL
+            self._protocol_probed_at = None
         self._listing_mode = None
+        self._listing_cache = None
 
     async def async_close(self) -> None:
-        """Clear cached SID and reset protocol."""
+        """Stop the SID keep-alive, clear cached SID and reset protocol.
+
+        A client session created by create() is closed as well.
+        """
+        task, self._keepalive_task = self._keepalive_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
         self.invalidate_session()
+        if self._owns_session and not self.session.closed:
+            await self.session.close()
@@ -0,0 +1,62 @@
+"""Counters describing how much work a Fritz!Box session did (or avoided)."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+
+@dataclass
+class ListingModeStats:
+    """Observed cost of one listing endpoint (data.lua or REST)."""
+
+    latency: float = 0.0
+    size: int = 0
+    samples: int = 0
+
+    def record(self, latency: float, size: int, smoothing: float) -> None:
+        """Fold one successful listing into the moving average."""
+        if self.samples:
+            latency = self.latency + smoothing * (latency - self.latency)
+        self.latency = latency
+        self.size = size
+        self.samples += 1
+
+
+@dataclass
+class FritzBoxVPNSessionStats:
+    """Per-session counters; cheap enough to update on every request."""
+
+    logins: int = 0
+    logins_coalesced: int = 0
+    listing_probes: int = 0
+    listing_probes_coalesced: int = 0
+    protocol_races: int = 0
+    protocol_http_wins: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    sid_refreshes: int = 0
+    sid_refresh_relogins: int = 0
+    sid_refresh_failures: int = 0
+    listings_unchanged: int = 0
+    reachability_probes: int = 0
+    transient_errors: int = 0
+    # JSON bodies decoded (listings, single-connection reads) and their cost.
+    json_decodes: int = 0
+    json_decode_seconds: float = 0.0
+    json_decode_bytes: int = 0
+    last_json_decode_seconds: float = 0.0
+    last_json_decode_bytes: int = 0
+    listing_modes: dict[str, ListingModeStats] = field(default_factory=dict)
+
+    def record_json_decode(self, seconds: float, size: int) -> None:
+        """Count one decoded response body of ``size`` bytes."""
+        self.json_decodes += 1
+        self.json_decode_seconds += seconds
+        self.json_decode_bytes += size
+        self.last_json_decode_seconds = seconds
+        self.last_json_decode_bytes = size
+
+    def as_dict(self) -> dict[str, Any]:
+        """Plain dict for diagnostics/logging."""
+        return asdict(self)
@@ -0,0 +1,264 @@
+"""Incremental extraction of boxConnections from a data.lua response body."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+import sys
+from typing import Any
+
+from .const import API_KEY_BOX_CONNECTIONS, API_KEY_DATA, API_KEY_INIT
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Object member up to its value: "key", colon and the whitespace around them.
+_MEMBER = re.compile(r'[ \t\n\r]*"([^"\\]*(?:\\.[^"\\]*)*)"[ \t\n\r]*:[ \t\n\r]*', re.S)
+# The same, after a value: comma first.
+_NEXT_MEMBER = re.compile(
+    r'[ \t\n\r]*,[ \t\n\r]*"([^"\\]*(?:\\.[^"\\]*)*)"[ \t\n\r]*:[ \t\n\r]*', re.S
+)
+# Characters a number can go on with in the next chunk.
+_NUMBER_CHARS = "0123456789.eE+-"
+_NUMBER_TAIL = re.compile(f"[{re.escape(_NUMBER_CHARS)}]*")
+# Path of a member value that is decoded and dropped.
+_IGNORED: tuple[str, ...] = ("",)
+
+_EXPECT_FIRST = 0
+_EXPECT_MEMBER = 1
+_EXPECT_NEXT = 2
+
+
+class _Frame:
+    """An object on a path that can lead to boxConnections."""
+
+    __slots__ = ("path", "state")
+
+    def __init__(self, path: tuple[str, ...]) -> None:
+        self.path = path
+        self.state = _EXPECT_FIRST
+
+
+class BoxConnectionsScanner:
+    """Find boxConnections in data.lua JSON fed in chunks, dropping the rest.
+
+    Only the objects on the four known paths (``data.init``,
+    ``data.init.<page>``, ``data`` and ``data.<page>``) are walked member by
+    member. Every other value is decoded on its own by the stdlib C scanner
+    and dropped at once, and consumed input is released, so the page before
+    boxConnections is never held as a whole. From boxConnections on, input is
+    buffered and decoded by finish(), which returns what
+    extract_box_connections_from_data() would return for the full body.
+    """
+
+    def __init__(self, page: str) -> None:
+        # Target path -> precedence (lower wins), as in the dict lookups.
+        self._targets = {
+            (API_KEY_DATA, API_KEY_INIT, API_KEY_BOX_CONNECTIONS): 0,
+            (API_KEY_DATA, API_KEY_INIT, page, API_KEY_BOX_CONNECTIONS): 1,
+            (API_KEY_DATA, API_KEY_BOX_CONNECTIONS): 2,
+            (API_KEY_DATA, page, API_KEY_BOX_CONNECTIONS): 3,
+        }
+        self._prefixes = {
+            (API_KEY_DATA,),
+            (API_KEY_DATA, API_KEY_INIT),
+            (API_KEY_DATA, API_KEY_INIT, page),
+            (API_KEY_DATA, page),
+        }
+        self._keys = {key for path in self._targets for key in path}
+        # utf-8-sig drops a leading BOM, like json.loads() on bytes.
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._text = ""
+        self._pos = 0
+        # Decoded input not yet joined onto _text.
+        self._pending: list[str] = []
+        self._pending_size = 0
+        # Characters needed before an incomplete value is tried again.
+        self._needed = 0
+        self._frames: list[_Frame] = []
+        # Path of the member whose value starts at _pos (() for the document).
+        self._value_path: tuple[str, ...] | None = None
+        self._done = False
+        # Non-whitespace fed after the document ended.
+        self._trailing = False
+        self._finishing = False
+        # Target -> (decoded value, its JSON text)
+        self._candidates: dict[tuple[str, ...], tuple[Any, str]] = {}
+        self.size = 0
+        # Raw JSON of the value finish() returned, e.g. for fingerprinting.
+        self.box_json: bytes | None = None
+
+    def feed(self, chunk: bytes) -> None:
+        """Scan the next piece of the body; ValueError on malformed JSON."""
+        self.size += len(chunk)
+        text = self._decoder.decode(chunk)
+        if self._done:
+            self._trailing = self._trailing or _WHITESPACE.match(text).end() < len(text)
+            return
+        if not text:
+            return
+        self._pending.append(text)
+        self._pending_size += len(text)
+        if len(self._text) - self._pos + self._pending_size >= self._needed:
+            self._join()
+            self._run()
+
+    def finish(self) -> Any:
+        """The boxConnections value; None when there is none.
+
+        ValueError when the body is truncated, is not JSON at all or goes on
+        after the document, as json.loads() would raise.
+        """
+        self._finishing = True
+        self._pending.append(self._decoder.decode(b"", True))
+        self._join()
+        if not self._done:
+            self._run()
+        if not self._done:
+            raise ValueError("Truncated or empty data.lua JSON")
+        if self._trailing or _WHITESPACE.match(self._text, self._pos).end() < len(
+            self._text
+        ):
+            raise ValueError("Extra data after data.lua JSON")
+        for target in sorted(self._targets, key=self._targets.__getitem__):
+            value, raw = self._candidates.get(target, (None, ""))
+            if value is not None:
+                self.box_json = raw.encode()
+                return value
+        return None
+
+    def _join(self) -> None:
+        self._text = self._text[self._pos :] + "".join(self._pending)
+        self._pos = 0
+        self._pending = []
+        self._pending_size = 0
+
+    def _wait(self, error: str) -> None:
+        """Ask for more input, or fail when there is none to come."""
+        if self._finishing:
+            raise ValueError(error)
+        # Doubling keeps re-scanning a value that spans many chunks linear.
+        self._needed = 2 * (len(self._text) - self._pos)
+
+    def _run(self) -> None:
+        """Advance as far as the buffered input allows."""
+        self._needed = 0
+        text = self._text
+        while not self._done:
+            if self._value_path is not None:
+                if not self._scan_value(self._value_path):
+                    return
+                # A document that is not an object has no boxConnections.
+                self._done = not self._frames
+                self._value_path = None
+                continue
+            pos = _WHITESPACE.match(text, self._pos).end()
+            self._pos = pos
+            if pos == len(text):
+                self._wait("Truncated or empty data.lua JSON")
+                return
+            char = text[pos]
+            if not self._frames:
+                if char == "{":
+                    self._frames.append(_Frame(()))
+                    self._pos += 1
+                else:
+                    self._value_path = ()
+                continue
+            frame = self._frames[-1]
+            if char == "}" and frame.state != _EXPECT_MEMBER:
+                self._pos += 1
+                self._frames.pop()
+                self._done = not self._frames
+                continue
+            if frame.state == _EXPECT_NEXT:
+                if char != ",":
+                    raise ValueError("Expected ',' or '}' in data.lua JSON")
+                self._pos += 1
+                frame.state = _EXPECT_MEMBER
+                continue
+            match = _MEMBER.match(text, pos)
+            if match is None or match.end() == len(text):
+                if char != '"':
+                    raise ValueError("Expected an object key in data.lua JSON")
+                self._wait("Truncated data.lua JSON")
+                return
+            key = match.group(1)
+            if "\\" in key:
+                key = json.loads(f'"{key}"')
+            self._pos = match.end()
+            frame.state = _EXPECT_NEXT
+            if key not in self._keys:
+                self._value_path = _IGNORED
+                self._skip_members()
+                continue
+            path = (*frame.path, key)
+            if path in self._prefixes:
+                # A repeated key replaces everything seen below it (last wins).
+                for target in self._targets:
+                    if target[: len(path)] == path:
+                        self._candidates.pop(target, None)
+                if text[self._pos] == "{":
+                    self._frames.append(_Frame(path))
+                    self._pos += 1
+                    continue
+            self._value_path = path
+
+    def _skip_members(self) -> None:
+        """Drop member values in a row until a key that matters.
+
+        Stops early on anything unusual; the general loop then handles it.
+        """
+        text = self._text
+        size = len(text)
+        pos = self._pos
+        keys = self._keys
+        scan = _DECODER.scan_once
+        next_member = _NEXT_MEMBER.match
+        while True:
+            try:
+                end = scan(text, pos)[1]
+            except (StopIteration, json.JSONDecodeError):
+                break
+            if end == size or (
+                text[end] in _NUMBER_CHARS
+                and _NUMBER_TAIL.match(text, end).end() == size
+            ):
+                break
+            match = next_member(text, end)
+            if (
+                match is None
+                or match.end() == size
+                or match.group(1) in keys
+                or "\\" in match.group(1)
+            ):
+                # Behind a value: the general loop reads ',' or '}' next.
+                pos = end
+                self._value_path = None
+                break
+            pos = match.end()
+        self._pos = pos
+
+    def _scan_value(self, path: tuple[str, ...]) -> bool:
+        """Decode the value at _pos; False when more input is needed."""
+        text = self._text
+        start = self._pos
+        target = path in self._targets
+        if target and not self._finishing:
+            # boxConnections is most of a big page: decode it once, at the end,
+            # rather than retrying on partial input.
+            self._needed = sys.maxsize
+            return False
+        try:
+            value, end = _DECODER.raw_decode(text, start)
+        except json.JSONDecodeError as err:
+            self._wait(f"Invalid data.lua JSON: {err}")
+            return False
+        if _NUMBER_TAIL.match(text, end).end() == len(text) and not self._finishing:
+            # A number may go on in the next chunk.
+            self._wait("Truncated data.lua JSON")
+            return False
+        if target:
+            self._candidates[path] = (value, text[start:end])
+        self._pos = end
+        return True
@@ -0,0 +1,453 @@
+"""Local Fritz!Box emulator for integration tests and benchmarks.
+
+FakeFritzBox serves login_sid.lua (MD5 and PBKDF2), data.lua shareWireguard
+and the FRITZ!OS 8.40 REST VPN API from a real aiohttp server on 127.0.0.1,
+so TLS, keep-alive, latency and concurrency effects can be measured offline.
+The package itself never imports this module.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import secrets
+import ssl
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from aiohttp import hdrs, web
+
+from .const import (
+    ACCESS_TYPE_WIREGUARD,
+    API_DATA,
+    API_KEY_ACCESS_TYPE,
+    API_KEY_ACTIVATED,
+    API_KEY_ACTIVE,
+    API_KEY_BOX_CONNECTIONS,
+    API_KEY_CONNECTED,
+    API_KEY_CONNECTED_SINCE,
+    API_KEY_CONNECTION,
+    API_KEY_DATA,
+    API_KEY_INIT,
+    API_KEY_NAME,
+    API_KEY_STATE,
+    API_KEY_UID,
+    API_KEY_UID_REST,
+    API_LOGIN,
+    API_PAGE_SHAREWIREGUARD,
+    API_VPN_ROOT,
+    AUTH_HEADER_PREFIX,
+    INVALID_SID_VALUE,
+    LOGIN_FORM_RESPONSE,
+    LOGIN_FORM_USERNAME,
+    LOGIN_QUERY_SID,
+    SID_INACTIVITY_TIMEOUT,
+    WIREGUARD_STATE_READY,
+)
+
+LOGIN_MD5 = "md5"
+LOGIN_PBKDF2 = "pbkdf2"
+# Iteration counts from AVM's session-ID documentation example.
+PBKDF2_ITER1 = 10000
+PBKDF2_ITER2 = 2000
+# BlockTime doubles with every failed login up to this many seconds.
+BLOCK_TIME_MAX = 64
+
+# Where data.lua places boxConnections (the four layouts the parser knows).
+BOX_PATH_INIT = "init"
+BOX_PATH_INIT_PAGE = "init_page"
+BOX_PATH_DATA = "data"
+BOX_PATH_DATA_PAGE = "data_page"
+BOX_PATHS = (BOX_PATH_INIT, BOX_PATH_INIT_PAGE, BOX_PATH_DATA, BOX_PATH_DATA_PAGE)
+
+_WIREGUARD_STATE_INACTIVE = "notActive"
+_LOGIN_PAGE_HTML = "<!DOCTYPE html><html><body>FRITZ!Box login</body></html>"
+
+
+@dataclass
+class FakeConnection:
+    """One emulated WireGuard connection."""
+
+    uid: str
+    name: str
+    activated: bool
+    connected: bool = False
+    # (target state, monotonic time it takes effect) of an accepted PUT.
+    pending: tuple[bool, float] | None = None
+
+    def settle(self, now: float) -> None:
+        """Apply a pending activation change once its delay has passed."""
+        if self.pending is not None and now >= self.pending[1]:
+            self.activated = self.pending[0]
+            self.connected = self.connected and self.activated
+            self.pending = None
+
+    def as_box_connection(self) -> dict[str, Any]:
+        """data.lua boxConnections entry."""
+        return {
+            API_KEY_UID: self.uid,
+            API_KEY_NAME: self.name,
+            API_KEY_ACTIVE: int(self.activated),
+            API_KEY_CONNECTED: int(self.connected),
+        }
+
+    def as_rest(self, since: int) -> dict[str, Any]:
+        """REST connection object (values are strings like on FRITZ!OS 8.40)."""
+        return {
+            API_KEY_UID_REST: self.uid,
+            API_KEY_NAME: self.name,
+            API_KEY_ACTIVATED: str(int(self.activated)),
+            API_KEY_ACCESS_TYPE: ACCESS_TYPE_WIREGUARD,
+            API_KEY_STATE: (
+                WIREGUARD_STATE_READY if self.connected else _WIREGUARD_STATE_INACTIVE
+            ),
+            API_KEY_CONNECTED_SINCE: str(since if self.connected else 0),
+        }
+
+
+class FakeFritzBox:
+    """aiohttp server emulating the Fritz!Box web API used by FritzBoxVPNSession.
+
+    Use as ``async with FakeFritzBox(connections=50) as box`` and point a
+    session at ``box.host``. Without ``ssl_context`` the port speaks plain
+    HTTP, so HTTPS handshakes fail at once like on a box with HTTPS disabled.
+    Every request is counted in ``requests`` (``"METHOD /path"``).
+    """
+
+    def __init__(
+        self,
+        connections: int = 2,
+        *,
+        username: str = "fritz-user",
+        password: str = "fritz-secret",
+        login: str = LOGIN_PBKDF2,
+        pbkdf2_iterations: tuple[int, int] = (PBKDF2_ITER1, PBKDF2_ITER2),
+        latency: float = 0.0,
+        sid_lifetime: float = SID_INACTIVITY_TIMEOUT,
+        data_lua: bool = True,
+        rest: bool = True,
+        box_connections_path: str = BOX_PATH_INIT,
+        page_padding: int = 0,
+        apply_delay: float = 0.0,
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> None:
+        if login not in (LOGIN_MD5, LOGIN_PBKDF2):
+            raise ValueError(f"Unknown login flavour: {login}")
+        if box_connections_path not in BOX_PATHS:
+            raise ValueError(f"Unknown boxConnections path: {box_connections_path}")
+        self.username = username
+        self.password = password
+        self.login = login
+        self.pbkdf2_iterations = pbkdf2_iterations
+        self.latency = latency
+        self.sid_lifetime = sid_lifetime
+        self.data_lua = data_lua
+        self.rest = rest
+        self.box_connections_path = box_connections_path
+        self.page_padding = page_padding
+        self.apply_delay = apply_delay
+        self.ssl_context = ssl_context
+        # Upcoming listings (data.lua or REST) answered with no connections.
+        self.empty_polls = 0
+        self.requests: Counter[str] = Counter()
+        self.logins = 0
+        self.failed_logins = 0
+        self.boot_time = time.time()
+        self.connections: dict[str, FakeConnection] = {}
+        self._generation = 0
+        self._populate(connections)
+        # FRITZ!OS keeps salt1 fixed; only salt2 changes per challenge.
+        self._salt1 = secrets.token_hex(16)
+        self._stage1: bytes | None = None
+        # Outstanding challenges by MD5 challenge or PBKDF2 salt2.
+        self._challenges: dict[str, str] = {}
+        # SID -> monotonic time of last use.
+        self._sids: dict[str, float] = {}
+        self._blocked_until = 0.0
+        self._runner: web.AppRunner | None = None
+        self._port = 0
+
+    async def __aenter__(self) -> FakeFritzBox:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
+
+    @property
+    def host(self) -> str:
+        """``host:port`` to pass to FritzBoxVPNSession."""
+        return f"127.0.0.1:{self._port}"
+
+    @property
+    def total_requests(self) -> int:
+        """All requests served since the last reset_requests()."""
+        return sum(self.requests.values())
+
+    def reset_requests(self) -> None:
+        """Forget the request counters."""
+        self.requests.clear()
+
+    def expire_sessions(self) -> None:
+        """Drop every SID, as after the inactivity timeout."""
+        self._sids.clear()
+
+    def set_connection_count(self, count: int) -> None:
+        """Replace the connections with ``count`` fresh ones (UIDs kept by index)."""
+        self.connections.clear()
+        self._populate(count)
+
+    async def start(self) -> None:
+        """Listen on 127.0.0.1 (a free port first, the same port after reboot)."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get(API_LOGIN, self._handle_login_get)
+        app.router.add_post(API_LOGIN, self._handle_login_post)
+        app.router.add_post(API_DATA, self._handle_data_lua)
+        app.router.add_get(API_VPN_ROOT, self._handle_rest_listing)
+        app.router.add_get(f"{API_VPN_ROOT}/connection/{{uid}}", self._handle_rest_get)
+        app.router.add_put(f"{API_VPN_ROOT}/connection/{{uid}}", self._handle_rest_put)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(
+            runner,
+            "127.0.0.1",
+            self._port,
+            ssl_context=self.ssl_context,
+            reuse_address=True,
+        )
+        await site.start()
+        self._runner = runner
+        self._port = runner.addresses[0][1]
+
+    async def close(self) -> None:
+        """Stop listening and drop open connections."""
+        runner, self._runner = self._runner, None
+        if runner is not None:
+            await runner.cleanup()
+
+    async def reboot(
+        self, downtime: float = 0.0, *, empty_polls: int = 0, new_uids: bool = False
+    ) -> None:
+        """Emulate a reboot: refuse connections for ``downtime``, then come back.
+
+        All SIDs are lost. The first ``empty_polls`` listings afterwards are
+        empty, and ``new_uids`` re-issues every connection UID (names kept).
+        """
+        await self.close()
+        self._sids.clear()
+        self._challenges.clear()
+        self._blocked_until = 0.0
+        if downtime:
+            await asyncio.sleep(downtime)
+        if new_uids:
+            count = len(self.connections)
+            self._generation += 1
+            self.connections.clear()
+            self._populate(count)
+        self.empty_polls = empty_polls
+        self.boot_time = time.time()
+        await self.start()
+
+    def _populate(self, count: int) -> None:
+        """Add ``count`` connections; every other one active, every fourth up."""
+        for index in range(count):
+            uid = f"conn{self._generation}-{index:04d}"
+            self.connections[uid] = FakeConnection(
+                uid=uid,
+                name=f"VPN {index:04d}",
+                activated=index % 2 == 0,
+                connected=index % 4 == 0,
+            )
+
+    @web.middleware
+    async def _middleware(
+        self, request: web.Request, handler: Any
+    ) -> web.StreamResponse:
+        self.requests[f"{request.method} {request.path}"] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return await handler(request)
+
+    def _sid_valid(self, sid: str | None, *, renew: bool = True) -> bool:
+        """True for a known SID used within sid_lifetime; renews it by default."""
+        if not sid:
+            return False
+        last_used = self._sids.get(sid)
+        now = time.monotonic()
+        if last_used is None or now - last_used >= self.sid_lifetime:
+            self._sids.pop(sid, None)
+            return False
+        if renew:
+            self._sids[sid] = now
+        return True
+
+    def _block_time(self) -> int:
+        """Seconds left before the next login attempt is accepted."""
+        return max(0, int(self._blocked_until - time.monotonic() + 0.999))
+
+    def _session_info(self, sid: str, challenge: str) -> web.Response:
+        return web.Response(
+            text=(
+                '<?xml version="1.0" encoding="utf-8"?><SessionInfo>'
+                f"<SID>{sid}</SID><Challenge>{challenge}</Challenge>"
+                f"<BlockTime>{self._block_time()}</BlockTime><Rights></Rights>"
+                "</SessionInfo>"
+            ),
+            content_type="text/xml",
+        )
+
+    def _new_challenge(self, version2: bool) -> str:
+        if self.login == LOGIN_PBKDF2 and version2:
+            iter1, iter2 = self.pbkdf2_iterations
+            salt2 = secrets.token_hex(16)
+            challenge = f"2${iter1}${self._salt1}${iter2}${salt2}"
+            self._challenges[salt2] = challenge
+        else:
+            challenge = secrets.token_hex(4)
+            self._challenges[challenge] = challenge
+        return challenge
+
+    async def _handle_login_get(self, request: web.Request) -> web.Response:
+        challenge = self._new_challenge(request.query.get("version") == "2")
+        sid = request.query.get(LOGIN_QUERY_SID)
+        if not self._sid_valid(sid):
+            sid = INVALID_SID_VALUE
+        return self._session_info(sid, challenge)
+
+    async def _expected_response(self, response: str) -> tuple[str, str] | None:
+        """(challenge, expected response) for a submitted response, if issued."""
+        if "$" in response:
+            salt2 = response.split("$", 1)[0]
+            challenge = self._challenges.pop(salt2, None)
+            if challenge is None:
+                return None
+            _, iter1, salt1, iter2, _ = challenge.split("$")
+            loop = asyncio.get_running_loop()
+            if self._stage1 is None:
+                self._stage1 = await loop.run_in_executor(
+                    None,
+                    hashlib.pbkdf2_hmac,
+                    "sha256",
+                    self.password.encode(),
+                    bytes.fromhex(salt1),
+                    int(iter1),
+                )
+            hash2 = await loop.run_in_executor(
+                None,
+                hashlib.pbkdf2_hmac,
+                "sha256",
+                self._stage1,
+                bytes.fromhex(salt2),
+                int(iter2),
+            )
+            return challenge, f"{salt2}${hash2.hex()}"
+        challenge = self._challenges.pop(response.rsplit("-", 1)[0], None)
+        if challenge is None:
+            return None
+        md5_input = f"{challenge}-{self.password}".encode("utf-16le")
+        return challenge, f"{challenge}-{hashlib.md5(md5_input).hexdigest()}"
+
+    async def _handle_login_post(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        response = str(form.get(LOGIN_FORM_RESPONSE, ""))
+        expected = await self._expected_response(response)
+        if (
+            time.monotonic() >= self._blocked_until
+            and expected is not None
+            and form.get(LOGIN_FORM_USERNAME) == self.username
+            and response == expected[1]
+        ):
+            self.logins += 1
+            self._blocked_until = 0.0
+            sid = secrets.token_hex(8)
+            self._sids[sid] = time.monotonic()
+            return self._session_info(sid, expected[0])
+        self.failed_logins += 1
+        block = min(2 ** (self.failed_logins - 1), BLOCK_TIME_MAX)
+        self._blocked_until = time.monotonic() + block
+        return self._session_info(INVALID_SID_VALUE, self._new_challenge(True))
+
+    def _listing(self) -> list[FakeConnection]:
+        """Connections for one listing response (empty while empty_polls > 0)."""
+        if self.empty_polls > 0:
+            self.empty_polls -= 1
+            return []
+        now = time.monotonic()
+        for conn in self.connections.values():
+            conn.settle(now)
+        return list(self.connections.values())
+
+    def _data_lua_payload(self, page: str) -> dict[str, Any]:
+        box = {conn.uid: conn.as_box_connection() for conn in self._listing()}
+        data: dict[str, Any] = {
+            f"section{index}": {"value": "x" * 64} for index in range(self.page_padding)
+        }
+        if self.box_connections_path == BOX_PATH_INIT:
+            data[API_KEY_INIT] = {API_KEY_BOX_CONNECTIONS: box}
+        elif self.box_connections_path == BOX_PATH_INIT_PAGE:
+            data[API_KEY_INIT] = {page: {API_KEY_BOX_CONNECTIONS: box}}
+        elif self.box_connections_path == BOX_PATH_DATA:
+            data[API_KEY_BOX_CONNECTIONS] = box
+        else:
+            data[page] = {API_KEY_BOX_CONNECTIONS: box}
+        return {"pid": page, API_KEY_DATA: data}
+
+    async def _handle_data_lua(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        sid = form.get(LOGIN_QUERY_SID)
+        if not self._sid_valid(
+            str(sid) if sid else None, renew="no_sidrenew" not in form
+        ):
+            return web.Response(text=_LOGIN_PAGE_HTML, content_type="text/html")
+        page = str(form.get("page", ""))
+        if not self.data_lua or page != API_PAGE_SHAREWIREGUARD:
+            return web.json_response({"pid": page, API_KEY_DATA: {}})
+        return web.json_response(self._data_lua_payload(page))
+
+    def _rest_denied(self, request: web.Request) -> web.Response | None:
+        """404 without REST support, 403 without a valid AVM-SID header."""
+        if not self.rest:
+            return web.Response(status=404)
+        auth = request.headers.get(hdrs.AUTHORIZATION, "")
+        if not auth.startswith(AUTH_HEADER_PREFIX) or not self._sid_valid(
+            auth[len(AUTH_HEADER_PREFIX) :]
+        ):
+            return web.Response(status=403)
+        return None
+
+    async def _handle_rest_listing(self, request: web.Request) -> web.Response:
+        if (denied := self._rest_denied(request)) is not None:
+            return denied
+        since = int(self.boot_time)
+        return web.json_response(
+            {API_KEY_CONNECTION: [conn.as_rest(since) for conn in self._listing()]}
+        )
+
+    def _rest_connection(self, request: web.Request) -> FakeConnection | None:
+        conn = self.connections.get(request.match_info["uid"])
+        if conn is not None:
+            conn.settle(time.monotonic())
+        return conn
+
+    async def _handle_rest_get(self, request: web.Request) -> web.Response:
+        if (denied := self._rest_denied(request)) is not None:
+            return denied
+        if (conn := self._rest_connection(request)) is None:
+            return web.Response(status=404)
+        return web.json_response(conn.as_rest(int(self.boot_time)))
+
+    async def _handle_rest_put(self, request: web.Request) -> web.Response:
+        if (denied := self._rest_denied(request)) is not None:
+            return denied
+        if (conn := self._rest_connection(request)) is None:
+            return web.Response(status=404)
+        try:
+            body = await request.json()
+            target = bool(int(body[API_KEY_ACTIVATED]))
+        except (ValueError, TypeError, KeyError):
+            return web.Response(status=400, text="invalid activated value")
+        conn.pending = (target, time.monotonic() + self.apply_delay)
+        conn.settle(time.monotonic())
+        return web.json_response({})
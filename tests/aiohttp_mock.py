@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterator
 from typing import Any
 
 
+class MockStreamReader:
+    """Body stream with the chunked reads of aiohttp.StreamReader."""
+
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    async def iter_chunked(self, n: int) -> AsyncIterator[bytes]:
+        for start in range(0, len(self._body), n):
+            yield self._body[start : start + n]
+
+
 class MockAiohttpResponse:
     """Minimal async context manager mimicking aiohttp.ClientResponse."""
 
@@ -20,10 +32,15 @@ class MockAiohttpResponse:
         self.status = status
         self._text = text
         self.headers = headers or {}
+        self.charset: str | None = None
+        self.content = MockStreamReader(text.encode())
 
     async def text(self) -> str:
         return self._text
 
+    async def read(self) -> bytes:
+        return self._text.encode()
+
     async def __aenter__(self) -> MockAiohttpResponse:
         return self
 
@@ -31,8 +48,24 @@ class MockAiohttpResponse:
         return None
 
 
+class HangingAiohttpResponse(MockAiohttpResponse):
+    """Response that never arrives (e.g. a silently dropped HTTPS port)."""
+
+    def __init__(self) -> None:
+        super().__init__(0)
+        self.cancelled = False
+
+    async def __aenter__(self) -> MockAiohttpResponse:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return self
+
+
 class QueuedAiohttpSession:
-    """ClientSession that returns queued responses in order for get/post/put."""
+    """ClientSession that returns queued responses in order for get/post/put/head."""
 
     def __init__(self, responses: list[MockAiohttpResponse | BaseException]) -> None:
         self._responses: Iterator[MockAiohttpResponse | BaseException] = iter(responses)
@@ -57,6 +90,9 @@ class QueuedAiohttpSession:
     def put(self, url: str, **kwargs: Any) -> MockAiohttpResponse:
         return self._dequeue("PUT", url, **kwargs)
 
+    def head(self, url: str, **kwargs: Any) -> MockAiohttpResponse:
+        return self._dequeue("HEAD", url, **kwargs)
+
 
 def json_response(payload: dict[str, Any], status: int = 200) -> MockAiohttpResponse:
     """Build a JSON data.lua style response."""
@@ -0,0 +1,41 @@
+"""Smoke tests for the offline benchmark suite."""
+
+import pytest
+from benchmarks import bench_parsing
+from benchmarks.bench_session import compare, run_benchmarks
+
+
+@pytest.mark.asyncio
+async def test_benchmark_counts_requests_per_poll() -> None:
+    """A warm poll against the emulator costs exactly one request."""
+    results = await run_benchmarks([1], 2, 0.0, ["listing_warm_rest"])
+    assert [r["name"] for r in results] == ["listing_warm_rest"]
+    assert results[0]["requests"] == 1
+    assert results[0]["wall_s"]["min"] <= results[0]["wall_s"]["median"]
+
+
+def test_compare_flags_extra_requests_and_slowdowns() -> None:
+    """More requests or a much slower median are regressions; noise is not."""
+
+    def result(requests: int, wall: float) -> dict:
+        return {
+            "name": "toggle",
+            "connections": 50,
+            "requests": requests,
+            "wall_s": {"median": wall},
+        }
+
+    assert compare([result(2, 0.25)], [result(2, 0.3)], 0.5) == []
+    assert len(compare([result(2, 0.25)], [result(3, 0.5)], 0.5)) == 2
+    assert compare([result(1, 0.0005)], [result(1, 0.002)], 0.5) == []
+
+
+def test_parsing_benchmark_times_every_parser() -> None:
+    """Object and raw-body parsers are timed for each connection count."""
+    results = bench_parsing.run_benchmarks([3], rounds=1, number=2, page_padding=4)
+    assert [r["name"] for r in results] == [
+        *bench_parsing.PARSERS,
+        *bench_parsing.BODY_PARSERS,
+    ]
+    assert all(r["payload_bytes"] > 0 for r in results)
+    assert all(r["peak_bytes"] > 0 for r in results[-2:])
@@ -0,0 +1,68 @@
+"""Tests for the circuit breaker and the login-page reachability probe."""
+
+import random
+from unittest.mock import patch
+
+import pytest
+from fritzboxvpn import BreakerState, CircuitBreaker, FritzBoxVPNSession
+
+from tests.aiohttp_mock import MockAiohttpResponse, QueuedAiohttpSession
+from tests.fixtures import MOCK_HOST, MOCK_PASSWORD, MOCK_USERNAME
+
+
+def test_breaker_opens_after_threshold_and_half_opens_when_due() -> None:
+    """Consecutive failures open the breaker; an expired wait allows one probe."""
+    breaker = CircuitBreaker(
+        failure_threshold=2, base_delay=10, max_delay=25, rng=random.Random(1)
+    )
+    first = breaker.record_failure()
+    assert breaker.state is BreakerState.CLOSED
+    assert 8 <= first <= 10
+
+    second = breaker.record_failure()
+    assert breaker.state is BreakerState.OPEN
+    assert 16 <= second <= 20
+    assert breaker.before_request() is BreakerState.OPEN
+    assert breaker.as_dict()["next_attempt"] is not None
+
+    assert breaker.record_failure() <= 25
+    with patch("fritzboxvpn.breaker.time.monotonic", return_value=10**9):
+        assert breaker.before_request() is BreakerState.HALF_OPEN
+
+    breaker.record_success()
+    assert breaker.before_request() is BreakerState.CLOSED
+    assert breaker.as_dict() == {
+        "state": "closed",
+        "consecutive_failures": 0,
+        "next_attempt": None,
+        "seconds_until_retry": 0.0,
+    }
+
+
+def test_breaker_jitter_spreads_retries() -> None:
+    """Two breakers with different seeds do not retry in lockstep."""
+    delays = {
+        CircuitBreaker(base_delay=60, rng=random.Random(seed)).record_failure()
+        for seed in range(5)
+    }
+    assert len(delays) == 5
+    assert all(48 <= delay <= 60 for delay in delays)
+
+
+@pytest.mark.asyncio
+async def test_probe_reachable_tries_other_protocol() -> None:
+    """A refused HTTPS port falls through to HTTP; any non-5xx answer counts."""
+    http = QueuedAiohttpSession(
+        [OSError(111, "refused"), MockAiohttpResponse(200, text="")]
+    )
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    assert await fb.async_probe_reachable() is True
+    assert [(method, url) for method, url, _ in http.requests] == [
+        ("HEAD", f"https://{MOCK_HOST}/login_sid.lua"),
+        ("HEAD", f"http://{MOCK_HOST}/login_sid.lua"),
+    ]
+    assert fb.sid is None
+
+    http = QueuedAiohttpSession([TimeoutError(), MockAiohttpResponse(503)])
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    assert await fb.async_probe_reachable() is False
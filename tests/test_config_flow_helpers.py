@@ -1,9 +1,12 @@
 """Unit tests for entity registry helpers (registry repair, orphans)."""
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 from custom_components.fritzbox_vpn.const import DOMAIN, UNIQUE_ID_PREFIX
 from custom_components.fritzbox_vpn.entity_registry import (
     connection_uid_from_entity_unique_id,
+    count_repairable_entity_issues,
     entity_id_base,
     entity_id_suffix_number,
     expected_object_id_for_device_suffix,
@@ -209,6 +212,34 @@ async def test_orphaned_entities(hass: HomeAssistant) -> None:
     assert uids_from_entity_entries(to_remove) == {"gone"}
 
 
+@pytest.mark.asyncio
+async def test_registry_index_shared_by_helpers_and_kept_current(
+    hass: HomeAssistant,
+) -> None:
+    """Helpers share one registry scan until a registry update touches the entry."""
+    entry = MockConfigEntry(domain=DOMAIN, data={"host": "1.2.3.4"})
+    entry.add_to_hass(hass)
+    registry = er.async_get(hass)
+    registry.async_get_or_create(
+        "switch", DOMAIN, f"{UNIQUE_ID_PREFIX}gone_switch", config_entry=entry
+    )
+    scans = MagicMock(wraps=er.async_entries_for_config_entry)
+
+    with patch.object(er, "async_entries_for_config_entry", scans):
+        count_repairable_entity_issues(hass, entry.entry_id)
+        get_orphaned_entity_entries(hass, entry.entry_id, current_uids=set())
+        assert scans.call_count == 1
+
+        registry.async_get_or_create(
+            "switch", DOMAIN, f"{UNIQUE_ID_PREFIX}new_switch", config_entry=entry
+        )
+        to_remove, _ = get_orphaned_entity_entries(
+            hass, entry.entry_id, current_uids={"gone"}
+        )
+        assert scans.call_count == 2
+        assert uids_from_entity_entries(to_remove) == {"new"}
+
+
 @pytest.mark.asyncio
 async def test_repair_entity_id_suffixes(hass: HomeAssistant) -> None:
     """Repair renames suffixed entity to base when base is free."""
@@ -5,10 +5,17 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from custom_components.fritzbox_vpn.const import (
+    ADAPTIVE_BACKOFF_POLLS,
+    ADAPTIVE_FAST_INTERVAL,
+    CONF_ADAPTIVE_POLLING,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_PERSIST_SESSION,
     CONF_UPDATE_INTERVAL,
     STATUS_CONNECTED,
     STATUS_DISABLED,
     STATUS_ENABLED,
+    identity_store_key,
+    session_store_key,
 )
 from custom_components.fritzbox_vpn.coordinator import (
     FritzBoxVPNCoordinator,
@@ -69,6 +76,133 @@ async def test_coordinator_update_success(hass: HomeAssistant) -> None:
     assert coordinator.get_vpn_status("conn-def") == STATUS_DISABLED
 
 
+@pytest.mark.asyncio
+async def test_coordinator_unchanged_listing_skips_listeners(
+    hass: HomeAssistant,
+) -> None:
+    """A byte-identical listing keeps data and does not notify entities."""
+    coordinator = FritzBoxVPNCoordinator(
+        hass,
+        {"host": MOCK_HOST, "username": MOCK_USERNAME, "password": MOCK_PASSWORD},
+        {CONF_UPDATE_INTERVAL: 60},
+    )
+    connections = dict(MOCK_VPN_CONNECTIONS)
+    coordinator.fritz_session.async_get_vpn_connections = AsyncMock(
+        return_value=connections
+    )
+    listener = MagicMock()
+    coordinator.async_add_listener(listener)
+
+    await coordinator.async_refresh()
+    assert listener.call_count == 1
+
+    with (
+        patch.object(
+            type(coordinator.fritz_session),
+            "listing_unchanged",
+            new=property(lambda self: True),
+        ),
+        patch.object(coordinator, "_process_listing") as process_mock,
+    ):
+        await coordinator.async_refresh()
+
+    process_mock.assert_not_called()
+    assert listener.call_count == 1
+    assert coordinator.data is connections
+
+
+@pytest.mark.asyncio
+async def test_coordinator_dispatches_only_changed_connections(
+    hass: HomeAssistant,
+) -> None:
+    """Connection listeners run only for their own changed payload."""
+    coordinator = FritzBoxVPNCoordinator(
+        hass,
+        {"host": MOCK_HOST, "username": MOCK_USERNAME, "password": MOCK_PASSWORD},
+        {CONF_UPDATE_INTERVAL: 60},
+    )
+    abc, deff, platform = MagicMock(), MagicMock(), MagicMock()
+    coordinator.async_add_listener(abc, "conn-abc")
+    coordinator.async_add_listener(deff, "conn-def")
+    coordinator.async_add_listener(platform)
+
+    coordinator.async_set_updated_data(dict(MOCK_VPN_CONNECTIONS))
+    assert (abc.call_count, deff.call_count, platform.call_count) == (1, 1, 1)
+
+    changed = dict(MOCK_VPN_CONNECTIONS)
+    changed["conn-def"] = {**changed["conn-def"], "active": True}
+    coordinator.async_set_updated_data(changed)
+    assert (abc.call_count, deff.call_count, platform.call_count) == (1, 2, 2)
+
+    coordinator._uid_remap["conn-abc"] = "conn-new"
+    remapped = {"conn-new": changed["conn-abc"], "conn-def": changed["conn-def"]}
+    coordinator.async_set_updated_data(remapped)
+    assert (abc.call_count, deff.call_count) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_coordinator_adaptive_polling_backs_off_and_resets(
+    hass: HomeAssistant,
+) -> None:
+    """Unchanged polls back off to the ceiling; toggles and changes poll fast."""
+    coordinator = FritzBoxVPNCoordinator(
+        hass,
+        {"host": MOCK_HOST, "username": MOCK_USERNAME, "password": MOCK_PASSWORD},
+        {
+            CONF_UPDATE_INTERVAL: 30,
+            CONF_ADAPTIVE_POLLING: True,
+            CONF_MAX_UPDATE_INTERVAL: 100,
+        },
+    )
+    coordinator.fritz_session.async_get_vpn_connections = AsyncMock(
+        return_value=MOCK_VPN_CONNECTIONS
+    )
+    coordinator.fritz_session.async_toggle_vpn = AsyncMock(return_value=True)
+
+    for _ in range(2 * ADAPTIVE_BACKOFF_POLLS + 1):
+        coordinator.data = await coordinator._async_update_data()
+    assert coordinator.effective_update_interval == 100
+
+    await coordinator.toggle_vpn("conn-abc", True)
+    assert coordinator.effective_update_interval == ADAPTIVE_FAST_INTERVAL
+
+    with patch("custom_components.fritzbox_vpn.coordinator.time.monotonic") as now:
+        now.return_value = 10**9
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.effective_update_interval == 30
+
+        changed = dict(MOCK_VPN_CONNECTIONS)
+        changed["conn-def"] = {**changed["conn-def"], "name": "Renamed"}
+        coordinator.fritz_session.async_get_vpn_connections.return_value = changed
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.effective_update_interval == ADAPTIVE_FAST_INTERVAL
+
+
+@pytest.mark.asyncio
+async def test_coordinator_toggle_publishes_verified_listing(
+    hass: HomeAssistant,
+) -> None:
+    """A verified toggle snapshot replaces data without another poll."""
+    coordinator = FritzBoxVPNCoordinator(
+        hass,
+        {"host": MOCK_HOST, "username": MOCK_USERNAME, "password": MOCK_PASSWORD},
+        {CONF_UPDATE_INTERVAL: 60},
+    )
+    coordinator.async_set_updated_data(dict(MOCK_VPN_CONNECTIONS))
+    snapshot = dict(MOCK_VPN_CONNECTIONS)
+    snapshot["conn-def"] = {**snapshot["conn-def"], "active": True}
+    session = coordinator.fritz_session
+    session.async_toggle_vpn = AsyncMock(return_value=True)
+    session.async_get_vpn_connections = AsyncMock()
+
+    with patch.object(session, "listing_snapshot", return_value=snapshot):
+        assert await coordinator.toggle_vpn("conn-def", True) is True
+
+    session.async_get_vpn_connections.assert_not_awaited()
+    assert coordinator.data is snapshot
+    assert coordinator.get_vpn_status("conn-def") == STATUS_ENABLED
+
+
 @pytest.mark.asyncio
 async def test_coordinator_status_connected(hass: HomeAssistant) -> None:
     """Connected VPN reports connected status."""
@@ -146,3 +280,108 @@ async def test_coordinator_connection_error_retry(hass: HomeAssistant) -> None:
     with pytest.raises(UpdateFailed) as exc_info:
         await coordinator._async_update_data()
     assert exc_info.value.retry_after is not None
+
+
+@pytest.mark.asyncio
+async def test_coordinator_restores_persisted_session_state(
+    hass: HomeAssistant, hass_storage
+) -> None:
+    """With persist_session enabled, stored state reaches the session at setup."""
+    state = {"sid": "deadbeef", "protocol": "http", "listing_mode": "rest"}
+    hass_storage[session_store_key("entry-1")] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": session_store_key("entry-1"),
+        "data": state,
+    }
+    coordinator = FritzBoxVPNCoordinator(
+        hass,
+        {"host": MOCK_HOST, "username": MOCK_USERNAME, "password": MOCK_PASSWORD},
+        {CONF_PERSIST_SESSION: True},
+        "entry-1",
+    )
+    coordinator.fritz_session.restore_session_state = MagicMock()
+    await coordinator._async_setup()
+    coordinator.fritz_session.restore_session_state.assert_called_once_with(state)
+
+
+@pytest.mark.asyncio
+async def test_coordinator_saves_session_state_only_on_change(
+    hass: HomeAssistant,
+) -> None:
+    """Session state is queued for storage only when it differs from the last save."""
+    coordinator = FritzBoxVPNCoordinator(
+        hass,
+        {"host": MOCK_HOST, "username": MOCK_USERNAME, "password": MOCK_PASSWORD},
+        {CONF_PERSIST_SESSION: True},
+        "entry-1",
+    )
+    coordinator.fritz_session.async_get_vpn_connections = AsyncMock(
+        return_value=MOCK_VPN_CONNECTIONS
+    )
+    coordinator.fritz_session.export_session_state = MagicMock(
+        return_value={"sid": "deadbeef"}
+    )
+    with patch.object(coordinator._session_store, "async_delay_save") as delay_save:
+        await coordinator._async_update_data()
+        await coordinator._async_update_data()
+    delay_save.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_identity_state_round_trips_through_store(
+    hass: HomeAssistant, hass_storage
+) -> None:
+    """Seen UIDs, names and an active recovery survive a coordinator restart."""
+    config = {"host": MOCK_HOST, "username": MOCK_USERNAME, "password": MOCK_PASSWORD}
+    coordinator = FritzBoxVPNCoordinator(hass, config, None, "entry-1")
+    coordinator.async_set_updated_data(dict(MOCK_VPN_CONNECTIONS))
+    coordinator.fritz_session.async_get_vpn_connections = AsyncMock(
+        side_effect=TimeoutError("box rebooting")
+    )
+    coordinator.fritz_session.async_get_uptime = AsyncMock(return_value=None)
+    with (
+        patch.object(coordinator._identity_store, "async_delay_save") as delay_save,
+        pytest.raises(UpdateFailed),
+    ):
+        await coordinator._async_update_data()
+    delay_save.assert_called_once()
+    state = delay_save.call_args.args[0]()
+
+    hass_storage[identity_store_key("entry-1")] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": identity_store_key("entry-1"),
+        "data": state,
+    }
+    restarted = FritzBoxVPNCoordinator(hass, config, None, "entry-1")
+    await restarted._async_setup()
+    assert restarted._seen_uids == set(MOCK_VPN_CONNECTIONS)
+    assert restarted._uid_names == {
+        uid: conn["name"] for uid, conn in MOCK_VPN_CONNECTIONS.items()
+    }
+    assert restarted._in_recovery()
+    assert restarted.export_identity_state() == state
+
+
+@pytest.mark.asyncio
+async def test_coordinator_without_persist_session_removes_store(
+    hass: HomeAssistant, hass_storage
+) -> None:
+    """Persisted session state is dropped when the option is off."""
+    hass_storage[session_store_key("entry-1")] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": session_store_key("entry-1"),
+        "data": {"sid": "deadbeef"},
+    }
+    coordinator = FritzBoxVPNCoordinator(
+        hass,
+        {"host": MOCK_HOST, "username": MOCK_USERNAME, "password": MOCK_PASSWORD},
+        None,
+        "entry-1",
+    )
+    coordinator.fritz_session.restore_session_state = MagicMock()
+    await coordinator._async_setup()
+    coordinator.fritz_session.restore_session_state.assert_not_called()
+    assert session_store_key("entry-1") not in hass_storage
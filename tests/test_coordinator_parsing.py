@@ -1,6 +1,9 @@
 """Tests for FritzBox VPN coordinator parsing and login helpers."""
 
-from custom_components.fritzbox_vpn.coordinator import _resolve_update_interval_seconds
+from custom_components.fritzbox_vpn.coordinator import (
+    _resolve_update_interval_seconds,
+    normalize_max_update_interval,
+)
 from fritzboxvpn import FritzBoxVPNSession
 from fritzboxvpn.const import (
     API_KEY_ACTIVE,
@@ -65,6 +68,14 @@ def test_resolve_update_interval() -> None:
     assert _resolve_update_interval_seconds({"update_interval": 45}, None) == 45
 
 
+def test_normalize_max_update_interval_bounds() -> None:
+    """Adaptive ceiling never drops below the update interval or exceeds 1 h."""
+    assert normalize_max_update_interval(None, 30) == 300
+    assert normalize_max_update_interval(10, 30) == 30
+    assert normalize_max_update_interval(99999, 30) == 3600
+    assert normalize_max_update_interval("bad", 30) == 300
+
+
 def test_pbkdf2_response_format() -> None:
     """PBKDF2 response uses expected format for valid challenge."""
     challenge = (
@@ -1,19 +1,30 @@
 """Integration-style tests for FritzBoxVPNSession HTTP flows."""
 
+import asyncio
+import hashlib
+import time
 from unittest.mock import AsyncMock, patch
 
 import pytest
-from aiohttp import hdrs
-from fritzboxvpn import FritzBoxVPNSession
+from aiohttp import hdrs, web
+from aiohttp.test_utils import TestServer
+from fritzboxvpn import FritzBoxVPNSession, ListingModeStats
 from fritzboxvpn.const import (
     API_DATA,
     API_VPN_ROOT,
     AUTH_HEADER_PREFIX,
     HEADER_CLIENT_NAME,
     HEADER_VALUE_CLIENT_NAME,
+    SID_INACTIVITY_TIMEOUT,
 )
+from fritzboxvpn.parsing import decode_json_body
 
-from tests.aiohttp_mock import MockAiohttpResponse, QueuedAiohttpSession, json_response
+from tests.aiohttp_mock import (
+    HangingAiohttpResponse,
+    MockAiohttpResponse,
+    QueuedAiohttpSession,
+    json_response,
+)
 from tests.fixtures import (
     LOGIN_XML_CHALLENGE,
     LOGIN_XML_SID,
@@ -24,6 +35,14 @@ from tests.fixtures import (
     MOCK_USERNAME,
 )
 
+# GET /api/v0/generic/vpn/connection/<uid> after switching conn-abc off.
+MOCK_REST_CONNECTION_OFF = {
+    "UID": "conn-abc",
+    "name": "Office VPN",
+    "activated": "0",
+    "access_type": "4",
+}
+
 LOGIN_XML_INVALID = (
     '<?xml version="1.0"?><SessionInfo><SID>0000000000000000</SID></SessionInfo>'
 )
@@ -162,12 +181,17 @@ async def test_session_toggle_off_success() -> None:
             *_login_sequence(),
             json_response(MOCK_DATA_LUA_JSON),
             MockAiohttpResponse(200, text="ok"),
-            json_response(MOCK_DATA_VPN_OFF),
+            json_response(MOCK_REST_CONNECTION_OFF),
         ]
     )
     fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
     with patch("fritzboxvpn.session.asyncio.sleep", new=AsyncMock()):
         assert await fb.async_toggle_vpn("conn-abc", False) is True
+    snapshot = fb.listing_snapshot()
+    assert snapshot is not None
+    assert snapshot["conn-abc"]["active"] is False
+    snapshot["conn-abc"] = {}
+    assert fb.listing_snapshot()["conn-abc"]["active"] is False
 
 
 @pytest.mark.asyncio
@@ -194,7 +218,7 @@ async def test_session_toggle_put_forbidden_retry() -> None:
             *_login_sequence(),
             json_response(MOCK_DATA_LUA_JSON),
             MockAiohttpResponse(200, text="ok"),
-            json_response(MOCK_DATA_VPN_OFF),
+            json_response(MOCK_REST_CONNECTION_OFF),
         ]
     )
     fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
@@ -285,3 +309,613 @@ async def test_session_fritzos_840_rest_mode_skips_data_lua_on_next_poll() -> No
         if method == "POST" and url.endswith(API_DATA)
     ]
     assert len(data_lua_posts) == 1
+
+
+@pytest.mark.asyncio
+async def test_pbkdf2_relogin_reuses_cached_first_stage() -> None:
+    """Second PBKDF2 login with unchanged salt1/iter1 only hashes stage two."""
+    challenge = (
+        "2$5$0123456789abcdef0123456789abcdef$5$fedcba9876543210fedcba9876543210"
+    )
+    pbkdf2_challenge_xml = f'<?xml version="1.0"?><SessionInfo><Challenge>{challenge}</Challenge></SessionInfo>'
+    http = QueuedAiohttpSession(
+        [
+            MockAiohttpResponse(200, text=pbkdf2_challenge_xml),
+            MockAiohttpResponse(200, text=LOGIN_XML_SID),
+            MockAiohttpResponse(200, text=pbkdf2_challenge_xml),
+            MockAiohttpResponse(200, text=LOGIN_XML_SID),
+        ]
+    )
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    with patch(
+        "fritzboxvpn.session.hashlib.pbkdf2_hmac", wraps=hashlib.pbkdf2_hmac
+    ) as pbkdf2:
+        await fb.async_get_session()
+        fb.invalidate_session()
+        await fb.async_get_session()
+    assert pbkdf2.call_count == 3
+    responses = [
+        kwargs["data"]["response"]
+        for method, _, kwargs in http.requests
+        if method == "POST"
+    ]
+    expected = FritzBoxVPNSession._calculate_pbkdf2_response(challenge, MOCK_PASSWORD)
+    assert responses == [expected, expected]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_logins_share_one_challenge_response() -> None:
+    """Callers racing on an empty SID join the in-flight login."""
+    http = QueuedAiohttpSession(_login_sequence())
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    results = await asyncio.gather(*(fb.async_get_session() for _ in range(3)))
+    assert {sid for _, sid in results} == {"deadbeef"}
+    assert len(http.requests) == 3
+    assert fb.stats.logins == 1
+    assert fb.stats.logins_coalesced == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_login_failure_reaches_every_caller() -> None:
+    """A failed shared login raises for all joined callers and is not cached."""
+    http = QueuedAiohttpSession(
+        [
+            MockAiohttpResponse(200, text=LOGIN_XML_CHALLENGE),
+            MockAiohttpResponse(200, text=LOGIN_XML_CHALLENGE),
+            MockAiohttpResponse(200, text=LOGIN_XML_INVALID),
+            *_login_sequence(),
+        ]
+    )
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    results = await asyncio.gather(
+        fb.async_get_session(), fb.async_get_session(), return_exceptions=True
+    )
+    assert all(isinstance(r, ValueError) for r in results)
+    _, sid = await fb.async_get_session()
+    assert sid == "deadbeef"
+    assert fb.stats.logins == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_listing_probe_runs_once() -> None:
+    """Concurrent polls without a known listing mode share one probe."""
+    http = QueuedAiohttpSession([json_response(MOCK_DATA_LUA_JSON)])
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    fb.sid = "deadbeef"
+    first, second = await asyncio.gather(
+        fb.async_get_vpn_connections(), fb.async_get_vpn_connections()
+    )
+    assert first == second
+    assert "conn-abc" in first
+    assert fb.stats.listing_probes == 1
+    assert fb.stats.listing_probes_coalesced == 1
+
+
+def _login_sid_xml(sid: str, challenge: str = "12345") -> str:
+    return (
+        f'<?xml version="1.0"?><SessionInfo><SID>{sid}</SID>'
+        f"<Challenge>{challenge}</Challenge></SessionInfo>"
+    )
+
+
+@pytest.mark.asyncio
+async def test_restored_state_validates_sid_with_one_request() -> None:
+    """Restored SID/protocol/listing mode skip login and probe after one check."""
+    http = QueuedAiohttpSession(
+        [
+            MockAiohttpResponse(200, text=_login_sid_xml("deadbeef")),
+            json_response(MOCK_REST_VPN_JSON),
+        ]
+    )
+    source = FritzBoxVPNSession(
+        QueuedAiohttpSession([]), MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD
+    )
+    source._set_sid("deadbeef")
+    source.protocol = "http"
+    source._listing_mode = "rest"
+    source._firmware_fingerprint = "md5"
+
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    assert fb.restore_state(source.export_state()) is True
+    connections = await fb.async_get_vpn_connections()
+
+    assert "conn-abc" in connections
+    assert [method for method, _, _ in http.requests] == ["GET", "GET"]
+    assert http.requests[0][1] == (
+        f"http://{MOCK_HOST}/login_sid.lua?version=2&sid=deadbeef"
+    )
+    assert fb.stats.logins == 0
+
+
+@pytest.mark.asyncio
+async def test_restored_invalid_sid_falls_back_to_login() -> None:
+    """An expired restored SID triggers a normal login, keeping listing mode."""
+    http = QueuedAiohttpSession(
+        [
+            MockAiohttpResponse(200, text=_login_sid_xml("0000000000000000")),
+            *_login_sequence(),
+            json_response(MOCK_REST_VPN_JSON),
+        ]
+    )
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    fb.restore_state(
+        {
+            "sid": "stale",
+            "sid_validated_at": time.time(),
+            "protocol": "https",
+            "listing_mode": "rest",
+            "firmware_fingerprint": "md5",
+        }
+    )
+    connections = await fb.async_get_vpn_connections()
+    assert "conn-abc" in connections
+    assert fb.sid == "deadbeef"
+    assert not any(url.endswith(API_DATA) for _, url, _ in http.requests)
+
+
+def test_restore_state_ignores_sid_past_inactivity_timeout() -> None:
+    """SIDs older than the FRITZ!OS inactivity timeout are not restored."""
+    fb = FritzBoxVPNSession(
+        QueuedAiohttpSession([]), MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD
+    )
+    restored = fb.restore_state(
+        {
+            "sid": "old",
+            "sid_validated_at": time.time() - SID_INACTIVITY_TIMEOUT - 1,
+            "protocol": "http",
+            "listing_mode": "bogus",
+        }
+    )
+    assert restored is False
+    assert fb.sid is None
+    assert fb.protocol == "http"
+    assert fb._listing_mode is None
+
+
+@pytest.mark.asyncio
+async def test_keepalive_renews_sid_before_inactivity_timeout() -> None:
+    """Keep-alive renews an ageing SID with one login_sid.lua check."""
+    http = QueuedAiohttpSession(
+        [MockAiohttpResponse(200, text=_login_sid_xml("deadbeef"))]
+    )
+    fb = FritzBoxVPNSession(
+        http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD, keepalive=True
+    )
+    fb.sid = "deadbeef"
+    fb._sid_validated_at = time.time() - SID_INACTIVITY_TIMEOUT
+    assert fb._keepalive_delay() == 0
+
+    assert await fb._async_keepalive_once() is True
+    assert fb.sid == "deadbeef"
+    assert fb._keepalive_delay() > 0
+    assert fb.stats.sid_refreshes == 1
+    assert http.requests[0][1].endswith("login_sid.lua?version=2&sid=deadbeef")
+
+
+@pytest.mark.asyncio
+async def test_requests_push_back_keepalive_while_session_busy() -> None:
+    """A successful listing renews the SID; the keep-alive then skips its check."""
+    http = QueuedAiohttpSession([json_response(MOCK_DATA_LUA_JSON)])
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    fb.sid = "deadbeef"
+    fb._sid_validated_at = time.time() - SID_INACTIVITY_TIMEOUT
+    await fb.async_get_vpn_connections()
+    assert "no_sidrenew" not in http.requests[0][2]["data"]
+    assert fb._keepalive_delay() > SID_INACTIVITY_TIMEOUT / 2
+
+    sleep = AsyncMock(side_effect=[None, asyncio.CancelledError()])
+    with (
+        patch("fritzboxvpn.session.asyncio.sleep", new=sleep),
+        patch.object(fb, "_async_keepalive_once", new=AsyncMock()) as once,
+        pytest.raises(asyncio.CancelledError),
+    ):
+        await fb._async_keepalive_loop()
+    once.assert_not_called()
+    assert sleep.await_args_list[1].args[0] > 0
+
+
+@pytest.mark.asyncio
+async def test_keepalive_logs_in_again_when_sid_expired() -> None:
+    """An expired SID is replaced in the background, not by the next poll."""
+    http = QueuedAiohttpSession(
+        [
+            MockAiohttpResponse(200, text=_login_sid_xml("0000000000000000")),
+            *_login_sequence(),
+        ]
+    )
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    fb.sid = "stale"
+    assert await fb._async_keepalive_once() is True
+    assert fb.sid == "deadbeef"
+    assert fb.stats.sid_refresh_relogins == 1
+    assert fb.stats.logins == 1
+
+
+@pytest.mark.asyncio
+async def test_keepalive_failure_keeps_sid_and_close_cancels_task() -> None:
+    """Transient keep-alive errors keep the SID; async_close stops the task."""
+    http = QueuedAiohttpSession(
+        [
+            OSError(111, "refused"),
+            OSError(111, "refused"),
+            *_login_sequence(),
+        ]
+    )
+    fb = FritzBoxVPNSession(
+        http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD, keepalive=True
+    )
+    fb.sid = "deadbeef"
+    assert await fb._async_keepalive_once() is False
+    assert fb.sid == "deadbeef"
+    assert fb.stats.sid_refresh_failures == 1
+
+    fb.sid = None
+    await fb.async_get_session()
+    task = fb._keepalive_task
+    assert task is not None and not task.done()
+    await fb.async_close()
+    assert task.cancelled()
+    assert fb._keepalive_task is None
+
+
+@pytest.mark.asyncio
+async def test_keepalive_task_comes_from_injected_factory() -> None:
+    """The application's task factory starts the keep-alive; close cancels it."""
+    created: list[tuple[asyncio.Task[None], str]] = []
+
+    def create_task(coro, name: str) -> asyncio.Task[None]:
+        task = asyncio.create_task(coro)
+        created.append((task, name))
+        return task
+
+    fb = FritzBoxVPNSession(
+        QueuedAiohttpSession(_login_sequence()),
+        MOCK_HOST,
+        MOCK_USERNAME,
+        MOCK_PASSWORD,
+        keepalive=True,
+        create_task=create_task,
+    )
+    await fb.async_get_session()
+    assert len(created) == 1
+    task, name = created[0]
+    assert fb._keepalive_task is task
+    assert MOCK_HOST in name
+    await fb.async_close()
+    assert task.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_slow_data_lua_probe_lets_rest_win() -> None:
+    """A hanging data.lua probe is overtaken by REST after the stagger."""
+    hanging = HangingAiohttpResponse()
+    http = QueuedAiohttpSession(
+        [*_login_sequence(), hanging, json_response(MOCK_REST_VPN_JSON)]
+    )
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    with patch("fritzboxvpn.session.LISTING_PROBE_STAGGER", 0.01):
+        connections = await asyncio.wait_for(fb.async_get_vpn_connections(), 1)
+
+    assert "conn-abc" in connections
+    assert hanging.cancelled
+    assert fb.preferred_listing_mode == "rest"
+    assert set(fb.stats.listing_modes) == {"rest"}
+    assert fb.stats.listing_modes["rest"].size > 0
+
+
+@pytest.mark.asyncio
+async def test_rediscovery_probes_cheapest_known_mode_first() -> None:
+    """After invalidation the measured REST mode is probed before data.lua."""
+    http = QueuedAiohttpSession([*_login_sequence(), json_response(MOCK_REST_VPN_JSON)])
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    fb.stats.listing_modes["rest"] = ListingModeStats(latency=0.05, size=10, samples=1)
+    assert fb.preferred_listing_mode == "rest"
+
+    connections = await fb.async_get_vpn_connections()
+
+    assert "conn-abc" in connections
+    assert not any(url.endswith(API_DATA) for _, url, _ in http.requests)
+    assert fb.stats.listing_modes["rest"].samples == 2
+
+
+@pytest.mark.asyncio
+async def test_owned_client_session_reuses_connections_and_closes() -> None:
+    """create() pools keep-alive connections and closes its client on close."""
+
+    async def _login_page(_request: web.Request) -> web.Response:
+        return web.Response(text=LOGIN_XML_CHALLENGE)
+
+    app = web.Application()
+    app.router.add_get("/login_sid.lua", _login_page)
+    async with TestServer(app) as server:
+        fb = FritzBoxVPNSession.create(
+            f"{server.host}:{server.port}",
+            MOCK_USERNAME,
+            MOCK_PASSWORD,
+            protocol="http",
+        )
+        for _ in range(3):
+            assert await fb._fetch_login_page(fb._login_url(), None) == (
+                LOGIN_XML_CHALLENGE
+            )
+        assert fb.stats.connections_created == 1
+        assert fb.stats.connections_reused == 2
+        await fb.async_close()
+        assert fb.session.closed
+
+
+@pytest.mark.asyncio
+async def test_toggle_uses_cached_listing_and_polls_single_connection() -> None:
+    """A fresh listing serves the pre-check; verification GETs only one connection."""
+    http = QueuedAiohttpSession(
+        [
+            *_login_sequence(),
+            json_response(MOCK_DATA_LUA_JSON),
+            MockAiohttpResponse(200, text="ok"),
+            json_response({"UID": "conn-abc", "activated": "1"}),
+            json_response(MOCK_REST_CONNECTION_OFF),
+        ]
+    )
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    await fb.async_get_vpn_connections()
+    sleep = AsyncMock()
+    with patch("fritzboxvpn.session.asyncio.sleep", new=sleep):
+        assert await fb.async_toggle_vpn("conn-abc", False) is True
+
+    methods = [method for method, _, _ in http.requests[4:]]
+    assert methods == ["PUT", "GET", "GET"]
+    assert http.requests[-1][1].endswith("/api/v0/generic/vpn/connection/conn-abc")
+    delays = [call.args[0] for call in sleep.await_args_list]
+    assert delays == [0.25, 0.5]
+    assert fb._recent_listing()["conn-abc"]["active"] is False
+
+
+@pytest.mark.asyncio
+async def test_toggle_confirms_cached_target_state_with_the_box() -> None:
+    """A cached "on" is checked with one GET; the box says "off", so it PUTs."""
+    http = QueuedAiohttpSession(
+        [
+            *_login_sequence(),
+            json_response(MOCK_DATA_LUA_JSON),
+            json_response(MOCK_REST_CONNECTION_OFF),
+            MockAiohttpResponse(200, text="ok"),
+            json_response({"UID": "conn-abc", "activated": "1"}),
+        ]
+    )
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    await fb.async_get_vpn_connections()
+    with patch("fritzboxvpn.session.asyncio.sleep", new=AsyncMock()):
+        assert await fb.async_toggle_vpn("conn-abc", True) is True
+
+    assert [(method, kw.get("json")) for method, _, kw in http.requests[4:]] == [
+        ("GET", None),
+        ("PUT", {"activated": 1}),
+        ("GET", None),
+    ]
+    assert fb._recent_listing()["conn-abc"]["active"] is True
+
+
+@pytest.mark.asyncio
+async def test_toggle_skips_put_when_box_confirms_cached_state() -> None:
+    """When the box agrees with the cached target state, no PUT is sent."""
+    http = QueuedAiohttpSession(
+        [
+            *_login_sequence(),
+            json_response(MOCK_DATA_LUA_JSON),
+            json_response({"UID": "conn-abc", "activated": "1"}),
+        ]
+    )
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    await fb.async_get_vpn_connections()
+    assert await fb.async_toggle_vpn("conn-abc", True) is True
+    assert [method for method, _, _ in http.requests[4:]] == ["GET"]
+
+
+@pytest.mark.asyncio
+async def test_toggle_verification_falls_back_to_listing() -> None:
+    """Without a single-connection endpoint, the full listing verifies the toggle."""
+    http = QueuedAiohttpSession(
+        [
+            *_login_sequence(),
+            json_response(MOCK_DATA_LUA_JSON),
+            MockAiohttpResponse(200, text="ok"),
+            MockAiohttpResponse(404, text="not found"),
+            json_response(MOCK_DATA_VPN_OFF),
+        ]
+    )
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    with patch("fritzboxvpn.session.asyncio.sleep", new=AsyncMock()):
+        assert await fb.async_toggle_vpn("conn-abc", False) is True
+    assert http.requests[-1][1].endswith(API_DATA)
+
+
+def _data_lua_listing(abc_active: int, def_active: int) -> dict:
+    return {
+        "data": {
+            "init": {
+                "boxConnections": {
+                    "conn-abc": {"uid": "conn-abc", "name": "A", "active": abc_active},
+                    "conn-def": {"uid": "conn-def", "name": "D", "active": def_active},
+                }
+            }
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_set_vpn_states_batches_puts_and_verifies_once() -> None:
+    """Several switches share one listing, concurrent PUTs and one verification."""
+    http = QueuedAiohttpSession(
+        [
+            *_login_sequence(),
+            json_response(_data_lua_listing(1, 0)),
+            MockAiohttpResponse(200, text="ok"),
+            MockAiohttpResponse(200, text="ok"),
+            json_response(_data_lua_listing(0, 1)),
+        ]
+    )
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    with patch("fritzboxvpn.session.asyncio.sleep", new=AsyncMock()):
+        results = await fb.async_set_vpn_states(
+            {"conn-abc": False, "conn-def": True, "missing": True}
+        )
+
+    assert results == {"conn-abc": True, "conn-def": True, "missing": False}
+    puts = [(url, kw["json"]) for method, url, kw in http.requests if method == "PUT"]
+    assert sorted(puts) == [
+        (
+            f"https://{MOCK_HOST}/api/v0/generic/vpn/connection/conn-abc",
+            {"activated": 0},
+        ),
+        (
+            f"https://{MOCK_HOST}/api/v0/generic/vpn/connection/conn-def",
+            {"activated": 1},
+        ),
+    ]
+    assert len(http.requests) == 7
+
+
+@pytest.mark.asyncio
+async def test_set_vpn_states_retries_forbidden_puts_after_login() -> None:
+    """A 403 on a batched PUT re-logins once and repeats only that PUT."""
+    http = QueuedAiohttpSession(
+        [
+            *_login_sequence(),
+            json_response(_data_lua_listing(1, 1)),
+            MockAiohttpResponse(403, text="forbidden"),
+            *_login_sequence(),
+            MockAiohttpResponse(200, text="ok"),
+            json_response(_data_lua_listing(0, 1)),
+        ]
+    )
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    with patch("fritzboxvpn.session.asyncio.sleep", new=AsyncMock()):
+        results = await fb.async_set_vpn_states({"conn-abc": False, "conn-def": True})
+    assert results == {"conn-abc": True, "conn-def": True}
+    assert fb.stats.logins == 2
+
+
+@pytest.mark.asyncio
+async def test_set_vpn_states_transport_error_fails_only_its_connection() -> None:
+    """A PUT that never reaches the box does not fail the PUTs that did."""
+    http = QueuedAiohttpSession(
+        [
+            *_login_sequence(),
+            json_response(_data_lua_listing(1, 0)),
+            OSError("connection reset"),
+            MockAiohttpResponse(200, text="ok"),
+            json_response(_data_lua_listing(1, 1)),
+        ]
+    )
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    with patch("fritzboxvpn.session.asyncio.sleep", new=AsyncMock()):
+        results = await fb.async_set_vpn_states({"conn-abc": False, "conn-def": True})
+    assert results == {"conn-abc": False, "conn-def": True}
+    assert fb.stats.transient_errors == 1
+    assert fb.stats.logins == 1
+    assert len(http.requests) == 7
+
+
+@pytest.mark.asyncio
+async def test_identical_listing_body_returns_previous_result() -> None:
+    """A byte-identical body skips parsing and flags the listing unchanged."""
+    http = QueuedAiohttpSession(
+        [
+            *_login_sequence(),
+            json_response(_data_lua_listing(1, 0)),
+            json_response(_data_lua_listing(1, 0)),
+            json_response(_data_lua_listing(0, 0)),
+        ]
+    )
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+
+    first = await fb.async_get_vpn_connections()
+    assert fb.listing_unchanged is False
+    with patch("fritzboxvpn.session.parse_data_lua_listing") as parse:
+        second = await fb.async_get_vpn_connections()
+    parse.assert_not_called()
+    assert second is first
+    assert fb.listing_unchanged is True
+    assert fb.stats.listings_unchanged == 1
+
+    third = await fb.async_get_vpn_connections()
+    assert fb.listing_unchanged is False
+    assert third["conn-abc"]["active"] is False
+
+
+@pytest.mark.asyncio
+async def test_listing_decodes_raw_bytes_and_records_cost() -> None:
+    """Listings are decoded from bytes; decode time and size land in stats."""
+    listing = json_response(_data_lua_listing(1, 0))
+    http = QueuedAiohttpSession([*_login_sequence(), listing])
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+
+    connections = await fb.async_get_vpn_connections()
+
+    assert connections["conn-abc"]["active"] is True
+    body_size = len(await listing.read())
+    assert fb.stats.json_decodes == 1
+    assert fb.stats.json_decode_bytes == body_size
+    assert fb.stats.last_json_decode_bytes == body_size
+    assert fb.stats.last_json_decode_seconds >= 0
+    assert fb.stats.listing_modes["data_lua"].size == body_size
+
+
+@pytest.mark.asyncio
+async def test_stream_listing_scans_data_lua_in_chunks() -> None:
+    """stream_listing finds boxConnections in chunks; page noise is not a change."""
+
+    def page(token: str) -> dict:
+        listing = _data_lua_listing(1, 0)
+        listing["data"] = {
+            "menu": [{"token": token, "items": ["{", "]"]}],
+            **listing["data"],
+            "footer": {"token": token},
+        }
+        return listing
+
+    http = QueuedAiohttpSession(
+        [
+            *_login_sequence(),
+            json_response(page("first")),
+            json_response(page("second")),
+            MockAiohttpResponse(
+                200,
+                text='{"data": <html>',
+                headers={"Content-Type": "application/json"},
+            ),
+            *_login_sequence(),
+            json_response(_data_lua_listing(0, 0)),
+        ]
+    )
+    fb = FritzBoxVPNSession(
+        http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD, stream_listing=True
+    )
+
+    with patch("fritzboxvpn.session.LISTING_READ_CHUNK_SIZE", 5):
+        first = await fb.async_get_vpn_connections()
+        assert sorted(first) == ["conn-abc", "conn-def"]
+        assert first["conn-abc"]["active"] is True
+        assert await fb.async_get_vpn_connections() is first
+        assert fb.listing_unchanged is True
+
+        # Broken JSON counts as the HTML page of an expired SID: login again.
+        third = await fb.async_get_vpn_connections()
+    assert third["conn-abc"]["active"] is False
+    assert fb.stats.logins == 2
+
+
+def test_decode_json_body_with_and_without_orjson() -> None:
+    """orjson and the stdlib fallback agree; declared charsets are honoured."""
+    body = '{"name": "Büro", "active": 1, "peers": [true, null]}'.encode()
+    expected = {"name": "Büro", "active": 1, "peers": [True, None]}
+    assert decode_json_body(body) == expected
+    assert decode_json_body(b"\xef\xbb\xbf{}") == {}
+    with patch("fritzboxvpn.parsing.orjson", None):
+        assert decode_json_body(body) == expected
+
+    latin1 = '{"name": "Büro"}'.encode("latin-1")
+    assert decode_json_body(latin1, "ISO-8859-1") == {"name": "Büro"}
+    assert decode_json_body(b"{}", "no-such-charset") == {}
+    with pytest.raises(ValueError):
+        decode_json_body(b"<html></html>")
@@ -65,3 +65,26 @@ async def test_diagnostics_without_loaded_coordinator(
     mock_config_entry.add_to_hass(hass)
     result = await async_get_config_entry_diagnostics(hass, mock_config_entry)
     assert result["vpn_connection_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_includes_session_stats(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Web-API session counters are surfaced when the adapter exposes them."""
+    mock_config_entry.add_to_hass(hass)
+    stats = {"logins": 1, "logins_coalesced": 2}
+    mock_coordinator = type(
+        "C",
+        (),
+        {
+            "last_update_success": True,
+            "data": {},
+            "fritz_session": type("S", (), {"session_stats": stats})(),
+        },
+    )()
+    mock_config_entry.runtime_data = FritzboxVpnRuntimeData(
+        coordinator=mock_coordinator
+    )
+    result = await async_get_config_entry_diagnostics(hass, mock_config_entry)
+    assert result["session_stats"] == stats
@@ -43,6 +43,29 @@ async def test_switch_turn_on(
     coordinator.toggle_vpn.assert_awaited_once_with("conn-abc", True)
 
 
+@pytest.mark.asyncio
+async def test_switch_turn_on_is_optimistic_until_verified(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Switch reports the requested state while the toggle is verified."""
+    coordinator = _mock_coordinator()
+    entity = FritzBoxVPNSwitch(
+        coordinator, mock_config_entry, "conn-def", MOCK_VPN_CONNECTIONS["conn-def"]
+    )
+    seen: list[bool] = []
+
+    async def _toggle(uid: str, enable: bool) -> bool:
+        seen.append(entity.is_on)
+        return True
+
+    coordinator.toggle_vpn = AsyncMock(side_effect=_toggle)
+    assert entity.is_on is False
+    await entity.async_turn_on()
+    assert seen == [True]
+    assert entity.is_on is False
+    coordinator.async_request_refresh.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_switch_turn_on_failure(
     hass: HomeAssistant, mock_config_entry: MockConfigEntry
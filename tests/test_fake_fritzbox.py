@@ -0,0 +1,86 @@
+"""FritzBoxVPNSession against the local FakeFritzBox emulator (real HTTP)."""
+
+import pytest
+from fritzboxvpn import FritzBoxVPNSession
+from fritzboxvpn.const import LISTING_MODE_DATA_LUA, LISTING_MODE_REST
+from fritzboxvpn.testing import BOX_PATHS, LOGIN_MD5, FakeFritzBox
+
+# Keep emulated PBKDF2 logins cheap in tests.
+FAST_PBKDF2 = (10, 10)
+
+
+@pytest.mark.asyncio
+async def test_pbkdf2_login_listing_and_toggle_over_http() -> None:
+    """HTTPS is refused, HTTP wins; data.lua lists and REST toggles."""
+    async with FakeFritzBox(connections=3, pbkdf2_iterations=FAST_PBKDF2) as box:
+        fb = FritzBoxVPNSession.create(box.host, box.username, box.password)
+        connections = await fb.async_get_vpn_connections()
+        assert fb.protocol == "http"
+        assert fb.preferred_listing_mode == LISTING_MODE_DATA_LUA
+        assert sorted(connections) == sorted(box.connections)
+        assert connections["conn0-0000"]["active"] is True
+        assert box.requests["POST /data.lua"] == 1
+
+        assert await fb.async_toggle_vpn("conn0-0000", False) is True
+        assert box.connections["conn0-0000"].activated is False
+        assert box.requests["PUT /api/v0/generic/vpn/connection/conn0-0000"] == 1
+        assert box.logins == 1
+        await fb.async_close()
+
+
+@pytest.mark.asyncio
+async def test_md5_rest_only_box_relogs_after_sid_expiry() -> None:
+    """An MD5-only box without data.lua is listed via REST; expired SIDs re-login."""
+    async with FakeFritzBox(connections=2, login=LOGIN_MD5, data_lua=False) as box:
+        fb = FritzBoxVPNSession.create(
+            box.host, box.username, box.password, protocol="http"
+        )
+        await fb.async_get_vpn_connections()
+        assert fb.preferred_listing_mode == LISTING_MODE_REST
+
+        box.expire_sessions()
+        connections = await fb.async_get_vpn_connections()
+        assert connections["conn0-0001"]["active"] is False
+        assert box.logins == 2
+        assert box.failed_logins == 0
+        await fb.async_close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream_listing", [False, True])
+@pytest.mark.parametrize("path", BOX_PATHS)
+async def test_data_lua_layouts_are_parsed(path: str, stream_listing: bool) -> None:
+    """All four boxConnections layouts of data.lua are found, streamed or not."""
+    async with FakeFritzBox(
+        connections=2,
+        pbkdf2_iterations=FAST_PBKDF2,
+        box_connections_path=path,
+        page_padding=5,
+        rest=False,
+    ) as box:
+        fb = FritzBoxVPNSession.create(
+            box.host,
+            box.username,
+            box.password,
+            protocol="http",
+            stream_listing=stream_listing,
+        )
+        assert len(await fb.async_get_vpn_connections()) == 2
+        await fb.async_close()
+
+
+@pytest.mark.asyncio
+async def test_reboot_refuses_then_lists_empty_and_new_uids() -> None:
+    """A reboot drops SIDs; empty polls come first, then re-issued UIDs."""
+    async with FakeFritzBox(connections=2, pbkdf2_iterations=FAST_PBKDF2) as box:
+        fb = FritzBoxVPNSession.create(
+            box.host, box.username, box.password, protocol="http"
+        )
+        await fb.async_get_vpn_connections()
+
+        await box.reboot(empty_polls=1, new_uids=True)
+        assert await fb.async_get_vpn_connections() == {}
+        connections = await fb.async_get_vpn_connections()
+        assert sorted(connections) == ["conn1-0000", "conn1-0001"]
+        assert box.logins == 2
+        await fb.async_close()
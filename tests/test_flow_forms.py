@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 import voluptuous as vol
 from custom_components.fritzbox_vpn.const import (
+    CONF_PERSIST_SESSION,
     CONF_UPDATE_INTERVAL,
     ERROR_KEY_CANNOT_CONNECT,
     ERROR_KEY_INVALID_AUTH,
@@ -14,6 +15,7 @@ from custom_components.fritzbox_vpn.const import (
 from custom_components.fritzbox_vpn.flow_forms import (
     CannotConnect,
     InvalidAuth,
+    config_and_options_from_configure_input,
     configure_schema,
     configure_schema_for_resubmit,
     confirm_checkbox_schema,
@@ -93,6 +95,24 @@ def test_configure_schema_for_resubmit_preserves_update_interval() -> None:
     assert _schema_field_default(stale_schema, CONF_UPDATE_INTERVAL) == 30
 
 
+def test_configure_schema_persist_session_round_trip() -> None:
+    """persist_session defaults off and is carried into entry options."""
+    schema = configure_schema({CONF_HOST: MOCK_HOST, CONF_USERNAME: "u"}, {})
+    assert _schema_field_default(schema, CONF_PERSIST_SESSION) is False
+    enabled = configure_schema({}, {CONF_PERSIST_SESSION: True})
+    assert _schema_field_default(enabled, CONF_PERSIST_SESSION) is True
+
+    _, options = config_and_options_from_configure_input(
+        {
+            CONF_HOST: MOCK_HOST,
+            CONF_USERNAME: "u",
+            CONF_PASSWORD: "p",
+            CONF_PERSIST_SESSION: True,
+        }
+    )
+    assert options[CONF_PERSIST_SESSION] is True
+
+
 def test_confirm_schema_with_current_input() -> None:
     """Confirm schema with current_input merges password from existing config."""
     schema = confirm_schema(
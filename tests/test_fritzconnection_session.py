@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import sys
 import types
@@ -125,6 +126,8 @@ def test_ensure_client_falls_back_to_fritzboxvpn_without_warning(
         "u",
         "p",
         protocol="https",
+        keepalive=True,
+        create_task=hass.async_create_background_task,
     )
     expected = LOG_MSG_SESSION_MODE_FALLBACK % "192.168.20.1"
     assert expected in caplog.text
@@ -228,3 +231,86 @@ async def test_toggle_vpn_https_and_http_fail_raises_connection_error() -> None:
     assert session._toggle_vpn_sync.call_count == 2
     session._close_sync.assert_called_once()
     assert session._use_tls is True
+
+
+@pytest.mark.asyncio
+async def test_get_uptime_reads_device_info_and_swallows_errors() -> None:
+    """Uptime comes from TR-064 DeviceInfo; failures yield None, not errors."""
+    hass = MagicMock()
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda fn, *a: fn(*a))
+    session = FritzConnectionVPNSession(hass, "1.2.3.4", "u", "p")
+    session._fc = MagicMock()
+    session._fc.call_action.return_value = {"NewUpTime": "4711"}
+
+    assert await session.async_get_uptime() == 4711
+    session._fc.call_action.assert_called_once_with("DeviceInfo1", "GetInfo")
+
+    session._fc.call_action.side_effect = RequestsTimeout("slow")
+    assert await session.async_get_uptime() is None
+
+
+@pytest.mark.asyncio
+async def test_get_uptime_backs_off_after_client_construction_failure() -> None:
+    """A TR-064 client that cannot be built is not retried on every poll."""
+    hass = MagicMock()
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda fn, *a: fn(*a))
+    session = FritzConnectionVPNSession(hass, "1.2.3.4", "u", "p")
+    fake_fc_cls = MagicMock(side_effect=RequestsConnectionError("no TR-064"))
+    fc_mod = types.ModuleType("fritzconnection")
+    fc_mod.FritzConnection = fake_fc_cls
+
+    with patch.dict(sys.modules, {"fritzconnection": fc_mod}):
+        assert await session.async_get_uptime() is None
+        assert await session.async_get_uptime() is None
+    fake_fc_cls.assert_called_once_with(
+        address="1.2.3.4",
+        user="u",
+        password="p",
+        timeout=5.0,
+        use_tls=True,
+    )
+
+    session._uptime_retry_at = 0.0
+    session._fc = MagicMock()
+    session._fc.call_action.return_value = {"NewUpTime": "42"}
+    assert await session.async_get_uptime() == 42
+
+
+@pytest.mark.asyncio
+async def test_get_uptime_is_bounded_by_timeout() -> None:
+    """A hanging uptime read yields None after UPTIME_TIMEOUT."""
+    hass = MagicMock()
+
+    async def _hang(*_: object) -> None:
+        await asyncio.Event().wait()
+
+    hass.async_add_executor_job = AsyncMock(side_effect=_hang)
+    session = FritzConnectionVPNSession(hass, "1.2.3.4", "u", "p")
+
+    with patch(
+        "custom_components.fritzbox_vpn.fritzconnection_session.UPTIME_TIMEOUT",
+        0.01,
+    ):
+        assert await session.async_get_uptime() is None
+    assert session._uptime_retry_at > 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_listings_join_and_toggles_drop_shared_listing() -> None:
+    """Concurrent callers share one fetch; a toggle forces the next fetch."""
+    session = FritzConnectionVPNSession(MagicMock(), "1.2.3.4", "u", "p")
+    fetch = AsyncMock(return_value={"a": {}})
+    session._async_with_https_http_fallback = fetch
+
+    first, second = await asyncio.gather(
+        session.async_get_vpn_connections(requester="e1"),
+        session.async_get_vpn_connections(requester="e2"),
+    )
+    assert first is second
+    assert fetch.await_count == 1
+    assert await session.async_get_vpn_connections(max_age=60, requester="e2") is first
+    assert fetch.await_count == 1
+
+    await session.async_toggle_vpn("a", True)
+    await session.async_get_vpn_connections(max_age=60, requester="e2")
+    assert fetch.await_count == 3
@@ -0,0 +1,226 @@
+"""Differential tests: fast and streaming listing parsers versus extract + normalize."""
+
+import copy
+import json
+import logging
+import random
+from typing import Any
+
+import pytest
+from fritzboxvpn.const import API_PAGE_SHAREWIREGUARD
+from fritzboxvpn.parsing import (
+    extract_box_connections_from_data,
+    extract_wireguard_connections_from_rest,
+    normalize_box_connections,
+    parse_box_connections,
+    parse_data_lua_listing,
+    parse_rest_listing,
+)
+from fritzboxvpn.streaming import BoxConnectionsScanner
+
+_UIDS = ["a", " a ", "b", "", "   ", None, 7, "c\t", "dup", "dup "]
+_ACTIVE = [None, True, False, 0, 1, 2, "1", "0", " TRUE ", "on", "no", "", 1.0, []]
+_ACCESS_TYPES = ["4", " 4 ", 4, "1", None]
+_STATES = ["ready", " ready ", "notActive", None, 3]
+_SINCE = [None, "0", "1710000000", 0, 5, "x"]
+
+
+def _maybe(rng: random.Random, key: str, values: list[Any]) -> dict[str, Any]:
+    """``{key: value}`` or nothing, so missing keys are covered as well."""
+    return {key: rng.choice(values)} if rng.random() < 0.8 else {}
+
+
+def _box_entry(rng: random.Random) -> Any:
+    if rng.random() < 0.05:
+        return rng.choice(["not-a-dict", 3, None, ["x"]])
+    return {
+        **_maybe(rng, "uid", _UIDS),
+        "name": f"VPN {rng.randrange(100)}",
+        **_maybe(rng, "active", _ACTIVE),
+        **_maybe(rng, "activated", _ACTIVE),
+        **_maybe(rng, "connected", [0, 1, True, None]),
+    }
+
+
+def _data_lua_payload(rng: random.Random) -> dict[str, Any]:
+    count = rng.randrange(12)
+    if rng.random() < 0.5:
+        box: Any = [_box_entry(rng) for _ in range(count)]
+    else:
+        box = {
+            rng.choice(_UIDS[:5] + ["k1", "k2", "k3"]): _box_entry(rng)
+            for _ in range(count)
+        }
+    if rng.random() < 0.05:
+        box = rng.choice([None, "broken", 5])
+    page = API_PAGE_SHAREWIREGUARD
+    layout = rng.randrange(5)
+    if layout == 0:
+        inner: dict[str, Any] = {"init": {"boxConnections": box}}
+    elif layout == 1:
+        inner = {"init": {page: {"boxConnections": box}}}
+    elif layout == 2:
+        inner = {"boxConnections": box, "init": {"other": 1}}
+    elif layout == 3:
+        inner = {page: {"boxConnections": box}}
+    else:
+        inner = {"init": "unexpected"}
+    return {"pid": page, "data": inner}
+
+
+def _noise(rng: random.Random, depth: int = 0) -> Any:
+    """Page content that is not boxConnections, with brackets inside strings."""
+    kind = rng.randrange(6 if depth < 3 else 3)
+    if kind == 0:
+        return rng.choice(["{", "]", 'a"b', "\\", "ü", "", "x\n}"])
+    if kind == 1:
+        return rng.choice([0, -1.5e3, True, False, None])
+    if kind == 2:
+        return []
+    if kind == 3:
+        return [_noise(rng, depth + 1) for _ in range(rng.randrange(4))]
+    keys = ["boxConnections", "init", "data", "other", API_PAGE_SHAREWIREGUARD]
+    return {rng.choice(keys): _noise(rng, depth + 1) for _ in range(rng.randrange(4))}
+
+
+def _noisy_data_lua_body(rng: random.Random) -> bytes:
+    """Serialized data.lua payload with noise around and inside its objects."""
+    data = _data_lua_payload(rng)
+    for target in (data, data["data"], data["data"].get("init")):
+        if isinstance(target, dict):
+            for _ in range(rng.randrange(3)):
+                target[f"noise{rng.randrange(100)}"] = _noise(rng)
+    indent = rng.choice([None, 0, 2])
+    return json.dumps(data, indent=indent, ensure_ascii=rng.random() < 0.5).encode()
+
+
+def _scan(body: bytes, chunk_size: int) -> Any:
+    scanner = BoxConnectionsScanner(API_PAGE_SHAREWIREGUARD)
+    for start in range(0, len(body), chunk_size):
+        scanner.feed(body[start : start + chunk_size])
+    return scanner.finish()
+
+
+def _rest_payload(rng: random.Random) -> dict[str, Any]:
+    if rng.random() < 0.05:
+        return rng.choice([{}, {"connection": None}, {"connection": {"UID": "x"}}])
+    connections: list[Any] = []
+    for _ in range(rng.randrange(12)):
+        if rng.random() < 0.05:
+            connections.append("not-a-dict")
+            continue
+        connections.append(
+            {
+                **_maybe(rng, "UID", _UIDS),
+                **_maybe(rng, "uid", _UIDS),
+                "name": f"VPN {rng.randrange(100)}",
+                **_maybe(rng, "access_type", _ACCESS_TYPES),
+                **_maybe(rng, "active", _ACTIVE),
+                **_maybe(rng, "activated", _ACTIVE),
+                **_maybe(rng, "state", _STATES),
+                **_maybe(rng, "connected_since", _SINCE),
+            }
+        )
+    return {"connection": connections}
+
+
+def _reference_data_lua(data: dict[str, Any]) -> dict[str, Any] | None:
+    box = extract_box_connections_from_data(data, API_PAGE_SHAREWIREGUARD)
+    return None if box is None else normalize_box_connections(box)
+
+
+def _reference_rest(data: dict[str, Any]) -> dict[str, Any] | None:
+    box = extract_wireguard_connections_from_rest(data)
+    return None if box is None else normalize_box_connections(box)
+
+
+def _items(result: dict[str, Any] | None) -> Any:
+    """Result with key order, so ordering differences fail too."""
+    if result is None:
+        return None
+    return [(uid, list(entry.items())) for uid, entry in result.items()]
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_parse_data_lua_listing_matches_reference(seed: int) -> None:
+    """Same entries, values and key order as extract + normalize."""
+    rng = random.Random(seed)
+    for _ in range(25):
+        data = _data_lua_payload(rng)
+        expected = _reference_data_lua(copy.deepcopy(data))
+        assert _items(parse_data_lua_listing(data, API_PAGE_SHAREWIREGUARD)) == (
+            _items(expected)
+        )
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_parse_rest_listing_matches_reference(seed: int) -> None:
+    """Same entries, values and key order as extract + normalize; input untouched."""
+    rng = random.Random(seed)
+    for _ in range(25):
+        data = _rest_payload(rng)
+        original = copy.deepcopy(data)
+        assert _items(parse_rest_listing(data)) == _items(_reference_rest(data))
+        assert data == original
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_box_connections_scanner_matches_reference(seed: int) -> None:
+    """Chunked scanning finds the same boxConnections as decode + extract."""
+    rng = random.Random(seed)
+    for _ in range(25):
+        body = _noisy_data_lua_body(rng)
+        expected = _reference_data_lua(json.loads(body))
+        box = _scan(body, rng.choice([1, 2, 7, 64, len(body)]))
+        result = None if box is None else parse_box_connections(box)
+        assert _items(result) == _items(expected)
+
+
+@pytest.mark.parametrize(
+    ("body", "expected"),
+    [
+        (b'{"d\\u0061ta": {"init": {"boxConnections": [1]}}}', [1]),
+        (b'{"data": {"init": {"boxConnections": [1]}}, "data": {}}', None),
+        (b'{"data": {"boxConnections": [1], "init": {"boxConnections": null}}}', [1]),
+        (b'\xef\xbb\xbf{"data": {"boxConnections": 5}}', 5),
+        (b' [ {"data": {}} ] ', None),
+        (b'"data"', None),
+    ],
+)
+def test_box_connections_scanner_edge_cases(body: bytes, expected: Any) -> None:
+    """Escaped and repeated keys, null fallthrough, BOM, non-object documents."""
+    for chunk_size in (1, len(body)):
+        assert _scan(body, chunk_size) == expected
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"",
+        b"<html></html>",
+        b'{"data": {"init": {"boxConnections": [1',
+        b'{"a" 1}',
+        b'{"data": {"boxConnections": [1]}} trailing',
+        b'{"data": {}}{"data": {}}',
+    ],
+)
+def test_box_connections_scanner_rejects_broken_json(body: bytes) -> None:
+    """Empty, HTML, truncated, malformed and trailing-garbage bodies raise."""
+    for chunk_size in (1, 3, max(len(body), 1)):
+        with pytest.raises(ValueError):
+            _scan(body, chunk_size)
+
+
+def test_fast_parsers_skip_debug_summary_unless_enabled(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Structure summaries are only built and logged with DEBUG enabled."""
+    with caplog.at_level(logging.INFO, logger="fritzboxvpn.parsing"):
+        assert parse_data_lua_listing({"data": {}}, API_PAGE_SHAREWIREGUARD) is None
+        assert parse_rest_listing({}) is None
+    assert caplog.records == []
+
+    with caplog.at_level(logging.DEBUG, logger="fritzboxvpn.parsing"):
+        assert parse_data_lua_listing({"data": {}}, API_PAGE_SHAREWIREGUARD) is None
+        assert parse_rest_listing({}) is None
+    assert len(caplog.records) == 2
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from custom_components.fritzbox_vpn import _repair_entity_ids_before_platform_setup
@@ -532,6 +532,104 @@ async def test_recovery_accepts_empty_after_max_duration(
     assert not coordinator._in_recovery()
 
 
+@pytest.mark.asyncio
+async def test_recovery_skipped_when_uptime_shows_no_reboot(
+    hass: HomeAssistant,
+) -> None:
+    """A continuing box uptime marks the outage as a blip; no recovery window."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"host": MOCK_HOST, "username": "u", "password": "p"},
+    )
+    coordinator = _coordinator(hass, entry)
+    coordinator.fritz_session.async_get_uptime = AsyncMock(return_value=10_000)
+    coordinator.fritz_session.async_get_vpn_connections = AsyncMock(
+        return_value=dict(MOCK_VPN_CONNECTIONS)
+    )
+    coordinator.async_set_updated_data(await coordinator._async_update_data())
+
+    coordinator.fritz_session.async_get_vpn_connections = AsyncMock(
+        side_effect=ConnectionError("unreachable")
+    )
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+    assert coordinator._in_recovery()
+
+    coordinator.fritz_session.async_get_uptime = AsyncMock(return_value=10_090)
+    coordinator.fritz_session.async_get_vpn_connections = AsyncMock(
+        return_value=dict(MOCK_VPN_CONNECTIONS)
+    )
+    await coordinator._async_update_data()
+    assert not coordinator._in_recovery()
+    coordinator.fritz_session.invalidate_session.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_uptime_read_only_after_listing_succeeded(
+    hass: HomeAssistant,
+) -> None:
+    """A failed listing skips the uptime read; it never gates the poll."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"host": MOCK_HOST, "username": "u", "password": "p"},
+    )
+    coordinator = _coordinator(hass, entry)
+    coordinator.fritz_session.async_get_uptime = AsyncMock(return_value=10_000)
+    coordinator.fritz_session.async_get_vpn_connections = AsyncMock(
+        side_effect=ConnectionError("unreachable")
+    )
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+    coordinator.fritz_session.async_get_uptime.assert_not_awaited()
+
+    coordinator.fritz_session.async_get_vpn_connections = AsyncMock(
+        return_value=dict(MOCK_VPN_CONNECTIONS)
+    )
+    await coordinator._async_update_data()
+    coordinator.fritz_session.async_get_uptime.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_reboot_signal_remaps_immediately_and_keeps_session(
+    hass: HomeAssistant,
+) -> None:
+    """A reset uptime remaps UIDs on the first poll and skips the minimum window."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"host": MOCK_HOST, "username": "u", "password": "p"},
+    )
+    coordinator = _coordinator(hass, entry)
+    old = {"old-abc": {"uid": "old-abc", "name": "Office VPN", "active": True}}
+    new = {"new-abc": {"uid": "new-abc", "name": "Office VPN", "active": True}}
+    coordinator.fritz_session.async_get_uptime = AsyncMock(return_value=10_000)
+    coordinator.fritz_session.async_get_vpn_connections = AsyncMock(return_value=old)
+    coordinator.async_set_updated_data(await coordinator._async_update_data())
+
+    coordinator.fritz_session.async_get_vpn_connections = AsyncMock(
+        side_effect=ConnectionError("unreachable")
+    )
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+
+    coordinator.fritz_session.async_get_uptime = AsyncMock(return_value=40)
+    coordinator.fritz_session.async_get_vpn_connections = AsyncMock(return_value=new)
+    with patch(
+        "custom_components.fritzbox_vpn.coordinator.remap_connection_uids",
+        return_value={"old-abc": "new-abc"},
+    ) as remap:
+        await coordinator._async_update_data()
+    remap.assert_called_once_with(hass, entry.entry_id, {"old-abc": "new-abc"})
+    assert coordinator.resolve_connection_uid("old-abc") == "new-abc"
+    coordinator.fritz_session.invalidate_session.assert_not_called()
+
+    # Only the stable-poll gate remains; the 3x interval window is skipped.
+    assert coordinator._in_recovery()
+    coordinator.fritz_session.async_get_uptime = AsyncMock(return_value=45)
+    for _ in range(RECOVERY_STABLE_POLLS - 1):
+        await coordinator._async_update_data()
+    assert not coordinator._in_recovery()
+
+
 @pytest.mark.asyncio
 async def test_uid_remap_records_only_applied_pairs(
     hass: HomeAssistant,
@@ -1,21 +1,27 @@
 """Tests for integration services and setup side effects."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import voluptuous as vol
 from custom_components.fritzbox_vpn import (
     SERVICE_REGISTRATION_FLAG,
+    SERVICE_SCHEMA_SET_CONNECTIONS,
     _async_remove_unavailable_entities,
     _async_repair_entity_id_suffixes,
+    _async_set_connections,
     async_setup,
     async_setup_entry,
 )
 from custom_components.fritzbox_vpn.const import (
+    ATTR_TURN_OFF,
+    ATTR_TURN_ON,
     DOMAIN,
     SERVICE_REMOVE_UNAVAILABLE_ENTITIES,
     UNIQUE_ID_PREFIX,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import entity_registry as er
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
@@ -26,18 +32,30 @@ from tests.fixtures import MOCK_VPN_CONNECTIONS
 async def test_remove_unavailable_entities_service(
     hass: HomeAssistant, coordinator_with_data, mock_config_entry: MockConfigEntry
 ) -> None:
-    """Service removes orphaned entities and reloads entry."""
+    """Service removes orphaned entity objects in place without reloading."""
     registry = er.async_get(hass)
-    registry.async_get_or_create(
+    orphan = registry.async_get_or_create(
         "switch",
         DOMAIN,
         f"{UNIQUE_ID_PREFIX}orphan_switch",
         config_entry=mock_config_entry,
     )
+    entity = MagicMock(async_remove=AsyncMock())
+    platform = MagicMock(
+        config_entry=mock_config_entry, entities={orphan.entity_id: entity}
+    )
+    runtime = mock_config_entry.runtime_data
+    runtime.known_uids_switch.add("orphan")
 
-    with patch.object(
-        hass.config_entries, "async_reload", new=AsyncMock()
-    ) as reload_mock:
+    with (
+        patch(
+            "custom_components.fritzbox_vpn.entity_registry.async_get_platforms",
+            return_value=[platform],
+        ),
+        patch.object(
+            hass.config_entries, "async_reload", new=AsyncMock()
+        ) as reload_mock,
+    ):
         await _async_remove_unavailable_entities(
             hass,
             type(
@@ -45,11 +63,50 @@ async def test_remove_unavailable_entities_service(
             )(),
         )
 
-    reload_mock.assert_awaited_once()
+    entity.async_remove.assert_awaited_once_with(force_remove=True)
+    reload_mock.assert_not_awaited()
+    assert "orphan" not in runtime.known_uids_switch
     remaining = er.async_entries_for_config_entry(registry, mock_config_entry.entry_id)
     assert all("orphan" not in (e.unique_id or "") for e in remaining)
 
 
+@pytest.mark.asyncio
+async def test_remove_unavailable_entities_reloads_when_not_in_place(
+    hass: HomeAssistant, coordinator_with_data, mock_config_entry: MockConfigEntry
+) -> None:
+    """A failed in-place removal falls back to reloading the entry."""
+    registry = er.async_get(hass)
+    orphan = registry.async_get_or_create(
+        "switch",
+        DOMAIN,
+        f"{UNIQUE_ID_PREFIX}orphan_switch",
+        config_entry=mock_config_entry,
+    )
+    entity = MagicMock(async_remove=AsyncMock(side_effect=RuntimeError("boom")))
+    platform = MagicMock(
+        config_entry=mock_config_entry, entities={orphan.entity_id: entity}
+    )
+
+    with (
+        patch(
+            "custom_components.fritzbox_vpn.entity_registry.async_get_platforms",
+            return_value=[platform],
+        ),
+        patch.object(
+            hass.config_entries, "async_reload", new=AsyncMock()
+        ) as reload_mock,
+    ):
+        await _async_remove_unavailable_entities(
+            hass,
+            type(
+                "Call", (), {"data": {"config_entry_id": mock_config_entry.entry_id}}
+            )(),
+        )
+
+    reload_mock.assert_awaited_once_with(mock_config_entry.entry_id)
+    assert registry.async_get(orphan.entity_id) is None
+
+
 @pytest.mark.asyncio
 async def test_repair_entity_id_suffixes_service(
     hass: HomeAssistant, mock_config_entry: MockConfigEntry
@@ -97,3 +154,117 @@ async def test_services_registered_once(
 
     assert hass.services.has_service(DOMAIN, SERVICE_REMOVE_UNAVAILABLE_ENTITIES)
     assert hass.data[DOMAIN].get(SERVICE_REGISTRATION_FLAG)
+
+
+@pytest.mark.asyncio
+async def test_platform_setup_failure_releases_shared_session(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """A failed platform forward hands the shared session back, like a failed refresh."""
+    mock_config_entry.add_to_hass(hass)
+    mock_coordinator = AsyncMock()
+    mock_coordinator.data = MOCK_VPN_CONNECTIONS
+    mock_coordinator.async_config_entry_first_refresh = AsyncMock()
+    mock_coordinator.fritz_session = AsyncMock()
+
+    with (
+        patch(
+            "custom_components.fritzbox_vpn.FritzBoxVPNCoordinator",
+            return_value=mock_coordinator,
+        ),
+        patch.object(
+            hass.config_entries,
+            "async_forward_entry_setups",
+            new=AsyncMock(side_effect=RuntimeError("platform broke")),
+        ),
+        patch(
+            "custom_components.fritzbox_vpn.async_release_shared_session",
+            new=AsyncMock(),
+        ) as release,
+    ):
+        assert await async_setup_entry(hass, mock_config_entry) is False
+
+    release.assert_awaited_once_with(
+        hass, mock_coordinator.fritz_session, mock_config_entry.entry_id
+    )
+
+
+@pytest.mark.asyncio
+async def test_set_connections_service_batches_per_entry(
+    hass: HomeAssistant, coordinator_with_data, mock_config_entry: MockConfigEntry
+) -> None:
+    """set_connections sends one batch per entry and reports failed switches."""
+    registry = er.async_get(hass)
+    on = registry.async_get_or_create(
+        "switch",
+        DOMAIN,
+        f"{UNIQUE_ID_PREFIX}conn-abc_switch",
+        config_entry=mock_config_entry,
+    )
+    off = registry.async_get_or_create(
+        "switch",
+        DOMAIN,
+        f"{UNIQUE_ID_PREFIX}conn-def_switch",
+        config_entry=mock_config_entry,
+    )
+    call = type(
+        "Call",
+        (),
+        {"data": {ATTR_TURN_ON: [on.entity_id], ATTR_TURN_OFF: [off.entity_id]}},
+    )()
+
+    with (
+        patch.object(
+            coordinator_with_data,
+            "set_vpn_states",
+            new=AsyncMock(return_value={"conn-abc": True, "conn-def": False}),
+        ) as set_mock,
+        patch.object(coordinator_with_data, "async_request_refresh", new=AsyncMock()),
+        pytest.raises(HomeAssistantError) as err,
+    ):
+        await _async_set_connections(hass, call)
+
+    set_mock.assert_awaited_once_with({"conn-abc": True, "conn-def": False})
+    assert err.value.translation_placeholders == {"entities": off.entity_id}
+
+
+@pytest.mark.asyncio
+async def test_set_connections_service_rejects_foreign_entities(
+    hass: HomeAssistant, coordinator_with_data
+) -> None:
+    """Entities that are not fritzbox_vpn switches are rejected up front."""
+    call = type(
+        "Call", (), {"data": {ATTR_TURN_ON: ["switch.other"], ATTR_TURN_OFF: []}}
+    )()
+    with pytest.raises(ServiceValidationError):
+        await _async_set_connections(hass, call)
+
+
+def test_set_connections_schema_requires_turn_on_or_turn_off() -> None:
+    """Missing keys are rejected; the schema no longer fills in defaults."""
+    with pytest.raises(vol.Invalid):
+        SERVICE_SCHEMA_SET_CONNECTIONS({})
+    assert SERVICE_SCHEMA_SET_CONNECTIONS({ATTR_TURN_ON: "switch.vpn"}) == {
+        ATTR_TURN_ON: ["switch.vpn"]
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("data", "translation_key"),
+    [
+        ({ATTR_TURN_ON: []}, "set_connections_no_entities"),
+        (
+            {ATTR_TURN_ON: ["switch.vpn"], ATTR_TURN_OFF: ["switch.vpn"]},
+            "set_connections_conflicting_entity",
+        ),
+    ],
+)
+async def test_set_connections_service_rejects_empty_and_conflicting_calls(
+    hass: HomeAssistant, data: dict, translation_key: str
+) -> None:
+    """Nothing to switch, or one entity both on and off, fails validation."""
+    call = type("Call", (), {"data": data})()
+    with pytest.raises(ServiceValidationError) as err:
+        await _async_set_connections(hass, call)
+    assert err.value.translation_key == translation_key
@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from aiohttp import ClientConnectorError
+from aiohttp import ClientConnectorError, ClientTimeout
 from custom_components.fritzbox_vpn.const import RETRY_AFTER_SECONDS
 from custom_components.fritzbox_vpn.coordinator import FritzBoxVPNCoordinator
-from fritzboxvpn import FritzBoxVPNSession
+from fritzboxvpn import (
+    FritzBoxTransportError,
+    FritzBoxVPNSession,
+    is_transport_error,
+)
+from fritzboxvpn.const import ERROR_MSG_VPN_PAYLOAD_MISSING, PROTOCOL_REPROBE_INTERVAL
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from tests.aiohttp_mock import MockAiohttpResponse, QueuedAiohttpSession, json_response
+from tests.aiohttp_mock import (
+    HangingAiohttpResponse,
+    MockAiohttpResponse,
+    QueuedAiohttpSession,
+    json_response,
+)
 from tests.fixtures import (
     LOGIN_XML_CHALLENGE,
     LOGIN_XML_SID,
@@ -226,11 +238,85 @@ async def test_coordinator_client_connector_error_uses_short_retry(
     coordinator.fritz_session.invalidate_session = MagicMock()
     with pytest.raises(UpdateFailed) as exc_info:
         await coordinator._async_update_data()
-    assert exc_info.value.retry_after == RETRY_AFTER_SECONDS
-    assert RETRY_AFTER_SECONDS <= 60
+    # Jittered below the nominal delay so entries do not retry in lockstep.
+    assert exc_info.value.retry_after >= 0.8 * RETRY_AFTER_SECONDS
+    assert exc_info.value.retry_after <= RETRY_AFTER_SECONDS <= 60
     coordinator.fritz_session.invalidate_session.assert_called_once()
 
 
+def _transport_error(cause: BaseException) -> FritzBoxTransportError:
+    """ConnectionError as the session raises it for a failed request."""
+    err = FritzBoxTransportError(f"Cannot connect to {MOCK_HOST}: {cause}")
+    err.__cause__ = cause
+    return err
+
+
+@pytest.mark.asyncio
+async def test_coordinator_wrapped_timeout_keeps_session(hass) -> None:
+    """A timeout the session wrapped in a ConnectionError keeps SID and protocol."""
+    coordinator = FritzBoxVPNCoordinator(
+        hass,
+        {"host": MOCK_HOST, "username": "u", "password": "p"},
+        None,
+        "entry-1",
+    )
+    coordinator.fritz_session.async_get_vpn_connections = AsyncMock(
+        side_effect=_transport_error(TimeoutError("read timeout"))
+    )
+    coordinator.fritz_session.invalidate_session = MagicMock()
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+    coordinator.fritz_session.invalidate_session.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_wrapped_refusal_resets_session(hass) -> None:
+    """A refused connection behind the ConnectionError is treated as a reboot."""
+    coordinator = FritzBoxVPNCoordinator(
+        hass,
+        {"host": MOCK_HOST, "username": "u", "password": "p"},
+        None,
+        "entry-1",
+    )
+    coordinator.fritz_session.async_get_vpn_connections = AsyncMock(
+        side_effect=_transport_error(_connector_error())
+    )
+    coordinator.fritz_session.invalidate_session = MagicMock()
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+    coordinator.fritz_session.invalidate_session.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (_transport_error(TimeoutError()), True),
+        (_transport_error(OSError(104, "Connection reset by peer")), True),
+        (_connector_error(), True),
+        (TimeoutError(), True),
+        (ConnectionError("Failed to get login page: 403"), False),
+        (ConnectionError("Login failed: 500"), False),
+        (ConnectionError(ERROR_MSG_VPN_PAYLOAD_MISSING), False),
+        (ValueError("Invalid SID"), False),
+    ],
+)
+def test_is_transport_error_ignores_status_and_payload_errors(
+    error: Exception, expected: bool
+) -> None:
+    """Only failures to reach the box count; answers with a bad status do not."""
+    assert is_transport_error(error) is expected
+
+
+@pytest.mark.asyncio
+async def test_login_page_status_is_not_a_transport_error() -> None:
+    """An HTTPS 403 on the login page surfaces as a non-transport error."""
+    http = QueuedAiohttpSession([MockAiohttpResponse(403, text="forbidden")])
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    with pytest.raises(ConnectionError) as err:
+        await fb.async_get_session()
+    assert not is_transport_error(err.value)
+
+
 @pytest.mark.asyncio
 async def test_md5_login_post_uses_http_after_https_get_fallback() -> None:
     """After HTTPS GET fails and HTTP login-page succeeds, MD5 POST must use HTTP."""
@@ -293,3 +379,168 @@ async def test_pbkdf2_login_post_connector_error_raises_connection_error() -> No
         await fb.async_get_session()
     assert fb.sid is None
     assert fb.protocol == "https"
+
+
+@pytest.mark.asyncio
+async def test_http_wins_race_when_https_hangs_and_is_remembered() -> None:
+    """A hanging HTTPS port costs only the stagger, and HTTP sticks across invalidate."""
+    hanging = HangingAiohttpResponse()
+    http = QueuedAiohttpSession(
+        [hanging, MockAiohttpResponse(200, text=LOGIN_XML_CHALLENGE)]
+    )
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    with patch("fritzboxvpn.session.PROTOCOL_RACE_STAGGER", 0.01):
+        content = await asyncio.wait_for(
+            fb._fetch_login_page(fb._login_url(), ClientTimeout(total=10)), 1
+        )
+    assert content == LOGIN_XML_CHALLENGE
+    assert [url.split(":")[0] for _, url, _ in http.requests] == ["https", "http"]
+    assert hanging.cancelled
+    assert fb.protocol == "http"
+    assert fb.stats.protocol_http_wins == 1
+
+    fb.invalidate_session()
+    assert fb.protocol == "http"
+
+
+@pytest.mark.asyncio
+async def test_https_auth_status_does_not_hand_race_to_http() -> None:
+    """HTTPS 403 is an answer from a working server, not a reason to use HTTP."""
+    http = QueuedAiohttpSession(
+        [
+            MockAiohttpResponse(403, text="forbidden"),
+            MockAiohttpResponse(200, text=LOGIN_XML_CHALLENGE),
+        ]
+    )
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    with pytest.raises(ConnectionError, match="Failed to get login page: 403"):
+        await fb._fetch_login_page(fb._login_url(), ClientTimeout(total=10))
+    assert [url.split(":")[0] for _, url, _ in http.requests] == ["https"]
+    assert fb.protocol == "https"
+    assert fb.stats.protocol_http_wins == 0
+
+
+@pytest.mark.asyncio
+async def test_stale_http_race_result_is_reprobed() -> None:
+    """After PROTOCOL_REPROBE_INTERVAL, HTTPS is tried again and wins when fast."""
+    http = QueuedAiohttpSession([MockAiohttpResponse(200, text=LOGIN_XML_CHALLENGE)])
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    fb.protocol = "http"
+    fb._protocol_probed_at = time.monotonic() - PROTOCOL_REPROBE_INTERVAL
+    await fb._fetch_login_page(fb._login_url(), ClientTimeout(total=10))
+    assert http.requests[0][1].startswith("https://")
+    assert fb.protocol == "https"
+    assert fb.stats.protocol_races == 1
+
+
+@pytest.mark.asyncio
+async def test_coordinator_breaker_fails_fast_then_probes(hass) -> None:
+    """An open breaker skips the box; when due, a HEAD probe gates the poll."""
+    coordinator = FritzBoxVPNCoordinator(
+        hass,
+        {"host": MOCK_HOST, "username": "u", "password": "p"},
+        None,
+        "entry-1",
+    )
+    session = coordinator.fritz_session
+    session.async_get_vpn_connections = AsyncMock(
+        side_effect=_transport_error(_connector_error())
+    )
+    session.async_probe_reachable = AsyncMock(return_value=False)
+    for _ in range(2):
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+    assert coordinator.breaker.state == "open"
+
+    with pytest.raises(UpdateFailed, match="next attempt"):
+        await coordinator._async_update_data()
+    assert session.async_get_vpn_connections.await_count == 2
+
+    with (
+        patch("fritzboxvpn.breaker.time.monotonic", return_value=10**9),
+        pytest.raises(UpdateFailed, match="still unreachable"),
+    ):
+        await coordinator._async_update_data()
+    assert session.async_get_vpn_connections.await_count == 2
+
+    session.async_probe_reachable.return_value = True
+    session.async_get_vpn_connections = AsyncMock(return_value={})
+    with patch("fritzboxvpn.breaker.time.monotonic", return_value=2 * 10**9):
+        await coordinator._async_update_data()
+    assert coordinator.breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error",
+    [
+        ConnectionError("Failed to get VPN connections: HTTP 503"),
+        ConnectionError(ERROR_MSG_VPN_PAYLOAD_MISSING),
+    ],
+)
+async def test_coordinator_status_errors_do_not_open_breaker(
+    hass, error: Exception
+) -> None:
+    """A box that answers with 5xx or without a payload is up; no breaker."""
+    coordinator = FritzBoxVPNCoordinator(
+        hass,
+        {"host": MOCK_HOST, "username": "u", "password": "p"},
+        None,
+        "entry-1",
+    )
+    session = coordinator.fritz_session
+    session.async_get_vpn_connections = AsyncMock(side_effect=error)
+    session.async_probe_reachable = AsyncMock(return_value=False)
+    for _ in range(coordinator.breaker.failure_threshold + 1):
+        with pytest.raises(UpdateFailed) as exc_info:
+            await coordinator._async_update_data()
+        assert exc_info.value.retry_after == RETRY_AFTER_SECONDS
+    assert coordinator.breaker.state == "closed"
+    assert coordinator.breaker.failures == 0
+    session.async_probe_reachable.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_timeout_keeps_session(hass) -> None:
+    """A transient timeout keeps SID, protocol and listing mode."""
+    coordinator = FritzBoxVPNCoordinator(
+        hass,
+        {"host": MOCK_HOST, "username": "u", "password": "p"},
+        None,
+        "entry-1",
+    )
+    coordinator.fritz_session.async_get_vpn_connections = AsyncMock(
+        side_effect=TimeoutError("read timeout")
+    )
+    coordinator.fritz_session.invalidate_session = MagicMock()
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+    coordinator.fritz_session.invalidate_session.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_listing_timeout_keeps_sid_refused_resets_it() -> None:
+    """Timeouts keep the cached session; a refused port is treated as a reboot."""
+    http = QueuedAiohttpSession(
+        [
+            *_login_sequence(),
+            json_response(MOCK_DATA_LUA_JSON),
+            TimeoutError(),
+            json_response(MOCK_DATA_LUA_JSON),
+            OSError(111, "Connection refused"),
+        ]
+    )
+    fb = FritzBoxVPNSession(http, MOCK_HOST, MOCK_USERNAME, MOCK_PASSWORD)
+    await fb.async_get_vpn_connections()
+    sid, mode = fb.sid, fb._listing_mode
+
+    with pytest.raises(ConnectionError):
+        await fb.async_get_vpn_connections()
+    assert (fb.sid, fb._listing_mode) == (sid, mode)
+    assert fb.stats.transient_errors == 1
+
+    # Same SID, no login: the next poll goes straight to the listing.
+    assert await fb.async_get_vpn_connections()
+    with pytest.raises(ConnectionError):
+        await fb.async_get_vpn_connections()
+    assert fb.sid is None
@@ -0,0 +1,61 @@
+"""Tests for the host-keyed session registry shared by config entries."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+from custom_components.fritzbox_vpn.coordinator import FritzBoxVPNCoordinator
+from custom_components.fritzbox_vpn.shared_session import (
+    acquire_shared_session,
+    async_release_shared_session,
+    shared_session_users,
+)
+from homeassistant.core import HomeAssistant
+
+from tests.fixtures import MOCK_HOST, MOCK_PASSWORD, MOCK_USERNAME, MOCK_VPN_CONNECTIONS
+
+CONFIG = {"host": MOCK_HOST, "username": MOCK_USERNAME, "password": MOCK_PASSWORD}
+
+
+@pytest.mark.asyncio
+async def test_entries_for_same_box_share_session_until_last_release(
+    hass: HomeAssistant,
+) -> None:
+    """Same host and credentials share one session; the last release closes it."""
+    first = acquire_shared_session(hass, CONFIG, "entry-1")
+    second = acquire_shared_session(hass, {**CONFIG, "host": MOCK_HOST.upper()}, "e2")
+    other_user = acquire_shared_session(hass, {**CONFIG, "username": "x"}, "e3")
+    assert first is second
+    assert other_user is not first
+    assert shared_session_users(hass, first) == 2
+
+    first.async_close = AsyncMock()
+    await async_release_shared_session(hass, first, "entry-1")
+    first.async_close.assert_not_awaited()
+    await async_release_shared_session(hass, first, "e2")
+    first.async_close.assert_awaited_once()
+    assert shared_session_users(hass, first) == 0
+
+
+@pytest.mark.asyncio
+async def test_second_entry_reuses_listing_fetched_by_first(
+    hass: HomeAssistant,
+) -> None:
+    """One box poll feeds both coordinators within an update interval."""
+    first = FritzBoxVPNCoordinator(hass, CONFIG, None, "entry-1")
+    second = FritzBoxVPNCoordinator(hass, CONFIG, None, "entry-2")
+    session = first.fritz_session
+    assert second.fritz_session is session
+    session._async_with_https_http_fallback = AsyncMock(
+        return_value=MOCK_VPN_CONNECTIONS
+    )
+    session.async_get_uptime = AsyncMock(return_value=None)
+
+    assert await first._async_update_data() == MOCK_VPN_CONNECTIONS
+    assert await second._async_update_data() == MOCK_VPN_CONNECTIONS
+    session._async_with_https_http_fallback.assert_awaited_once()
+
+    # The entry that fetched never gets its own listing back as "fresh".
+    await first._async_update_data()
+    assert session._async_with_https_http_fallback.await_count == 2